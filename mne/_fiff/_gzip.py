@@ -0,0 +1,205 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+# Gzip files written in independently compressed blocks ("members"), similar to
+# the BGZF format. The result is a standard multi-member gzip file that any gzip
+# reader can decompress, but each member also stores its compressed and
+# uncompressed sizes in an extra header field, so that readers can build an index
+# of the members and seek by decompressing only the blocks that are touched.
+
+import os
+import struct
+import zlib
+from functools import lru_cache
+from io import SEEK_CUR, SEEK_END, SEEK_SET
+
+import numpy as np
+
+# Uncompressed size of each block. FIF data buffers are typically larger than
+# this, so scanning the tag headers when opening a file only needs a fraction of
+# the blocks to be decompressed.
+_BLOCK_SIZE = 65536
+# ID1, ID2, CM (deflate), FLG (FEXTRA), MTIME, XFL, OS (unknown), XLEN
+_HEADER = struct.Struct("<BBBBIBBH")
+# SI1, SI2, LEN, member size, uncompressed size
+_EXTRA = struct.Struct("<ccHII")
+_HEADER_SIZE = _HEADER.size + _EXTRA.size
+_TRAILER = struct.Struct("<II")  # CRC32, ISIZE
+
+
+def _is_block_gzip(fname):
+    """Check if a file was written in indexed gzip blocks."""
+    with open(fname, "rb") as fid:
+        return _parse_header(fid.read(_HEADER_SIZE)) is not None
+
+
+def _parse_header(header):
+    if len(header) != _HEADER_SIZE:
+        return None
+    id1, id2, cm, flg, _, _, _, xlen = _HEADER.unpack_from(header)
+    if (id1, id2, cm, flg, xlen) != (0x1F, 0x8B, 8, 4, _EXTRA.size):
+        return None
+    si1, si2, length, member_size, isize = _EXTRA.unpack_from(header, _HEADER.size)
+    if (si1, si2, length) != (b"M", b"N", 8):
+        return None
+    return member_size, isize
+
+
+@lru_cache(maxsize=100)
+def _block_gzip_index(fname, size, mtime_ns):
+    """Get the compressed and uncompressed offsets of all blocks."""
+    # size and mtime_ns are only used to invalidate the cache
+    comp_offsets, offsets = [0], [0]
+    with open(fname, "rb") as fid:
+        while comp_offsets[-1] < size:
+            fid.seek(comp_offsets[-1])
+            sizes = _parse_header(fid.read(_HEADER_SIZE))
+            if sizes is None:
+                raise OSError(
+                    f"Corrupted gzip block at byte {comp_offsets[-1]} in {fname}"
+                )
+            comp_offsets.append(comp_offsets[-1] + sizes[0])
+            offsets.append(offsets[-1] + sizes[1])
+    if comp_offsets[-1] != size:
+        raise OSError(f"Truncated gzip block at the end of {fname}")
+    return np.array(comp_offsets, np.int64), np.array(offsets, np.int64)
+
+
+class _BlockGzipReader:
+    """Read a block gzip file, decompressing only the blocks that are used."""
+
+    def __init__(self, fname):
+        self.name = str(fname)
+        stat = os.stat(fname)
+        self._comp_offsets, self._offsets = _block_gzip_index(
+            self.name, stat.st_size, stat.st_mtime_ns
+        )
+        self._size = int(self._offsets[-1])
+        self._fid = open(fname, "rb")
+        self._pos = 0
+        self._block_idx = -1
+        self._block = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._fid.closed
+
+    def close(self):
+        self._fid.close()
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_SET:
+            pos = offset
+        elif whence == SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if pos < 0:
+            raise OSError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def _load_block(self, block_idx):
+        if block_idx != self._block_idx:
+            start, stop = self._comp_offsets[block_idx : block_idx + 2]
+            self._fid.seek(start)
+            member = self._fid.read(stop - start)
+            block = zlib.decompress(member[_HEADER_SIZE:], wbits=-15)
+            crc, isize = _TRAILER.unpack_from(member, len(member) - _TRAILER.size)
+            if len(block) != isize or zlib.crc32(block) != crc:
+                raise OSError(
+                    f"CRC check failed for gzip block at byte {start} in {self.name}"
+                )
+            self._block_idx, self._block = block_idx, block
+        return self._block
+
+    def read(self, size=-1):
+        stop = self._size if size is None or size < 0 else self._pos + size
+        stop = min(stop, self._size)
+        if stop <= self._pos:
+            return b""
+        block_idx = np.searchsorted(self._offsets, self._pos, side="right") - 1
+        chunks = list()
+        while self._pos < stop:
+            block = self._load_block(block_idx)
+            offset = self._offsets[block_idx]
+            chunk = block[self._pos - offset : stop - offset]
+            chunks.append(chunk)
+            self._pos += len(chunk)
+            block_idx += 1
+        return b"".join(chunks) if len(chunks) > 1 else chunks[0]
+
+
+class _BlockGzipWriter:
+    """Write a gzip file in independently compressed, indexed blocks."""
+
+    def __init__(self, fname, compresslevel):
+        self.name = str(fname)
+        self._fid = open(fname, "wb")
+        self._compresslevel = compresslevel
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._fid.closed
+
+    def tell(self):
+        return self._pos
+
+    def write(self, data):
+        data = memoryview(data).cast("B")
+        self._pos += len(data)
+        self._buffer += data
+        n_full = len(self._buffer) // _BLOCK_SIZE * _BLOCK_SIZE
+        with memoryview(self._buffer) as buffer:
+            for start in range(0, n_full, _BLOCK_SIZE):
+                self._write_block(buffer[start : start + _BLOCK_SIZE])
+        del self._buffer[:n_full]
+        return len(data)
+
+    def flush(self):
+        self._fid.flush()
+
+    def _write_block(self, block):
+        compressor = zlib.compressobj(self._compresslevel, zlib.DEFLATED, -15)
+        data = compressor.compress(block) + compressor.flush()
+        member_size = _HEADER_SIZE + len(data) + _TRAILER.size
+        self._fid.write(_HEADER.pack(0x1F, 0x8B, 8, 4, 0, 0, 255, _EXTRA.size))
+        self._fid.write(_EXTRA.pack(b"M", b"N", 8, member_size, len(block)))
+        self._fid.write(data)
+        self._fid.write(_TRAILER.pack(zlib.crc32(block), len(block)))
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if len(self._buffer):
+                self._write_block(self._buffer)
+                self._buffer = bytearray()
+        finally:
+            self._fid.close()
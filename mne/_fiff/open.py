@@ -10,6 +10,7 @@ import numpy as np
 from scipy.sparse import issparse
 
 from ..utils import _check_fname, _file_like, _validate_type, logger, verbose, warn
+from ._gzip import _BlockGzipReader, _is_block_gzip
 from .constants import FIFF
 from .tag import Tag, _call_dict_names, _matrix_info, _read_tag_header, read_tag
 from .tree import dir_tree_find, make_dir_tree
@@ -46,8 +47,12 @@ def _fiff_get_fid(fname):
     else:
         _validate_type(fname, Path, "fname", extra="or file-like")
         if fname.suffixes[-1] == ".gz":
-            logger.debug("Using gzip I/O")
-            fid = GzipFile(fname, "rb")  # Open in binary mode
+            if _is_block_gzip(fname):
+                logger.debug("Using block gzip I/O")
+                fid = _BlockGzipReader(fname)
+            else:
+                logger.debug("Using gzip I/O")
+                fid = GzipFile(fname, "rb")  # Open in binary mode
         else:
             logger.debug("Using normal I/O")
             fid = open(fname, "rb")  # Open in binary mode
@@ -12,6 +12,7 @@ from ..defaults import _BORDER_DEFAULT, _EXTRAPOLATE_DEFAULT, _INTERPOLATION_DEF
 from ..fixes import _safe_svd
 from ..utils import (
     _check_option,
+    _check_preload,
     _validate_type,
     fill_doc,
     logger,
@@ -328,6 +329,9 @@ class ProjMixin:
             )
             return self
 
+        if isinstance(self, BaseRaw) and self._ica_op is not None:
+            _check_preload(self, "applying projectors after calling ICA.apply()")
+
         _projector, info = setup_proj(
             deepcopy(self.info), add_eeg_ref=False, activate=True
         )
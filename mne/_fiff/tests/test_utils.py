@@ -4,7 +4,13 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
-from mne._fiff.utils import _check_orig_units
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from mne._fiff.utils import _check_orig_units, _read_segments_file
 
 
 def test_check_orig_units():
@@ -16,3 +22,42 @@ def test_check_orig_units():
     assert orig_units["Pz"] == "µV"
     assert orig_units["greekMu"] == "µV"
     assert orig_units["microSign"] == "µV"
+
+
+@pytest.mark.parametrize(
+    "idx", [slice(None), slice(1, 3), [4, 0], [2, 2, 1], [3], np.arange(5)]
+)
+@pytest.mark.parametrize("trigger", [False, True])
+def test_read_segments_file(tmp_path, idx, trigger):
+    """Test reading channel subsets of multiplexed binary files."""
+    n_channels, n_times, offset = 4, 50, 3
+    want = np.arange(n_channels * n_times, dtype="<i2").reshape(n_times, -1).T
+    fname = tmp_path / "test.dat"
+    with open(fname, "wb") as fid:
+        fid.write(b"\x00" * offset)
+        want.T.tofile(fid)
+    trigger_ch = None
+    if trigger:
+        trigger_ch = np.arange(n_times) % 3
+        want = np.vstack([want, trigger_ch])
+    elif not isinstance(idx, slice):
+        idx = np.array(idx)[np.array(idx) < n_channels]
+    raw = SimpleNamespace(filenames=[fname], _raw_extras=[dict(orig_nchan=4)])
+    want = want[idx]
+    cals = np.arange(1.0, len(want) + 1)[:, np.newaxis]
+    start, stop = 7, 41
+    data = np.zeros((len(want), stop - start))
+    _read_segments_file(
+        raw,
+        data,
+        idx,
+        0,
+        start,
+        stop,
+        cals,
+        None,
+        "<i2",
+        offset=offset,
+        trigger_ch=trigger_ch,
+    )
+    assert_array_equal(data, want[:, start:stop] * cals)
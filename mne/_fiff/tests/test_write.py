@@ -4,10 +4,18 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import gzip
+
+import numpy as np
 import pytest
+from numpy.testing import assert_array_equal
 
+from mne import create_info
+from mne._fiff._gzip import _BLOCK_SIZE, _BlockGzipReader
 from mne._fiff.constants import FIFF
+from mne._fiff.open import _fiff_get_fid
 from mne._fiff.write import start_file, write_int
+from mne.io import RawArray, read_raw_fif
 
 
 def test_write_int(tmp_path):
@@ -19,3 +27,43 @@ def test_write_int(tmp_path):
             write_int(fid, FIFF.FIFF_MNE_EVENT_LIST, [2147483648])  # 2 ** 31
         with pytest.raises(TypeError, match="Cannot safely write"):
             write_int(fid, FIFF.FIFF_MNE_EVENT_LIST, [0.0])  # float
+
+
+def test_block_gzip(tmp_path):
+    """Test reading and writing FIF files compressed in gzip blocks."""
+    rng = np.random.default_rng(0)
+    info = create_info(4, 1000.0, "eeg")
+    raw = RawArray(rng.standard_normal((4, 50000)) * 1e-6, info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw.save(fname.with_suffix(".fif.gz"))
+    want = fname.read_bytes()
+    assert len(want) > 10 * _BLOCK_SIZE
+    # readable by any gzip reader
+    with gzip.open(fname.with_suffix(".fif.gz")) as fid:
+        assert fid.read() == want
+    # random access
+    with _fiff_get_fid(fname.with_suffix(".fif.gz")) as fid:
+        assert isinstance(fid, _BlockGzipReader)
+        for start in rng.integers(0, len(want), 20):
+            fid.seek(start)
+            assert (
+                fid.read(3 * _BLOCK_SIZE // 2)
+                == want[start : start + 3 * _BLOCK_SIZE // 2]
+            )
+            assert fid.tell() == min(start + 3 * _BLOCK_SIZE // 2, len(want))
+        fid.seek(-10, 2)
+        assert fid.read() == want[-10:]
+        assert fid.read(10) == b""
+    raw_read = read_raw_fif(fname.with_suffix(".fif.gz"))
+    assert_array_equal(
+        raw_read.get_data(start=30000, stop=30500),
+        read_raw_fif(fname).get_data(start=30000, stop=30500),
+    )
+    # files written in a single gzip stream can still be read
+    fname_legacy = tmp_path / "legacy_raw.fif.gz"
+    with gzip.open(fname_legacy, "wb") as fid:
+        fid.write(want)
+    with _fiff_get_fid(fname_legacy) as fid:
+        assert not isinstance(fid, _BlockGzipReader)
+    assert_array_equal(read_raw_fif(fname_legacy).get_data(), raw_read.get_data())
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import numpy as np
 
+from ..utils import get_config
 from .constants import FIFF
 from .meas_info import _get_valid_units
 
@@ -221,6 +222,20 @@ def _read_segments_file(
     data_offset = n_channels * start * n_bytes + offset
     data_left = (stop - start) * n_channels
 
+    # Only the channels that are actually needed get converted, idx is
+    # remapped to index into them (the trigger channel is appended last)
+    n_all = n_channels + (trigger_ch is not None)
+    ch_idx = np.arange(n_all)[idx]
+    picks = np.unique(ch_idx)
+    if len(picks) < n_all:
+        idx = np.searchsorted(picks, ch_idx)
+    if np.array_equal(idx, np.arange(len(picks))):
+        idx = slice(None)
+    read_picks = picks[picks < n_channels]
+    if len(read_picks) == n_channels:
+        read_picks = slice(None)
+    read_trigger = trigger_ch is not None and len(picks) and picks[-1] == n_channels
+
     # Read up to 100 MB of data at a time, block_size is in data samples
     block_size = ((int(100e6) // n_bytes) // n_channels) * n_channels
     block_size = min(data_left, block_size)
@@ -235,10 +250,10 @@ def _read_segments_file(
                     f"Incorrect number of samples ({block.size} != {count}), please "
                     "report this error to MNE-Python developers"
                 )
-            block = block.reshape(n_channels, -1, order="F")
+            block = block.reshape(-1, n_channels)[:, read_picks].T
             n_samples = block.shape[1]  # = count // n_channels
             sample_stop = sample_start + n_samples
-            if trigger_ch is not None:
+            if read_trigger:
                 stim_ch = trigger_ch[start:stop][sample_start:sample_stop]
                 block = np.vstack((block, stim_ch))
             data_view = data[:, sample_start:sample_stop]
@@ -329,3 +344,18 @@ def _make_split_fnames(fname, n_splits, split_naming):
             path = Path(_construct_bids_filename(base, ext, i))
             res.append(path)
     return res
+
+
+def _get_io_n_threads():
+    """Get the number of threads to use for concurrent file I/O."""
+    n_threads = get_config("MNE_IO_N_THREADS", "1")
+    try:
+        n_threads = int(n_threads)
+        ok = n_threads >= 1
+    except ValueError:
+        ok = False
+    if not ok:
+        raise ValueError(
+            f"MNE_IO_N_THREADS must be a positive integer, got {n_threads!r}"
+        )
+    return n_threads
@@ -8,13 +8,13 @@ import re
 import time
 import uuid
 from contextlib import contextmanager
-from gzip import GzipFile
 
 import numpy as np
 from scipy.sparse import csc_array, csr_array
 
 from ..utils import _check_fname, _file_like, _validate_type, logger
 from ..utils.numerics import _date_to_julian
+from ._gzip import _BlockGzipWriter
 from .constants import FIFF
 
 # We choose a "magic" date to store (because meas_date is obligatory)
@@ -297,10 +297,11 @@ def start_file(fname, id_=None, *, overwrite=True):
         fname = _check_fname(fname, overwrite=overwrite)
         fname = str(fname)
         if op.splitext(fname)[1].lower() == ".gz":
-            logger.debug("Writing using gzip")
-            # defaults to compression level 9, which is barely smaller but much
-            # slower. 2 offers a good compromise.
-            fid = GzipFile(fname, "wb", compresslevel=2)
+            logger.debug("Writing using block gzip")
+            # gzip defaults to compression level 9, which is barely smaller but
+            # much slower. 2 offers a good compromise. Independently compressed
+            # blocks allow reading only the parts of the file that are needed.
+            fid = _BlockGzipWriter(fname, compresslevel=2)
         else:
             logger.debug("Writing using normal I/O")
             fid = open(fname, "wb")
@@ -5,7 +5,7 @@
 import json
 import re
 import warnings
-from collections import Counter, OrderedDict
+from collections import OrderedDict
 from collections.abc import Iterable
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -80,18 +80,19 @@ def _check_o_d_s_c(onset, duration, description, ch_names):
         raise ValueError(
             f"Description must be a one dimensional array, got {description.ndim}."
         )
-    _safe_name_list(description, "write", "description")
+    _safe_name_list(np.unique(description), "write", "description")
 
     # ch_names: convert to ndarray of tuples
     _validate_type(ch_names, (None, tuple, list, np.ndarray), "ch_names")
     if ch_names is None:
         ch_names = [()] * len(onset)
-    ch_names = list(ch_names)
-    for ai, ch in enumerate(ch_names):
-        _validate_type(ch, (list, tuple, np.ndarray), f"ch_names[{ai}]")
-        ch_names[ai] = tuple(ch)
-        for ci, name in enumerate(ch_names[ai]):
-            _validate_type(name, str, f"ch_names[{ai}][{ci}]")
+    else:
+        ch_names = list(ch_names)
+        for ai, ch in enumerate(ch_names):
+            _validate_type(ch, (list, tuple, np.ndarray), f"ch_names[{ai}]")
+            ch_names[ai] = tuple(ch)
+            for ci, name in enumerate(ch_names[ai]):
+                _validate_type(name, str, f"ch_names[{ai}][{ci}]")
     ch_names = _ndarray_ch_names(ch_names)
 
     if not (len(onset) == len(duration) == len(description) == len(ch_names)):
@@ -103,6 +104,12 @@ def _check_o_d_s_c(onset, duration, description, ch_names):
     return onset, duration, description, ch_names
 
 
+def _unique_descriptions(description):
+    """Get the unique descriptions and the code of each annotation."""
+    # string operations can then be done once per unique description
+    return np.unique(description, return_inverse=True)
+
+
 def _ndarray_ch_names(ch_names):
     # np.array(..., dtype=object) if all entries are empty will give
     # an empty array of shape (n_entries, 0) which is not helpful. So let's
@@ -300,8 +307,7 @@ class Annotations:
 
     def __repr__(self):
         """Show the representation."""
-        counter = Counter(self.description)
-        kinds = ", ".join(["{} ({})".format(*k) for k in sorted(counter.items())])
+        kinds = ", ".join(f"{desc} ({count})" for desc, count in self.count().items())
         kinds = (": " if len(kinds) > 0 else "") + kinds
         ch_specific = ", channel-specific" if self._any_ch_names() else ""
         s = (
@@ -559,15 +565,40 @@ class Annotations:
 
     def _sort(self):
         """Sort in place."""
-        # instead of argsort here we use sorted so that it gives us
-        # the onset-then-duration hierarchy
-        vals = sorted(zip(self.onset, self.duration, range(len(self))))
-        order = list(list(zip(*vals))[-1]) if len(vals) else []
+        # a stable lexsort gives us the onset-then-duration hierarchy
+        order = np.lexsort((self.duration, self.onset))
         self.onset = self.onset[order]
         self.duration = self.duration[order]
         self.description = self.description[order]
         self.ch_names = self.ch_names[order]
 
+    def _interval_index(self):
+        """Index the annotations for fast overlap queries.
+
+        The index holds the running maximum of the annotation ends and the
+        reversed running minimum of the onsets. It is not stored, as the arrays
+        can be modified in place; callers that make many queries should compute
+        it once and pass it to :meth:`_overlap_ranges`.
+        """
+        max_ends = np.maximum.accumulate(self.onset + np.nan_to_num(self.duration))
+        min_onsets = np.minimum.accumulate(self.onset[::-1])[::-1]
+        return max_ends, min_onsets
+
+    def _overlap_ranges(self, tmin, tmax, tol=1e-6, *, index=None):
+        """Get the range of annotations that can overlap each [tmin, tmax].
+
+        Annotations outside of ``[lo, hi)`` end before ``tmin - tol`` or start
+        after ``tmax + tol``. The ones inside still need to be checked, but
+        they are typically few (the onsets are sorted), which makes overlap
+        queries O(log n + k) once the index is computed.
+        """
+        if index is None:
+            index = self._interval_index()
+        max_ends, min_onsets = index
+        lo = np.searchsorted(max_ends, np.subtract(tmin, tol), "left")
+        hi = np.searchsorted(min_onsets, np.add(tmax, tol), "right")
+        return lo, np.maximum(lo, hi)
+
     @verbose
     def crop(
         self, tmin=None, tmax=None, emit_warning=False, use_orig_time=True, verbose=None
@@ -620,9 +651,26 @@ class Annotations:
         logger.debug(f"Cropping annotations {absolute_tmin} - {absolute_tmax}")
 
         onsets, durations, descriptions, ch_names = [], [], [], []
-        out_of_bounds, clip_left_elem, clip_right_elem = [], [], []
+        clip_left_elem, clip_right_elem = [], []
+        # only the annotations that (nearly) overlap the range need to be checked,
+        # allowing for the microsecond resolution of the datetimes
+        lo, hi = self._overlap_ranges(
+            (absolute_tmin - offset).total_seconds(),
+            (absolute_tmax - offset).total_seconds(),
+            tol=1e-5,
+        )
+        omitted = len(self) - (hi - lo)
+        if omitted:
+            logger.debug(f"  Dropping {omitted} annotation(s) outside of the range")
+        sl = slice(lo, hi)
         for idx, (onset, duration, description, ch) in enumerate(
-            zip(self.onset, self.duration, self.description, self.ch_names)
+            zip(
+                self.onset[sl],
+                self.duration[sl],
+                self.description[sl],
+                self.ch_names[sl],
+            ),
+            lo,
         ):
             # if duration is NaN behave like a zero
             if np.isnan(duration):
@@ -630,12 +678,8 @@ class Annotations:
             # convert to absolute times
             absolute_onset = timedelta(seconds=onset) + offset
             absolute_offset = absolute_onset + timedelta(seconds=duration)
-            out_of_bounds.append(
-                absolute_onset > absolute_tmax or absolute_offset < absolute_tmin
-            )
-            if out_of_bounds[-1]:
-                clip_left_elem.append(False)
-                clip_right_elem.append(False)
+            if absolute_onset > absolute_tmax or absolute_offset < absolute_tmin:
+                omitted += 1
                 logger.debug(
                     f"  [{idx}] Dropping "
                     f"({absolute_onset} - {absolute_offset}: {description})"
@@ -668,10 +712,11 @@ class Annotations:
         self.ch_names = _ndarray_ch_names(ch_names)
 
         if emit_warning:
-            omitted = np.array(out_of_bounds).sum()
             if omitted > 0:
                 warn(f"Omitted {omitted} annotation(s) that were outside data range.")
-            limited = (np.array(clip_left_elem) | np.array(clip_right_elem)).sum()
+            limited = (
+                np.array(clip_left_elem, bool) | np.array(clip_right_elem, bool)
+            ).sum()
             if limited > 0:
                 warn(
                     f"Limited {limited} annotation(s) that were expanding outside the"
@@ -707,13 +752,12 @@ class Annotations:
         if isinstance(mapping, dict):
             _check_dict_keys(
                 mapping,
-                self.description,
+                np.unique(self.description),
                 valid_key_source="data",
                 key_description="Annotation description(s)",
             )
             for stim in mapping:
-                map_idx = [desc == stim for desc in self.description]
-                self.duration[map_idx] = mapping[stim]
+                self.duration[self.description == stim] = mapping[stim]
 
         elif _is_numeric(mapping):
             self.duration = np.ones(self.description.shape) * mapping
@@ -748,13 +792,15 @@ class Annotations:
         .. versionadded:: 0.24.0
         """
         _validate_type(mapping, dict)
+        descriptions, codes = _unique_descriptions(self.description)
         _check_dict_keys(
             mapping,
-            self.description,
+            descriptions,
             valid_key_source="data",
             key_description="Annotation description(s)",
         )
-        self.description = np.array([str(mapping.get(d, d)) for d in self.description])
+        descriptions = np.array([str(mapping.get(d, d)) for d in descriptions])
+        self.description = descriptions[codes]
         return self
 
 
@@ -849,52 +895,50 @@ class EpochAnnotationsMixin:
             np.atleast_2d(epoch_tzeros) + np.atleast_2d(self.times[[0, -1]]).T
         )
         # ... because first_samp isn't accounted for here either
-        annot_starts = self._annotations.onset
-        annot_stops = annot_starts + self._annotations.duration
+        annot = self._annotations
+        # only check the annotations that can overlap each epoch
+        lo, hi = annot._overlap_ranges(epoch_starts, epoch_stops)
+        n_check = hi - lo
+        epo_ix = np.repeat(np.arange(len(epoch_starts)), n_check)
+        annot_ix = np.arange(n_check.sum()) + np.repeat(
+            lo - np.cumsum(n_check) + n_check, n_check
+        )
+        annot_starts = annot.onset[annot_ix]
+        annot_stops = annot_starts + annot.duration[annot_ix]
+        epoch_starts, epoch_stops = epoch_starts[epo_ix], epoch_stops[epo_ix]
 
         # the first two cases (annot_straddles_epoch_{start|end}) will both
         # (redundantly) capture cases where an annotation fully encompasses
         # an epoch (e.g., annot from 1-4s, epoch from 2-3s). The redundancy
-        # doesn't matter because results are summed and then cast to bool (all
-        # we care about is presence/absence of overlap).
-        annot_straddles_epoch_start = np.logical_and(
-            np.atleast_2d(epoch_starts) >= np.atleast_2d(annot_starts).T,
-            np.atleast_2d(epoch_starts) < np.atleast_2d(annot_stops).T,
+        # doesn't matter because all we care about is presence/absence of overlap.
+        annot_straddles_epoch_start = (epoch_starts >= annot_starts) & (
+            epoch_starts < annot_stops
         )
-
-        annot_straddles_epoch_end = np.logical_and(
-            np.atleast_2d(epoch_stops) > np.atleast_2d(annot_starts).T,
-            np.atleast_2d(epoch_stops) <= np.atleast_2d(annot_stops).T,
+        annot_straddles_epoch_end = (epoch_stops > annot_starts) & (
+            epoch_stops <= annot_stops
         )
-
         # this captures the only remaining case we care about: annotations
         # fully contained within an epoch (or exactly coextensive with it).
-        annot_fully_within_epoch = np.logical_and(
-            np.atleast_2d(epoch_starts) <= np.atleast_2d(annot_starts).T,
-            np.atleast_2d(epoch_stops) >= np.atleast_2d(annot_stops).T,
+        annot_fully_within_epoch = (epoch_starts <= annot_starts) & (
+            epoch_stops >= annot_stops
         )
-
-        # combine all cases to get array of shape (n_annotations, n_epochs).
-        # Nonzero entries indicate overlap between the corresponding
-        # annotation (row index) and epoch (column index).
-        all_cases = (
+        overlaps = (
             annot_straddles_epoch_start
-            + annot_straddles_epoch_end
-            + annot_fully_within_epoch
+            | annot_straddles_epoch_end
+            | annot_fully_within_epoch
         )
 
-        # for each Epoch-Annotation overlap occurrence:
-        for annot_ix, epo_ix in zip(*np.nonzero(all_cases)):
-            this_annot = self._annotations[annot_ix]
-            this_tzero = epoch_tzeros[epo_ix]
+        # for each Epoch-Annotation overlap occurrence (sorted by epoch, then
+        # annotation):
+        for annot_ix, epo_ix in zip(annot_ix[overlaps], epo_ix[overlaps]):
             # adjust annotation onset to be relative to epoch tzero...
-            annot = (
-                this_annot["onset"] - this_tzero,
-                this_annot["duration"],
-                this_annot["description"],
+            this_annot = (
+                annot.onset[annot_ix] - epoch_tzeros[epo_ix],
+                annot.duration[annot_ix],
+                annot.description[annot_ix],
             )
             # ...then add it to the correct sublist of `epoch_annot_list`
-            epoch_annot_list[epo_ix].append(annot)
+            epoch_annot_list[epo_ix].append(this_annot)
         return epoch_annot_list
 
     def add_annotations_to_metadata(self, overwrite=False):
@@ -1052,11 +1096,12 @@ def _annotations_starts_stops(raw, kinds, name="skip_by_annotation", invert=Fals
     if len(raw.annotations) == 0:
         onsets, ends = np.array([], int), np.array([], int)
     else:
-        idxs = [
-            idx
-            for idx, desc in enumerate(raw.annotations.description)
-            if any(desc.upper().startswith(kind.upper()) for kind in kinds)
+        descriptions, codes = _unique_descriptions(raw.annotations.description)
+        use = [
+            any(desc.upper().startswith(kind.upper()) for kind in kinds)
+            for desc in descriptions
         ]
+        idxs = np.nonzero(np.array(use, bool)[codes])[0]
         # onsets are already sorted
         onsets = raw.annotations.onset[idxs]
         onsets = _sync_onset(raw, onsets)
@@ -1413,12 +1458,10 @@ def _select_annotations_based_on_description(descriptions, event_id, regexp):
 
     event_id_ = dict()
     dropped = []
-    # Iterate over the sorted descriptions so that the Counter mapping
+    # Iterate over the sorted unique descriptions so that the Counter mapping
     # is slightly less arbitrary
-    for desc in sorted(descriptions):
-        if desc in event_id_:
-            continue
-
+    unique_descriptions, codes = _unique_descriptions(descriptions)
+    for desc in unique_descriptions:
         if regexp_comp.match(desc) is None:
             continue
 
@@ -1434,7 +1477,8 @@ def _select_annotations_based_on_description(descriptions, event_id, regexp):
             else:
                 dropped.append(desc)
 
-    event_sel = [ii for ii, kk in enumerate(descriptions) if kk in event_id_]
+    keep = np.array([desc in event_id_ for desc in unique_descriptions], bool)
+    event_sel = np.nonzero(keep[codes])[0]
 
     if len(event_sel) == 0 and regexp is not None:
         raise ValueError("Could not find any of the events you specified.")
@@ -1610,24 +1654,31 @@ def events_from_annotations(
         values = [event_id_[kk] for kk in annotations.description[event_sel]]
         inds = inds[event_sel]
     else:
-        inds = values = np.array([]).astype(int)
-        for annot in annotations[event_sel]:
-            annot_offset = annot["onset"] + annot["duration"]
-            _onsets = np.arange(annot["onset"], annot_offset, chunk_duration)
+        all_onsets, all_values = [np.array([])], [np.array([], int)]
+        for onset, duration, description in zip(
+            annotations.onset[event_sel],
+            annotations.duration[event_sel],
+            annotations.description[event_sel],
+        ):
+            annot_offset = onset + duration
+            _onsets = np.arange(onset, annot_offset, chunk_duration)
             good_events = annot_offset - _onsets >= chunk_duration - tol
             if good_events.any():
-                _onsets = _onsets[good_events]
-                _inds = raw.time_as_index(
-                    _onsets, use_rounding=use_rounding, origin=annotations.orig_time
-                )
-                _inds += raw.first_samp
-                inds = np.append(inds, _inds)
-                _values = np.full(
-                    shape=len(_inds),
-                    fill_value=event_id_[annot["description"]],
-                    dtype=int,
+                all_onsets.append(_onsets[good_events])
+                all_values.append(
+                    np.full(
+                        shape=good_events.sum(),
+                        fill_value=event_id_[description],
+                        dtype=int,
+                    )
                 )
-                values = np.append(values, _values)
+        inds = raw.time_as_index(
+            np.concatenate(all_onsets),
+            use_rounding=use_rounding,
+            origin=annotations.orig_time,
+        )
+        inds += raw.first_samp
+        values = np.concatenate(all_values)
 
     events = np.c_[inds, np.zeros(len(inds)), values].astype(int)
 
@@ -16,6 +16,7 @@ from functools import partial
 from pathlib import Path
 
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 from scipy.optimize import fmin_cobyla
 
 from ._fiff._digitization import _dig_kind_dict, _dig_kind_ints, _dig_kind_rev
@@ -34,6 +35,7 @@ from ._fiff.write import (
     write_string,
 )
 from .fixes import _compare_version, _safe_svd
+from .parallel import parallel_func
 from .surface import (
     _complete_sphere_surf,
     _compute_nearest,
@@ -117,34 +119,48 @@ class ConductorModel(dict):
         return None if len(self["layers"]) == 0 else self["layers"][-1]["rad"]
 
 
-def _calc_beta(rk, rk_norm, rk1, rk1_norm):
+def _calc_beta(rk, rk_norm, rk1, rk1_norm, rkk1):
     """Compute coefficients for calculating the magic vector omega."""
-    rkk1 = rk1[0] - rk[0]
-    size = np.linalg.norm(rkk1)
-    rkk1 /= size
-    num = rk_norm + np.dot(rk, rkk1)
-    den = rk1_norm + np.dot(rk1, rkk1)
+    size = np.sqrt(np.matmul(rkk1[..., np.newaxis, :], rkk1[..., np.newaxis]))[..., 0]
+    rkk1 = rkk1 / size
+    num = rk_norm + np.matmul(rk, rkk1[..., np.newaxis])[..., 0]
+    den = rk1_norm + np.matmul(rk1, rkk1[..., np.newaxis])[..., 0]
     res = np.log(num / den) / size
     return res
 
 
-def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
-    """Compute the linear potential matrix element computations."""
-    omega = np.zeros((len(fros), 3))
+def _sum3(x):
+    """Sum over the last axis of length 3 in a fixed order."""
+    return x[..., 0] + x[..., 1] + x[..., 2]
 
+
+def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area, fro_0=None):
+    """Compute the linear potential matrix element computations.
+
+    The triangle parameters can have a leading dimension to compute the
+    elements for a batch of triangles at once. The triangle edges are computed
+    relative to ``fro_0`` (default: the first field point), pass the same point
+    for all blocks of field points to get identical results.
+    """
+    fro_0 = fros[0] if fro_0 is None else fro_0
+    edge_rr = tri_rr - fro_0
+    edges = [edge_rr[..., (k + 1) % 3, :] - edge_rr[..., k, :] for k in range(3)]
     # we replicate a little bit of the _get_solids code here for speed
-    # (we need some of the intermediate values later)
-    v1 = tri_rr[np.newaxis, 0, :] - fros
-    v2 = tri_rr[np.newaxis, 1, :] - fros
-    v3 = tri_rr[np.newaxis, 2, :] - fros
+    # (we need some of the intermediate values later). The differences are
+    # stored with the coordinate axis first, which makes the component-wise
+    # operations below (much) faster.
+    tri_rr = tri_rr[..., np.newaxis]
+    v1 = (tri_rr[..., 0, :, :] - fros.T).swapaxes(-1, -2)
+    v2 = (tri_rr[..., 1, :, :] - fros.T).swapaxes(-1, -2)
+    v3 = (tri_rr[..., 2, :, :] - fros.T).swapaxes(-1, -2)
     triples = _fast_cross_nd_sum(v1, v2, v3)
-    l1 = np.linalg.norm(v1, axis=1)
-    l2 = np.linalg.norm(v2, axis=1)
-    l3 = np.linalg.norm(v3, axis=1)
+    l1 = np.sqrt(_sum3(v1 * v1))
+    l2 = np.sqrt(_sum3(v2 * v2))
+    l3 = np.sqrt(_sum3(v3 * v3))
     ss = l1 * l2 * l3
-    ss += np.einsum("ij,ij,i->i", v1, v2, l3)
-    ss += np.einsum("ij,ij,i->i", v1, v3, l2)
-    ss += np.einsum("ij,ij,i->i", v2, v3, l1)
+    ss += _sum3(v1 * v2 * l3[..., np.newaxis])
+    ss += _sum3(v1 * v3 * l2[..., np.newaxis])
+    ss += _sum3(v2 * v3 * l1[..., np.newaxis])
     solids = np.arctan2(triples, ss)
 
     # We *could* subselect the good points from v1, v2, v3, triples, solids,
@@ -159,25 +175,27 @@ def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
 
     # Calculate the magic vector vec_omega
     beta = [
-        _calc_beta(v1, l1, v2, l2)[:, np.newaxis],
-        _calc_beta(v2, l2, v3, l3)[:, np.newaxis],
-        _calc_beta(v3, l3, v1, l1)[:, np.newaxis],
+        _calc_beta(v1, l1, v2, l2, edges[0])[..., np.newaxis],
+        _calc_beta(v2, l2, v3, l3, edges[1])[..., np.newaxis],
+        _calc_beta(v3, l3, v1, l1, edges[2])[..., np.newaxis],
     ]
     vec_omega = (beta[2] - beta[0]) * v1
     vec_omega += (beta[0] - beta[1]) * v2
     vec_omega += (beta[1] - beta[2]) * v3
 
-    area2 = 2.0 * tri_area
+    area2 = 2.0 * np.asarray(tri_area)[..., np.newaxis]
     n2 = 1.0 / (area2 * area2)
+    tri_nn = tri_nn[..., np.newaxis, :]
     # leave omega = 0 otherwise
     # Put it all together...
+    omega = np.zeros(v1.shape)
     yys = [v1, v2, v3]
     idx = [0, 1, 2, 0, 2]
     for k in range(3):
         diff = yys[idx[k - 1]] - yys[idx[k + 1]]
         zdots = _fast_cross_nd_sum(yys[idx[k + 1]], yys[idx[k - 1]], tri_nn)
-        omega[:, k] = -n2 * (
-            area2 * zdots * 2.0 * solids - triples * (diff * vec_omega).sum(axis=-1)
+        omega[..., k] = -n2 * (
+            area2 * zdots * 2.0 * solids - triples * _sum3(diff * vec_omega)
         )
     # omit the bad points from the solution
     omega[bad_mask] = 0.0
@@ -208,59 +226,130 @@ def _correct_auto_elements(surf, mat):
     return
 
 
-def _fwd_bem_lin_pot_coeff(surfs):
+def _fwd_bem_lin_pot_coeff(surfs, n_jobs=None):
     """Calculate the coefficients for linear collocation approach."""
     # taken from fwd_bem_linear_collocation.c
     nps = [surf["np"] for surf in surfs]
     np_tot = sum(nps)
     coeff = np.zeros((np_tot, np_tot))
     offsets = np.cumsum(np.concatenate(([0], nps)))
-    for si_1, surf1 in enumerate(surfs):
-        rr_ord = np.arange(nps[si_1])
-        for si_2, surf2 in enumerate(surfs):
-            logger.info(
-                f"        {_bem_surf_name[surf1['id']]} ({nps[si_1]:d}) -> "
-                f"{_bem_surf_name[surf2['id']]} ({nps[si_2]}) ..."
+    pairs = [(si_1, si_2) for si_1 in range(len(surfs)) for si_2 in range(len(surfs))]
+    parallel, p_fun, n_jobs = parallel_func(_fwd_bem_lin_pot_coeff_block, n_jobs)
+    # split the field points of each surface pair so that all jobs get work
+    n_split = -(-n_jobs // len(pairs))
+    blocks = list()
+    for si_1, si_2 in pairs:
+        logger.info(
+            f"        {_bem_surf_name[surfs[si_1]['id']]} ({nps[si_1]:d}) -> "
+            f"{_bem_surf_name[surfs[si_2]['id']]} ({nps[si_2]}) ..."
+        )
+        for rows in np.array_split(np.arange(nps[si_1]), n_split):
+            rows = slice(offsets[si_1] + rows[0], offsets[si_1] + rows[-1] + 1)
+            cols = slice(offsets[si_2], offsets[si_2 + 1])
+            blocks.append((si_1, si_2, rows, cols))
+    if n_jobs == 1:  # fill the matrix directly
+        for si_1, si_2, rows, cols in blocks:
+            _fwd_bem_lin_pot_coeff_block(
+                surfs[si_1],
+                rows.start - offsets[si_1],
+                rows.stop - offsets[si_1],
+                surfs[si_2],
+                si_1 == si_2,
+                out=coeff[rows, cols],
             )
-            tri_rr = surf2["rr"][surf2["tris"]]
-            tri_nn = surf2["tri_nn"]
-            tri_area = surf2["tri_area"]
-            submat = coeff[
-                offsets[si_1] : offsets[si_1 + 1], offsets[si_2] : offsets[si_2 + 1]
-            ]  # view
-            for k in range(surf2["ntri"]):
-                tri = surf2["tris"][k]
-                if si_1 == si_2:
-                    skip_idx = (
-                        (rr_ord == tri[0]) | (rr_ord == tri[1]) | (rr_ord == tri[2])
-                    )
-                else:
-                    skip_idx = list()
-                # No contribution from a triangle that
-                # this vertex belongs to
-                # if sidx1 == sidx2 and (tri == j).any():
-                #     continue
-                # Otherwise do the hard job
-                coeffs = _lin_pot_coeff(
-                    fros=surf1["rr"],
-                    tri_rr=tri_rr[k],
-                    tri_nn=tri_nn[k],
-                    tri_area=tri_area[k],
+    else:
+        for (_, _, rows, cols), block in zip(
+            blocks,
+            parallel(
+                p_fun(
+                    surfs[si_1],
+                    rows.start - offsets[si_1],
+                    rows.stop - offsets[si_1],
+                    surfs[si_2],
+                    si_1 == si_2,
                 )
-                coeffs[skip_idx] = 0.0
-                submat[:, tri] -= coeffs
-            if si_1 == si_2:
-                _correct_auto_elements(surf1, submat)
+                for si_1, si_2, rows, cols in blocks
+            ),
+        ):
+            coeff[rows, cols] = block
+    for si, surf in enumerate(surfs):
+        sl = slice(offsets[si], offsets[si + 1])
+        _correct_auto_elements(surf, coeff[sl, sl])
     return coeff
 
 
-def _fwd_bem_multi_solution(solids, gamma, nps):
+# Number of field points and triangles processed at once by _lin_pot_coeff
+_BEM_ROW_BLOCK = 250
+_BEM_TRI_BATCH = 40
+
+
+def _scatter_rounds(tris):
+    """Split the vertex contributions of triangles into duplicate-free rounds.
+
+    Round ``k`` holds the ``k``-th contribution to each vertex (in triangle
+    order), so subtracting the rounds one after another with fancy indexing
+    gives the same summation order as going through the triangles one by one.
+    """
+    verts = tris.ravel()
+    order = np.argsort(verts, kind="stable")
+    sorted_verts = verts[order]
+    group_start = np.flatnonzero(np.diff(sorted_verts, prepend=-1))
+    rank = np.empty(len(verts), int)
+    rank[order] = np.arange(len(verts)) - np.repeat(
+        group_start, np.diff(np.append(group_start, len(verts)))
+    )
+    rounds = list()
+    for ri in range(rank.max(initial=-1) + 1):
+        idx = np.flatnonzero(rank == ri)
+        rounds.append((idx // 3, idx % 3, verts[idx]))
+    return rounds
+
+
+def _fwd_bem_lin_pot_coeff_block(surf1, start, stop, surf2, same, out=None):
+    """Calculate the coefficients of some vertices of surf1 for all of surf2."""
+    if out is None:
+        out = np.zeros((stop - start, surf2["np"]))
+    tri_rr = surf2["rr"][surf2["tris"]]
+    batches = [
+        (sl, _scatter_rounds(surf2["tris"][sl]))
+        for sl in (
+            slice(first, first + _BEM_TRI_BATCH)
+            for first in range(0, surf2["ntri"], _BEM_TRI_BATCH)
+        )
+    ]
+    # Keep the intermediate arrays of _lin_pot_coeff small by processing
+    # blocks of field points and batches of triangles
+    for row in range(start, stop, _BEM_ROW_BLOCK):
+        fros = surf1["rr"][row : min(row + _BEM_ROW_BLOCK, stop)]
+        out_rows = out[row - start : row - start + len(fros)]
+        for sl, rounds in batches:
+            tris = surf2["tris"][sl]
+            coeffs = _lin_pot_coeff(
+                fros=fros,
+                tri_rr=tri_rr[sl],
+                tri_nn=surf2["tri_nn"][sl],
+                tri_area=surf2["tri_area"][sl],
+                fro_0=surf1["rr"][0],
+            )
+            if same:
+                # No contribution from a triangle that this vertex belongs to
+                mask = (tris >= row) & (tris < row + len(fros))
+                tri_idx, vert_idx = np.nonzero(mask)
+                coeffs[tri_idx, tris[tri_idx, vert_idx] - row] = 0.0
+            for tri_idx, slot_idx, verts in rounds:
+                out_rows[:, verts] -= coeffs[tri_idx, :, slot_idx].T
+    return out
+
+
+def _fwd_bem_multi_solution(solids, gamma, nps, factorize=False):
     """Do multi surface solution.
 
     * Invert I - solids/(2*M_PI)
     * Take deflation into account
     * The matrix is destroyed after inversion
     * This is the general multilayer case
+    * If factorize=True, the LU factorization is returned instead of the
+      inverse (computed in place)
     """
     pi2 = 1.0 / (2 * np.pi)
     n_tot = np.sum(nps)
@@ -276,12 +365,14 @@ def _fwd_bem_multi_solution(solids, gamma, nps):
             slice_k = slice(offsets[si_2], offsets[si_2 + 1])
             solids[slice_j, slice_k] = defl - solids[slice_j, slice_k] * mult
     solids += np.eye(n_tot)
+    if factorize:
+        return lu_factor(solids, overwrite_a=True, check_finite=False)
     return np.linalg.inv(solids)
 
 
-def _fwd_bem_homog_solution(solids, nps):
+def _fwd_bem_homog_solution(solids, nps, factorize=False):
     """Make a homogeneous solution."""
-    return _fwd_bem_multi_solution(solids, gamma=None, nps=nps)
+    return _fwd_bem_multi_solution(solids, gamma=None, nps=nps, factorize=factorize)
 
 
 def _fwd_bem_ip_modify_solution(solution, ip_solution, ip_mult, n_tri):
@@ -306,6 +397,37 @@ def _fwd_bem_ip_modify_solution(solution, ip_solution, ip_mult, n_tri):
     return
 
 
+def _bem_apply_solution(bem, coeff):
+    """Compute ``coeff @ bem["solution"]``.
+
+    If only the LU factorization of the BEM matrix is available (see
+    ``make_bem_solution(..., factorize=True)``), the product is obtained by
+    solving with it, including the modification of the IP approach (see
+    _fwd_bem_ip_modify_solution).
+    """
+    if "solution" in bem:
+        return coeff @ bem["solution"]
+    factors = bem["solution_lu"]
+    sol = lu_solve(factors["lu"], coeff.T, trans=1, check_finite=False).T
+    if factors["ip"] is not None:
+        ip_lu, ip_mult = factors["ip"]["lu"], factors["ip"]["mult"]
+        n_last = len(ip_lu[1])
+        mult = (1.0 + ip_mult) / ip_mult
+        # S[:, last] @ (I - 2 * ip) + [0, mult * ip] in one solve
+        rhs = mult * coeff[:, -n_last:] - 2 * sol[:, -n_last:]
+        sol[:, -n_last:] += lu_solve(ip_lu, rhs.T, trans=1, check_finite=False).T
+        sol *= ip_mult
+    return sol
+
+
+def _bem_explicit_solution(bem):
+    """Get the BEM solution matrix, computing it from its factors if needed."""
+    if "solution" in bem:
+        return bem["solution"]
+    logger.info("    Computing the BEM solution matrix from its LU factorization...")
+    return _bem_apply_solution(bem, np.eye(bem["nsol"]))
+
+
 def _check_complete_surface(surf, copy=False, incomplete="raise", extra=""):
     surf = complete_surface_info(surf, copy=copy, verbose=_verbose_safe_false())
     fewer = np.where([len(t) < 3 for t in surf["neighbor_tri"]])[0]
@@ -322,28 +444,42 @@ def _check_complete_surface(surf, copy=False, incomplete="raise", extra=""):
     return surf
 
 
-def _fwd_bem_linear_collocation_solution(bem):
+def _fwd_bem_linear_collocation_solution(bem, n_jobs=None, factorize=False):
     """Compute the linear collocation potential solution."""
     # first, add surface geometries
     logger.info("Computing the linear collocation solution...")
     logger.info("    Matrix coefficients...")
-    coeff = _fwd_bem_lin_pot_coeff(bem["surfs"])
+    coeff = _fwd_bem_lin_pot_coeff(bem["surfs"], n_jobs=n_jobs)
     bem["nsol"] = len(coeff)
-    logger.info("    Inverting the coefficient matrix...")
+    kind = "Factorizing" if factorize else "Inverting"
+    logger.info(f"    {kind} the coefficient matrix...")
     nps = [surf["np"] for surf in bem["surfs"]]
-    bem["solution"] = _fwd_bem_multi_solution(coeff, bem["gamma"], nps)
+    solution = _fwd_bem_multi_solution(coeff, bem["gamma"], nps, factorize)
+    del coeff
+    ip = None
     if len(bem["surfs"]) == 3:
         ip_mult = bem["sigma"][1] / bem["sigma"][2]
         if ip_mult <= FWD.BEM_IP_APPROACH_LIMIT:
             logger.info("IP approach required...")
             logger.info("    Matrix coefficients (homog)...")
-            coeff = _fwd_bem_lin_pot_coeff([bem["surfs"][-1]])
-            logger.info("    Inverting the coefficient matrix (homog)...")
-            ip_solution = _fwd_bem_homog_solution(coeff, [bem["surfs"][-1]["np"]])
-            logger.info(
-                "    Modify the original solution to incorporate IP approach..."
+            coeff = _fwd_bem_lin_pot_coeff([bem["surfs"][-1]], n_jobs=n_jobs)
+            logger.info(f"    {kind} the coefficient matrix (homog)...")
+            ip_solution = _fwd_bem_homog_solution(
+                coeff, [bem["surfs"][-1]["np"]], factorize
             )
-            _fwd_bem_ip_modify_solution(bem["solution"], ip_solution, ip_mult, nps)
+            if factorize:
+                ip = dict(lu=ip_solution, mult=ip_mult)
+            else:
+                logger.info(
+                    "    Modify the original solution to incorporate IP approach..."
+                )
+                _fwd_bem_ip_modify_solution(solution, ip_solution, ip_mult, nps)
+    bem.pop("solution", None)
+    bem.pop("solution_lu", None)
+    if factorize:
+        bem["solution_lu"] = dict(lu=solution, ip=ip)
+    else:
+        bem["solution"] = solution
     bem["bem_method"] = FIFF.FIFFV_BEM_APPROX_LINEAR
     bem["solver"] = "mne"
 
@@ -395,7 +531,9 @@ def _fwd_bem_openmeeg_solution(bem):
 
 
 @verbose
-def make_bem_solution(surfs, *, solver="mne", verbose=None):
+def make_bem_solution(
+    surfs, *, solver="mne", n_jobs=None, factorize=False, verbose=None
+):
     """Create a BEM solution using the linear collocation approach.
 
     Parameters
@@ -407,6 +545,18 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
         `OpenMEEG <https://openmeeg.github.io>`__ package.
 
         .. versionadded:: 1.2
+    %(n_jobs)s
+        Only used with ``solver='mne'``.
+
+        .. versionadded:: 1.10
+    factorize : bool
+        If True, store the LU factorization of the BEM coefficient matrix
+        instead of its inverse. This takes less time and memory to compute,
+        and forward computations use triangular solves instead of products
+        with the inverse. The inverse is computed when the solution is
+        written to disk. Only supported with ``solver='mne'``.
+
+        .. versionadded:: 1.10
     %(verbose)s
 
     Returns
@@ -428,6 +578,11 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
     """
     _validate_type(solver, str, "solver")
     _check_option("method", solver.lower(), ("mne", "openmeeg"))
+    _validate_type(factorize, bool, "factorize")
+    if factorize and solver.lower() != "mne":
+        raise ValueError(
+            f"factorize=True is only supported with solver='mne', got {solver!r}"
+        )
     bem = _ensure_bem_surfaces(surfs)
     _add_gamma_multipliers(bem)
     if len(bem["surfs"]) == 3:
@@ -443,7 +598,7 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
         _fwd_bem_openmeeg_solution(bem)
     else:
         assert solver.lower() == "mne"
-        _fwd_bem_linear_collocation_solution(bem)
+        _fwd_bem_linear_collocation_solution(bem, n_jobs=n_jobs, factorize=factorize)
     logger.info("Solution ready.")
     logger.info("BEM geometry computations complete.")
     return bem
@@ -1862,7 +2017,11 @@ def write_bem_solution(fname, bem, overwrite=False, *, verbose=None):
     fname = _check_fname(fname, overwrite=overwrite, name="fname")
     if fname.suffix == ".h5":
         _, write_hdf5 = _import_h5io_funcs()
-        bem = {k: bem[k] for k in ("surfs", "solution", "bem_method")}
+        bem = dict(
+            surfs=bem["surfs"],
+            solution=_bem_explicit_solution(bem),
+            bem_method=bem["bem_method"],
+        )
         write_hdf5(fname, bem, overwrite=True)
     else:
         _write_bem_solution_fif(fname, bem)
@@ -1880,12 +2039,14 @@ def _write_bem_solution_fif(fname, bem):
         # Surfaces
         _write_bem_surfaces_block(fid, bem["surfs"])
         # The potential solution
-        if "solution" in bem:
+        if "solution" in bem or "solution_lu" in bem:
             _check_option(
                 "bem_method", bem["bem_method"], (FIFF.FIFFV_BEM_APPROX_LINEAR,)
             )
             write_int(fid, FIFF.FIFF_BEM_APPROX, FIFF.FIFFV_BEM_APPROX_LINEAR)
-            write_float_matrix(fid, FIFF.FIFF_BEM_POT_SOLUTION, bem["solution"])
+            write_float_matrix(
+                fid, FIFF.FIFF_BEM_POT_SOLUTION, _bem_explicit_solution(bem)
+            )
         end_block(fid, FIFF.FIFFB_BEM)
 
 
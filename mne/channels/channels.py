@@ -608,6 +608,8 @@ class UpdateChannelsMixin:
         if isinstance(self, BaseRaw):
             if self._projector is not None:
                 _check_preload(self, f"{msg} after calling .apply_proj()")
+            if self._ica_op is not None:
+                _check_preload(self, f"{msg} after calling ICA.apply()")
         else:
             _check_preload(self, msg)
 
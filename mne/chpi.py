@@ -48,6 +48,7 @@ from .io import BaseRaw
 from .io.ctf.trans import _make_ctf_coord_trans_set
 from .io.kit.constants import KIT
 from .io.kit.kit import RawKIT as _RawKIT
+from .parallel import parallel_func
 from .preprocessing.maxwell import (
     _get_mf_picks_fix_mags,
     _prep_mf_coils,
@@ -55,6 +56,7 @@ from .preprocessing.maxwell import (
     _sss_basis,
 )
 from .transforms import (
+    Transform,
     _angle_between_quats,
     _fit_matched_points,
     _quat_to_affine,
@@ -68,10 +70,12 @@ from .utils import (
     ProgressBar,
     _check_fname,
     _check_option,
+    _ensure_int,
     _on_missing,
     _pl,
     _validate_type,
     _verbose_safe_false,
+    fill_doc,
     logger,
     use_log_level,
     verbose,
@@ -536,7 +540,9 @@ def _magnetic_dipole_delta_multi(whitened_fwd_svd, B, B2):
     return B2 - Bm2
 
 
-def _fit_magnetic_dipole(B_orig, x0, too_close, whitener, coils, guesses):
+def _fit_magnetic_dipole(
+    B_orig, x0, too_close, whitener, coils, guesses, return_n_eval=False
+):
     """Fit a single bit of data (x0 = pos)."""
     B = np.dot(whitener, B_orig)
     B2 = np.dot(B, B)
@@ -548,6 +554,12 @@ def _fit_magnetic_dipole(B_orig, x0, too_close, whitener, coils, guesses):
         whitener=whitener,
         too_close=too_close,
     )
+    n_eval = [0]
+
+    def counted(x):
+        n_eval[0] += 1
+        return objective(x)
+
     if guesses is not None:
         res0 = objective(x0)
         res = _magnetic_dipole_delta_multi(guesses["whitened_fwd_svd"], B, B2)
@@ -555,12 +567,28 @@ def _fit_magnetic_dipole(B_orig, x0, too_close, whitener, coils, guesses):
         idx = np.argmin(res)
         if res[idx] < res0:
             x0 = guesses["rr"][idx]
-    x = fmin_cobyla(objective, x0, (), rhobeg=1e-3, rhoend=1e-5, disp=False)
+    x = fmin_cobyla(counted, x0, (), rhobeg=1e-3, rhoend=1e-5, disp=False)
     gof, moment = objective(x, return_moment=True)
     gof = 1.0 - gof / B2
+    if return_n_eval:
+        return x, gof, moment, n_eval[0]
     return x, gof, moment
 
 
+def _fit_magnetic_dipole_series(sin_fits, x0, too_close, whitener, coils, guesses):
+    """Fit one coil over a series of windows, warm-starting from the last fit."""
+    rrs, gofs, moments, n_evals = list(), list(), list(), list()
+    for sin_fit in sin_fits:
+        x0, gof, moment, n_eval = _fit_magnetic_dipole(
+            sin_fit, x0, too_close, whitener, coils, guesses, return_n_eval=True
+        )
+        rrs.append(x0)
+        gofs.append(gof)
+        moments.append(moment)
+        n_evals.append(n_eval)
+    return rrs, gofs, moments, n_evals
+
+
 @jit()
 def _chpi_objective(x, coil_dev_rrs, coil_head_rrs):
     """Compute objective function."""
@@ -772,13 +800,17 @@ def _fit_chpi_amplitudes(raw, time_sl, hpi, snr=False):
     with use_log_level(False):
         # loads good channels
         this_data = raw[hpi["meg_picks"], time_sl][0]
-
-    # which HPI coils to use
-    if hpi["hpi_pick"] is not None:
-        with use_log_level(False):
-            # loads hpi_stim channel
+        # loads hpi_stim channel
+        chpi_data = None
+        if hpi["hpi_pick"] is not None:
             chpi_data = raw[hpi["hpi_pick"], time_sl][0]
+    return _fit_chpi_amplitudes_data(this_data, chpi_data, hpi, snr)
+
 
+def _fit_chpi_amplitudes_data(this_data, chpi_data, hpi, snr=False):
+    """Fit cHPI amplitudes to already loaded MEG (and cHPI stim) data."""
+    # which HPI coils to use
+    if chpi_data is not None:
         ons = (np.round(chpi_data).astype(np.int64) & hpi["on"][:, np.newaxis]).astype(
             bool
         )
@@ -944,8 +976,31 @@ def compute_head_pos(
     """
     _check_chpi_param(chpi_locs, "chpi_locs")
     _validate_type(info, Info, "info")
+    hpi_dig_head_rrs, last, pos_0 = _setup_head_pos_fitting(info, adjust_dig)
+    quats = []
+    for fit_time, this_coil_dev_rrs, g_coils in zip(
+        *(chpi_locs[key] for key in ("times", "rrs", "gofs"))
+    ):
+        quat = _fit_head_pos(
+            fit_time,
+            this_coil_dev_rrs,
+            g_coils,
+            hpi_dig_head_rrs,
+            last,
+            pos_0,
+            dist_limit,
+            gof_limit,
+        )
+        if quat is not None:
+            quats.append(quat)
+    quats = np.array(quats, np.float64)
+    quats = np.zeros((0, 10)) if quats.size == 0 else quats
+    return quats
+
+
+def _setup_head_pos_fitting(info, adjust_dig):
+    """Get the digitized coil locations and initial state for head pos fits."""
     hpi_dig_head_rrs = _get_hpi_initial_fit(info, adjust=adjust_dig, verbose="error")
-    n_coils = len(hpi_dig_head_rrs)
     coil_dev_rrs = apply_trans(invert_transform(info["dev_head_t"]), hpi_dig_head_rrs)
     dev_head_t = info["dev_head_t"]["trans"]
     pos_0 = dev_head_t[:3, 3]
@@ -954,121 +1009,124 @@ def compute_head_pos(
         coil_dev_rrs=coil_dev_rrs,
         quat=np.concatenate([rot_to_quat(dev_head_t[:3, :3]), dev_head_t[:3, 3]]),
     )
-    del coil_dev_rrs
-    quats = []
-    for fit_time, this_coil_dev_rrs, g_coils in zip(
-        *(chpi_locs[key] for key in ("times", "rrs", "gofs"))
-    ):
-        use_idx = np.where(g_coils >= gof_limit)[0]
-
-        #
-        # 1. Check number of good ones
-        #
-        if len(use_idx) < 3:
-            gofs = ", ".join(f"{g:0.2f}" for g in g_coils)
-            warn(
-                f"{_time_prefix(fit_time)}{len(use_idx)}/{n_coils} "
-                "good HPI fits, cannot determine the transformation "
-                f"({gofs} GOF)!"
-            )
-            continue
-
-        #
-        # 2. Fit the head translation and rotation params (minimize error
-        #    between coil positions and the head coil digitization
-        #    positions) iteratively using different sets of coils.
-        #
-        this_quat, g, use_idx = _fit_chpi_quat_subset(
-            this_coil_dev_rrs, hpi_dig_head_rrs, use_idx
+    return hpi_dig_head_rrs, last, pos_0
+
+
+def _fit_head_pos(
+    fit_time,
+    this_coil_dev_rrs,
+    g_coils,
+    hpi_dig_head_rrs,
+    last,
+    pos_0,
+    dist_limit,
+    gof_limit,
+):
+    """Fit the head position for one set of coil locations, updating ``last``."""
+    n_coils = len(hpi_dig_head_rrs)
+    use_idx = np.where(g_coils >= gof_limit)[0]
+
+    #
+    # 1. Check number of good ones
+    #
+    if len(use_idx) < 3:
+        gofs = ", ".join(f"{g:0.2f}" for g in g_coils)
+        warn(
+            f"{_time_prefix(fit_time)}{len(use_idx)}/{n_coils} "
+            "good HPI fits, cannot determine the transformation "
+            f"({gofs} GOF)!"
         )
+        return None
+
+    #
+    # 2. Fit the head translation and rotation params (minimize error
+    #    between coil positions and the head coil digitization
+    #    positions) iteratively using different sets of coils.
+    #
+    this_quat, g, use_idx = _fit_chpi_quat_subset(
+        this_coil_dev_rrs, hpi_dig_head_rrs, use_idx
+    )
 
-        #
-        # 3. Stop if < 3 good
-        #
-
-        # Convert quaterion to transform
-        this_dev_head_t = _quat_to_affine(this_quat)
-        est_coil_head_rrs = apply_trans(this_dev_head_t, this_coil_dev_rrs)
-        errs = np.linalg.norm(hpi_dig_head_rrs - est_coil_head_rrs, axis=1)
-        n_good = ((g_coils >= gof_limit) & (errs < dist_limit)).sum()
-        if n_good < 3:
-            warn_str = ", ".join(
-                f"{1000 * e:0.1f}::{g:0.2f}" for e, g in zip(errs, g_coils)
-            )
-            warn(
-                f"{_time_prefix(fit_time)}{n_good}/{n_coils} good HPI fits, cannot "
-                f"determine the transformation ({warn_str} mm/GOF)!"
-            )
-            continue
-
-        # velocities, in device coords, of HPI coils
-        dt = fit_time - last["quat_fit_time"]
-        vs = tuple(
-            1000.0
-            * np.linalg.norm(last["coil_dev_rrs"] - this_coil_dev_rrs, axis=1)
-            / dt
+    #
+    # 3. Stop if < 3 good
+    #
+
+    # Convert quaterion to transform
+    this_dev_head_t = _quat_to_affine(this_quat)
+    est_coil_head_rrs = apply_trans(this_dev_head_t, this_coil_dev_rrs)
+    errs = np.linalg.norm(hpi_dig_head_rrs - est_coil_head_rrs, axis=1)
+    n_good = ((g_coils >= gof_limit) & (errs < dist_limit)).sum()
+    if n_good < 3:
+        warn_str = ", ".join(
+            f"{1000 * e:0.1f}::{g:0.2f}" for e, g in zip(errs, g_coils)
         )
-        logger.info(
-            _time_prefix(fit_time)
-            + (
-                "%s/%s good HPI fits, movements [mm/s] = "
-                + " / ".join(["% 8.1f"] * n_coils)
-            )
-            % ((n_good, n_coils) + vs)
+        warn(
+            f"{_time_prefix(fit_time)}{n_good}/{n_coils} good HPI fits, cannot "
+            f"determine the transformation ({warn_str} mm/GOF)!"
         )
+        return None
 
-        # Log results
-        # MaxFilter averages over a 200 ms window for display, but we don't
-        for ii in range(n_coils):
-            if ii in use_idx:
-                start, end = " ", "/"
-            else:
-                start, end = "(", ")"
-            log_str = (
-                "    "
-                + start
-                + "{0:6.1f} {1:6.1f} {2:6.1f} / "
-                + "{3:6.1f} {4:6.1f} {5:6.1f} / "
-                + "g = {6:0.3f} err = {7:4.1f} "
-                + end
-            )
-            vals = np.concatenate(
-                (
-                    1000 * hpi_dig_head_rrs[ii],
-                    1000 * est_coil_head_rrs[ii],
-                    [g_coils[ii], 1000 * errs[ii]],
-                )
-            )
-            if len(use_idx) >= 3:
-                if ii <= 2:
-                    log_str += "{8:6.3f} {9:6.3f} {10:6.3f}"
-                    vals = np.concatenate((vals, this_dev_head_t[ii, :3]))
-                elif ii == 3:
-                    log_str += "{8:6.1f} {9:6.1f} {10:6.1f}"
-                    vals = np.concatenate((vals, this_dev_head_t[:3, 3] * 1000.0))
-            logger.debug(log_str.format(*vals))
-
-        # resulting errors in head coil positions
-        d = np.linalg.norm(last["quat"][3:] - this_quat[3:])  # m
-        r = _angle_between_quats(last["quat"][:3], this_quat[:3]) / dt
-        v = d / dt  # m/s
-        d = 100 * np.linalg.norm(this_quat[3:] - pos_0)  # dis from 1st
-        logger.debug(
-            f"    #t = {fit_time:0.3f}, #e = {100 * errs.mean():0.2f} cm, #g = {g:0.3f}"
-            f", #v = {100 * v:0.2f} cm/s, #r = {r:0.2f} rad/s, #d = {d:0.2f} cm"
+    # velocities, in device coords, of HPI coils
+    dt = fit_time - last["quat_fit_time"]
+    vs = tuple(
+        1000.0 * np.linalg.norm(last["coil_dev_rrs"] - this_coil_dev_rrs, axis=1) / dt
+    )
+    logger.info(
+        _time_prefix(fit_time)
+        + (
+            "%s/%s good HPI fits, movements [mm/s] = "
+            + " / ".join(["% 8.1f"] * n_coils)
         )
-        q_rep = " ".join(f"{qq:8.5f}" for qq in this_quat)
-        logger.debug(f"    #t = {fit_time:0.3f}, #q = {q_rep}")
+        % ((n_good, n_coils) + vs)
+    )
 
-        quats.append(
-            np.concatenate(([fit_time], this_quat, [g], [errs[use_idx].mean()], [v]))
+    # Log results
+    # MaxFilter averages over a 200 ms window for display, but we don't
+    for ii in range(n_coils):
+        if ii in use_idx:
+            start, end = " ", "/"
+        else:
+            start, end = "(", ")"
+        log_str = (
+            "    "
+            + start
+            + "{0:6.1f} {1:6.1f} {2:6.1f} / "
+            + "{3:6.1f} {4:6.1f} {5:6.1f} / "
+            + "g = {6:0.3f} err = {7:4.1f} "
+            + end
         )
-        last["quat_fit_time"] = fit_time
-        last["quat"] = this_quat
-        last["coil_dev_rrs"] = this_coil_dev_rrs
-    quats = np.array(quats, np.float64)
-    quats = np.zeros((0, 10)) if quats.size == 0 else quats
-    return quats
+        vals = np.concatenate(
+            (
+                1000 * hpi_dig_head_rrs[ii],
+                1000 * est_coil_head_rrs[ii],
+                [g_coils[ii], 1000 * errs[ii]],
+            )
+        )
+        if len(use_idx) >= 3:
+            if ii <= 2:
+                log_str += "{8:6.3f} {9:6.3f} {10:6.3f}"
+                vals = np.concatenate((vals, this_dev_head_t[ii, :3]))
+            elif ii == 3:
+                log_str += "{8:6.1f} {9:6.1f} {10:6.1f}"
+                vals = np.concatenate((vals, this_dev_head_t[:3, 3] * 1000.0))
+        logger.debug(log_str.format(*vals))
+
+    # resulting errors in head coil positions
+    d = np.linalg.norm(last["quat"][3:] - this_quat[3:])  # m
+    r = _angle_between_quats(last["quat"][:3], this_quat[:3]) / dt
+    v = d / dt  # m/s
+    d = 100 * np.linalg.norm(this_quat[3:] - pos_0)  # dis from 1st
+    logger.debug(
+        f"    #t = {fit_time:0.3f}, #e = {100 * errs.mean():0.2f} cm, #g = {g:0.3f}"
+        f", #v = {100 * v:0.2f} cm/s, #r = {r:0.2f} rad/s, #d = {d:0.2f} cm"
+    )
+    q_rep = " ".join(f"{qq:8.5f}" for qq in this_quat)
+    logger.debug(f"    #t = {fit_time:0.3f}, #q = {q_rep}")
+
+    last["quat_fit_time"] = fit_time
+    last["quat"] = this_quat
+    last["coil_dev_rrs"] = this_coil_dev_rrs
+    return np.concatenate(([fit_time], this_quat, [g], [errs[use_idx].mean()], [v]))
 
 
 def _fit_chpi_quat_subset(coil_dev_rrs, coil_head_rrs, use_idx):
@@ -1268,6 +1326,8 @@ def compute_chpi_locs(
     t_step_max=1.0,
     too_close="raise",
     adjust_dig=False,
+    *,
+    n_jobs=None,
     verbose=None,
 ):
     """Compute locations of each cHPI coils over time.
@@ -1283,6 +1343,10 @@ def compute_chpi_locs(
         How to handle HPI positions too close to the sensors,
         can be ``'raise'`` (default), ``'warning'``, or ``'info'``.
     %(adjust_dig_chpi)s
+    %(n_jobs)s
+        Coils are fitted in parallel, so at most one job per cHPI coil is used.
+
+        .. versionadded:: 1.10
     %(verbose)s
 
     Returns
@@ -1305,7 +1369,12 @@ def compute_chpi_locs(
     1. Get HPI coil locations (as digitized in ``info['dig']``) in head coords.
     2. If the amplitudes are 98%% correlated with last position
        (and Δt < t_step_max), skip fitting.
-    3. Fit magnetic dipoles using the amplitudes for each coil frequency.
+    3. Fit magnetic dipoles using the amplitudes for each coil frequency,
+       starting from the location fitted in the previous window.
+
+    Because the decision to skip a window only depends on the amplitudes,
+    the windows to fit are determined up front and each coil is then fitted
+    across all windows independently (optionally in parallel).
 
     The number of fitted points ``n_pos`` will depend on the velocity of head
     movements as well as ``t_step_max`` (and ``t_step_min`` from
@@ -1319,7 +1388,61 @@ def compute_chpi_locs(
     _validate_type(info, Info, "info")
     sin_fits = chpi_amplitudes  # use the old name below
     del chpi_amplitudes
-    proj = sin_fits["proj"]
+    info, meg_coils, whitener, guesses = _setup_chpi_dipole_fits(
+        info, sin_fits["proj"], too_close
+    )
+
+    # setup last iteration structure
+    hpi_dig_dev_rrs = apply_trans(
+        invert_transform(info["dev_head_t"])["trans"],
+        _get_hpi_initial_fit(info, adjust=adjust_dig),
+    )
+    n_hpi = len(hpi_dig_dev_rrs)
+    last = dict(sin_fit=None, coil_fit_time=sin_fits["times"][0] - 1)
+    fit_idx = list()
+    for ti, (fit_time, sin_fit) in enumerate(
+        zip(sin_fits["times"], sin_fits["slopes"])
+    ):
+        if _chpi_needs_refit(last, fit_time, sin_fit, t_step_max):
+            fit_idx.append(ti)
+    del last
+    fit_idx = np.array(fit_idx, int)
+    slopes = sin_fits["slopes"][fit_idx]
+
+    #
+    # 2. Fit magnetic dipole for each coil to obtain coil positions
+    #    in device coordinates
+    #
+    parallel, p_fun, n_jobs = parallel_func(
+        _fit_magnetic_dipole_series, n_jobs, total=n_hpi, max_jobs=n_hpi
+    )
+    logger.info(
+        f"Fitting {n_hpi} HPI coil location{_pl(n_hpi)} at {len(fit_idx)} time "
+        f"point{_pl(fit_idx)} using {n_jobs} job{_pl(n_jobs)}"
+    )
+    coil_fits = parallel(
+        p_fun(slopes[:, ci], x0, too_close, whitener, meg_coils, guesses)
+        for ci, x0 in enumerate(hpi_dig_dev_rrs)
+    )
+    del hpi_dig_dev_rrs
+    n_times = len(fit_idx)
+    chpi_locs = dict(times=sin_fits["times"][fit_idx])
+    shapes = dict(rrs=(n_times, 3), gofs=(n_times,), moments=(n_times, 3))
+    for key, val in zip(("rrs", "gofs", "moments", "n_evals"), zip(*coil_fits)):
+        shape = (n_hpi,) + shapes.get(key, (n_times,))
+        val = np.array(val, float).reshape(shape).swapaxes(0, 1)
+        chpi_locs[key] = np.ascontiguousarray(val)
+    n_evals = chpi_locs.pop("n_evals").astype(int)
+    for fit_time, this_n_eval in zip(chpi_locs["times"], n_evals):
+        logger.debug(
+            f"{_time_prefix(fit_time)}{this_n_eval.sum()} objective evaluations "
+            f"({', '.join(str(n) for n in this_n_eval)})"
+        )
+    return chpi_locs
+
+
+def _setup_chpi_dipole_fits(info, proj, too_close):
+    """Set up the coils, whitener, and location guesses for cHPI dipole fits."""
     meg_picks = pick_channels(info["ch_names"], proj["data"]["col_names"], ordered=True)
     info = pick_info(info, meg_picks)  # makes a copy
     with info._unlock():
@@ -1347,68 +1470,199 @@ def compute_chpi_locs(
     fwd = np.linalg.svd(fwd, full_matrices=False)[2]
     guesses = dict(rr=guesses, whitened_fwd_svd=fwd)
     del fwd, R
+    return info, meg_coils, whitener, guesses
 
-    iter_ = list(zip(sin_fits["times"], sin_fits["slopes"]))
-    chpi_locs = dict(times=[], rrs=[], gofs=[], moments=[])
-    # setup last iteration structure
-    hpi_dig_dev_rrs = apply_trans(
-        invert_transform(info["dev_head_t"])["trans"],
-        _get_hpi_initial_fit(info, adjust=adjust_dig),
-    )
-    last = dict(
-        sin_fit=None,
-        coil_fit_time=sin_fits["times"][0] - 1,
-        coil_dev_rrs=hpi_dig_dev_rrs,
-    )
-    n_hpi = len(hpi_dig_dev_rrs)
-    del hpi_dig_dev_rrs
-    for fit_time, sin_fit in ProgressBar(iter_, mesg="cHPI locations "):
-        # skip this window if bad
-        if not np.isfinite(sin_fit).all():
-            continue
-
-        # check if data has sufficiently changed
-        if last["sin_fit"] is not None:  # first iteration
-            corrs = np.array(
-                [np.corrcoef(s, lst)[0, 1] for s, lst in zip(sin_fit, last["sin_fit"])]
-            )
-            corrs *= corrs
-            # check to see if we need to continue
-            if (
-                fit_time - last["coil_fit_time"] <= t_step_max - 1e-7
-                and (corrs > 0.98).sum() >= 3
-            ):
-                # don't need to refit data
-                continue
-
-        # update 'last' sin_fit *before* inplace sign mult
-        last["sin_fit"] = sin_fit.copy()
 
-        #
-        # 2. Fit magnetic dipole for each coil to obtain coil positions
-        #    in device coordinates
-        #
+def _chpi_needs_refit(last, fit_time, sin_fit, t_step_max):
+    """Check if a window needs to be fit, updating ``last`` if so."""
+    # skip this window if bad
+    if not np.isfinite(sin_fit).all():
+        return False
+
+    # check if data has sufficiently changed
+    if last["sin_fit"] is not None:  # first iteration
+        corrs = np.array(
+            [np.corrcoef(s, lst)[0, 1] for s, lst in zip(sin_fit, last["sin_fit"])]
+        )
+        corrs *= corrs
+        # check to see if we need to continue
+        if (
+            fit_time - last["coil_fit_time"] <= t_step_max - 1e-7
+            and (corrs > 0.98).sum() >= 3
+        ):
+            # don't need to refit data
+            return False
+    last["sin_fit"] = sin_fit
+    last["coil_fit_time"] = fit_time
+    return True
+
+
+@fill_doc
+class HeadTracker:
+    """Track head positions incrementally from streamed cHPI data.
+
+    Parameters
+    ----------
+    %(info_not_none)s
+    t_step_min : float
+        Time step (in s) between successive cHPI amplitude fits.
+    %(t_window_chpi_t)s
+    t_step_max : float
+        Maximum time step to use before refitting the coil locations even
+        if the cHPI amplitudes have not changed.
+    too_close : str
+        How to handle HPI positions too close to the sensors,
+        can be ``'raise'`` (default), ``'warning'``, or ``'info'``.
+    dist_limit : float
+        Minimum distance (m) to accept for coil position fitting.
+    gof_limit : float
+        Minimum goodness of fit to accept for each coil.
+    %(ext_order_chpi)s
+    %(adjust_dig_chpi)s
+    first_samp : int
+        The sample number of the first sample that will be passed to
+        :meth:`update`, used to compute the times of the fits.
+    %(verbose)s
+
+    See Also
+    --------
+    compute_chpi_amplitudes
+    compute_chpi_locs
+    compute_head_pos
+
+    Notes
+    -----
+    This class performs the same steps as
+    :func:`~mne.chpi.compute_chpi_amplitudes`,
+    :func:`~mne.chpi.compute_chpi_locs` and :func:`~mne.chpi.compute_head_pos`,
+    but on successive buffers of data (e.g., during acquisition). Each window
+    is fit as soon as all of its samples have been passed to :meth:`update`,
+    so the latency is bounded by ``t_window``. Only the samples needed for
+    windows that have not been fit yet are kept in memory, along with the
+    last coil locations and head position used to initialize the next fit.
+
+    .. versionadded:: 1.10
+    """
+
+    @verbose
+    def __init__(
+        self,
+        info,
+        t_step_min=0.01,
+        t_window="auto",
+        t_step_max=1.0,
+        too_close="raise",
+        dist_limit=0.005,
+        gof_limit=0.98,
+        ext_order=1,
+        adjust_dig=False,
+        first_samp=0,
+        verbose=None,
+    ):
+        _validate_type(info, Info, "info")
+        _check_option("too_close", too_close, ["raise", "warning", "info"])
+        self._hpi = _setup_hpi_amplitude_fitting(info, t_window, ext_order=ext_order)
+        self._fit_info, self._meg_coils, self._whitener, self._guesses = (
+            _setup_chpi_dipole_fits(info, self._hpi["proj"], too_close)
+        )
+        self._hpi_dig_head_rrs, self._last, self._pos_0 = _setup_head_pos_fitting(
+            self._fit_info, adjust_dig
+        )
+        self._coil_dev_rrs = self._last["coil_dev_rrs"]
+        self._last_amp = dict(sin_fit=None, coil_fit_time=-np.inf)
+        self._nchan = info["nchan"]
+        self._sfreq = info["sfreq"]
+        self._t_step = float(t_step_min) * self._sfreq
+        if self._t_step <= 0:
+            raise ValueError(f"t_step_min must be > 0, got {t_step_min}")
+        self._t_step_max = t_step_max
+        self._too_close = too_close
+        self._dist_limit = dist_limit
+        self._gof_limit = gof_limit
+        self._first_samp = _ensure_int(first_samp, "first_samp")
+        self._buffer = np.empty((self._nchan, 0))
+        self._buffer_start = 0
+        self._n_fit = 0
+        self.n_samples = 0
+
+    @property
+    def dev_head_t(self):
+        """The most recently estimated device-to-head transform."""
+        return Transform("meg", "head", _quat_to_affine(self._last["quat"]))
+
+    @verbose
+    def update(self, data, *, verbose=None):
+        """Add a buffer of data and estimate any new head positions.
+
+        Parameters
+        ----------
+        data : ndarray, shape (n_channels, n_samples)
+            The next buffer of data, for all channels in ``info``.
+        %(verbose)s
+
+        Returns
+        -------
+        quats : ndarray, shape (n_pos, 10)
+            The ``[t, q1, q2, q3, x, y, z, gof, err, v]`` for each new fit.
+            Can be empty if no window was completed or no refit was needed.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[0] != self._nchan:
+            raise ValueError(
+                f"data must have shape ({self._nchan}, n_samples), got {data.shape}"
+            )
+        self._buffer = np.concatenate([self._buffer, data], axis=1)
+        self.n_samples += data.shape[1]
+        n_window = self._hpi["n_window"]
+        quats = list()
+        while True:
+            start = int(round(self._n_fit * self._t_step))
+            if start + n_window > self.n_samples:
+                break
+            offset = start - self._buffer_start
+            quat = self._fit_window(start, self._buffer[:, offset : offset + n_window])
+            if quat is not None:
+                quats.append(quat)
+            self._n_fit += 1
+        # discard samples that will no longer be needed
+        next_start = int(round(self._n_fit * self._t_step))
+        n_drop = min(next_start - self._buffer_start, self._buffer.shape[1])
+        self._buffer = self._buffer[:, n_drop:]
+        self._buffer_start += n_drop
+        return np.array(quats, np.float64).reshape(len(quats), 10)
+
+    def _fit_window(self, start, data):
+        hpi = self._hpi
+        chpi_data = None if hpi["hpi_pick"] is None else data[[hpi["hpi_pick"]]]
+        sin_fit = _fit_chpi_amplitudes_data(data[hpi["meg_picks"]], chpi_data, hpi)
+        if sin_fit is None:
+            return None
+        fit_time = (self._first_samp + start) / self._sfreq
+        if not _chpi_needs_refit(self._last_amp, fit_time, sin_fit, self._t_step_max):
+            return None
         coil_fits = [
-            _fit_magnetic_dipole(f, x0, too_close, whitener, meg_coils, guesses)
-            for f, x0 in zip(sin_fit, last["coil_dev_rrs"])
+            _fit_magnetic_dipole(
+                f,
+                x0,
+                self._too_close,
+                self._whitener,
+                self._meg_coils,
+                self._guesses,
+            )
+            for f, x0 in zip(sin_fit, self._coil_dev_rrs)
         ]
-        rrs, gofs, moments = zip(*coil_fits)
-        chpi_locs["times"].append(fit_time)
-        chpi_locs["rrs"].append(rrs)
-        chpi_locs["gofs"].append(gofs)
-        chpi_locs["moments"].append(moments)
-        last["coil_fit_time"] = fit_time
-        last["coil_dev_rrs"] = rrs
-    n_times = len(chpi_locs["times"])
-    shapes = dict(
-        times=(n_times,),
-        rrs=(n_times, n_hpi, 3),
-        gofs=(n_times, n_hpi),
-        moments=(n_times, n_hpi, 3),
-    )
-    for key, val in chpi_locs.items():
-        chpi_locs[key] = np.array(val, float).reshape(shapes[key])
-    return chpi_locs
+        rrs, gofs, _ = (np.array(val, float) for val in zip(*coil_fits))
+        self._coil_dev_rrs = rrs
+        return _fit_head_pos(
+            fit_time,
+            rrs,
+            gofs,
+            self._hpi_dig_head_rrs,
+            self._last,
+            self._pos_0,
+            self._dist_limit,
+            self._gof_limit,
+        )
 
 
 def _chpi_locs_to_times_dig(chpi_locs):
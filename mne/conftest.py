@@ -27,6 +27,7 @@ from mne.coreg import create_default_subject
 from mne.datasets import testing
 from mne.fixes import _compare_version, has_numba
 from mne.io import read_raw_ctf, read_raw_fif, read_raw_nirx, read_raw_snirf
+from mne.source_space import _source_space
 from mne.stats import cluster_level
 from mne.utils import (
     Bunch,
@@ -1036,6 +1037,9 @@ def numba_conditional(monkeypatch, request):
             cluster_level, "_where_first", cluster_level._where_first_fallback
         )
         monkeypatch.setattr(numerics, "_arange_div", numerics._arange_div_fallback)
+        monkeypatch.setattr(
+            _source_space, "_do_src_distances", _source_space._do_src_distances_fallback
+        )
     if request.param == "Numba" and not has_numba:
         pytest.skip("Numba not installed")
     yield request.param
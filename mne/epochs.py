@@ -8,6 +8,7 @@ import json
 import operator
 import os.path as op
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import partial
 from inspect import getfullargspec
@@ -37,7 +38,7 @@ from ._fiff.pick import (
 from ._fiff.proj import ProjMixin, setup_proj
 from ._fiff.tag import _read_tag_header, read_tag
 from ._fiff.tree import dir_tree_find
-from ._fiff.utils import _make_split_fnames
+from ._fiff.utils import _get_io_n_threads, _make_split_fnames
 from ._fiff.write import (
     _NEXT_FILE_BUFFER,
     INT32_MAX,
@@ -87,6 +88,7 @@ from .utils import (
     _convert_times,
     _ensure_events,
     _gen_events,
+    _has_imag,
     _on_missing,
     _path_like,
     _pl,
@@ -1571,10 +1573,14 @@ class BaseEpochs(
 
         return self
 
-    def _get_epoch_from_raw(self, idx, verbose=None):
+    def _get_epoch_from_raw(self, idx, verbose=None, *, annot_index=None):
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _annotations_index(self):
+        """Index the annotations used to reject the epochs read from disk."""
+        return None
+
     def _project_epoch(self, epoch):
         """Process a raw epoch based on the delayed param."""
         # whenever requested, the first epoch is being projected.
@@ -1586,6 +1592,14 @@ class BaseEpochs(
             epoch = np.dot(self._projector, epoch)
         return epoch
 
+    def _load_good_epoch(self, idx, detrend_picks, annot_index=None):
+        """Load an epoch from disk once bads have been dropped."""
+        epoch_noproj = self._get_epoch_from_raw(idx, annot_index=annot_index)
+        epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
+        if self._do_delayed_proj:
+            return epoch_noproj
+        return self._project_epoch(epoch_noproj)
+
     def _handle_empty(self, on_empty, meth):
         if len(self.events) == 0:
             msg = (
@@ -1711,14 +1725,10 @@ class BaseEpochs(
 
             # we need to load from disk, drop, and return data
             detrend_picks = self._detrend_picks
+            annot_index = self._annotations_index()
             for ii, idx in enumerate(use_idx):
                 # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
-                epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
-                if self._do_delayed_proj:
-                    epoch_out = epoch_noproj
-                else:
-                    epoch_out = self._project_epoch(epoch_noproj)
+                epoch_out = self._load_good_epoch(idx, detrend_picks, annot_index)
                 if ii == 0:
                     data = np.empty(
                         (n_events, len(self.ch_names), len(self.times)),
@@ -1734,6 +1744,7 @@ class BaseEpochs(
             assert n_events == len(self.selection)
             if not self.preload:
                 detrend_picks = self._detrend_picks
+                annot_index = self._annotations_index()
             for idx, sel in enumerate(self.selection):
                 if self.preload:  # from memory
                     if self._do_delayed_proj:
@@ -1743,7 +1754,9 @@ class BaseEpochs(
                         epoch_noproj = None
                         epoch = self._data[idx]
                 else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
+                    epoch_noproj = self._get_epoch_from_raw(
+                        idx, annot_index=annot_index
+                    )
                     epoch_noproj = self._detrend_offset_decim(
                         epoch_noproj, detrend_picks
                     )
@@ -2317,12 +2330,39 @@ class BaseEpochs(
 
         _check_option("split_naming", split_naming, ("neuromag", "bids"))
         split_fnames = _make_split_fnames(fname, n_parts, split_naming)
-        for part_idx, epoch_idx in enumerate(epoch_idxs):
-            this_epochs = self[epoch_idx] if n_parts > 1 else self
-            # avoid missing event_ids in splits
-            this_epochs.event_id = self.event_id
 
-            _save_split(this_epochs, split_fnames, part_idx, n_parts, fmt, overwrite)
+        def _split_epochs():
+            for part_idx, epoch_idx in enumerate(epoch_idxs):
+                this_epochs = self[epoch_idx] if n_parts > 1 else self
+                # avoid missing event_ids in splits
+                this_epochs.event_id = self.event_id
+                yield this_epochs, part_idx
+
+        # the split sizes are known, so the parts of preloaded data (which do not
+        # need to be read from the raw data) can be written concurrently
+        n_threads = min(_get_io_n_threads(), n_parts) if self.preload else 1
+        if n_threads > 1:
+            logger.debug(f"Writing {n_parts} parts using {n_threads} threads")
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                futures = [
+                    executor.submit(
+                        _save_split,
+                        this_epochs,
+                        split_fnames,
+                        part_idx,
+                        n_parts,
+                        fmt,
+                        overwrite,
+                    )
+                    for this_epochs, part_idx in _split_epochs()
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for this_epochs, part_idx in _split_epochs():
+                _save_split(
+                    this_epochs, split_fnames, part_idx, n_parts, fmt, overwrite
+                )
         return split_fnames
 
     @verbose
@@ -3236,135 +3276,154 @@ def make_metadata(
     start_idx = stop_idx
     metadata[columns[start_idx:]] = None
 
-    # We're all set, let's iterate over all events and fill in in the
-    # respective cells in the metadata. We will subset this to include only
-    # `row_events` later
-    for row_event in events_df.itertuples(name="RowEvent"):
-        row_idx = row_event.Index
-        metadata.loc[row_idx, "event_name"] = id_to_name_map[row_event.id]
-
-        # Determine which events fall into the current time window
-        if start_sample is None and isinstance(tmin, list):
-            # Lower bound is the the current or the closest previpus event with a name
-            # in "tmin"; if there is no such event (e.g., beginning of the recording is
-            # being approached), the upper lower becomes the last event in the
-            # recording.
-            prev_matching_events = events_df.loc[
-                (events_df["sample"] <= row_event.sample)
-                & (events_df["id"].isin([event_id[name] for name in tmin])),
-                :,
-            ]
-            if prev_matching_events.size == 0:
-                # No earlier matching event. Use the current one as the beginning of the
-                # time window. This may occur at the beginning of a recording.
-                window_start_sample = row_event.sample
-            else:
-                # At least one earlier matching event. Use the closest one.
-                window_start_sample = prev_matching_events.iloc[-1]["sample"]
-        elif start_sample is None:
-            # Lower bound is the current event.
-            window_start_sample = row_event.sample
-        else:
-            # Lower bound is determined by tmin.
-            window_start_sample = row_event.sample + start_sample
-
-        if stop_sample is None and isinstance(tmax, list):
-            # Upper bound is the the current or the closest following event with a name
-            # in "tmax"; if there is no such event (e.g., end of the recording is being
-            # approached), the upper bound becomes the last event in the recording.
-            next_matching_events = events_df.loc[
-                (events_df["sample"] >= row_event.sample)
-                & (events_df["id"].isin([event_id[name] for name in tmax])),
-                :,
-            ]
-            if next_matching_events.size == 0:
-                # No matching event after the current one; use the end of the recording
-                # as upper bound. This may occur at the end of a recording.
-                window_stop_sample = events_df["sample"].iloc[-1]
-            else:
-                # At least one matching later event. Use the closest one..
-                window_stop_sample = next_matching_events.iloc[0]["sample"]
-        elif stop_sample is None:
-            # Upper bound: next event of the same type, or the last event (of
-            # any type) if no later event of the same type can be found.
-            next_events = events_df.loc[
-                (events_df["sample"] > row_event.sample),
-                :,
-            ]
-            if next_events.size == 0:
-                # We've reached the last event in the recording.
-                window_stop_sample = row_event.sample
-            elif next_events.loc[next_events["id"] == row_event.id, :].size > 0:
-                # There's still an event of the same type appearing after the
-                # current event. Stop one sample short, we don't want to include that
-                # last event here, but in the next iteration.
-                window_stop_sample = (
-                    next_events.loc[next_events["id"] == row_event.id, :].iloc[0][
-                        "sample"
-                    ]
-                    - 1
-                )
-            else:
-                # There are still events after the current one, but not of the
-                # same type.
-                window_stop_sample = next_events.iloc[-1]["sample"]
-        else:
-            # Upper bound is determined by tmax.
-            window_stop_sample = row_event.sample + stop_sample
-
-        events_in_window = events_df.loc[
-            (events_df["sample"] >= window_start_sample)
-            & (events_df["sample"] <= window_stop_sample),
-            :,
-        ]
-
-        assert not events_in_window.empty
-
-        # Store the metadata
-        for event in events_in_window.itertuples(name="Event"):
-            event_sample = event.sample - row_event.sample
-            event_time = event_sample / sfreq
-            event_time = 0 if np.isclose(event_time, 0) else event_time
-            event_name = id_to_name_map[event.id]
-
-            if not np.isnan(metadata.loc[row_idx, event_name]):
-                # Event already exists in current time window!
-                assert metadata.loc[row_idx, event_name] <= event_time
-
-                if event_name not in keep_last:
-                    continue
-
-            metadata.loc[row_idx, event_name] = event_time
-
-            # Handle keep_first and keep_last event aggregation
-            for event_group_name in keep_first + keep_last:
-                if event_name not in match_event_names(event_id, [event_group_name]):
-                    continue
-
-                if event_group_name in keep_first:
-                    first_last_col = f"first_{event_group_name}"
-                else:
-                    first_last_col = f"last_{event_group_name}"
+    # We're all set, let's fill in the respective cells in the metadata. We will
+    # subset this to include only `row_events` later. All events are processed in
+    # the order of their samples, so that the time windows and the events within
+    # them can be found with binary searches rather than by looping over events.
+    order = np.argsort(events_df["sample"].to_numpy(), kind="stable")
+    samples = events_df["sample"].to_numpy()[order]
+    ids = events_df["id"].to_numpy()[order]
+    names = np.array([id_to_name_map[id_] for id_ in ids], dtype=object)
+    n_events = len(samples)
+    last_sample = events_df["sample"].iloc[-1] if n_events > 0 else 0
+    if n_events > 0:
+        metadata["event_name"] = names[np.argsort(order)]
+
+    # Determine which events fall into the time window of each event
+    if start_sample is None and isinstance(tmin, list):
+        # Lower bound is the the current or the closest previous event with a name
+        # in "tmin"; if there is no such event (e.g., beginning of the recording is
+        # being approached), the lower bound becomes the current event.
+        bounds = samples[np.isin(ids, [event_id[name] for name in tmin])]
+        idx = np.searchsorted(bounds, samples, side="right") - 1
+        window_starts = samples.copy()
+        window_starts[idx >= 0] = bounds[idx[idx >= 0]]
+    elif start_sample is None:
+        # Lower bound is the current event.
+        window_starts = samples
+    else:
+        # Lower bound is determined by tmin.
+        window_starts = samples + start_sample
+
+    if stop_sample is None and isinstance(tmax, list):
+        # Upper bound is the the current or the closest following event with a name
+        # in "tmax"; if there is no such event (e.g., end of the recording is being
+        # approached), the upper bound becomes the last event in the recording.
+        bounds = samples[np.isin(ids, [event_id[name] for name in tmax])]
+        idx = np.searchsorted(bounds, samples, side="left")
+        window_stops = np.full_like(samples, last_sample)
+        window_stops[idx < len(bounds)] = bounds[idx[idx < len(bounds)]]
+    elif stop_sample is None:
+        # Upper bound: next event of the same type (stopping one sample short, we
+        # don't want to include it here), or the last event (of any type) if no
+        # later event of the same type can be found.
+        window_stops = np.full_like(samples, last_sample)
+        for id_ in np.unique(ids):
+            this = np.where(ids == id_)[0]
+            idx = np.searchsorted(samples[this], samples[this], side="right")
+            has_next = idx < len(this)
+            window_stops[this[has_next]] = samples[this[idx[has_next]]] - 1
+    else:
+        # Upper bound is determined by tmax.
+        window_stops = samples + stop_sample
 
-                old_time = metadata.loc[row_idx, event_group_name]
-                if not np.isnan(old_time):
-                    if (event_group_name in keep_first and old_time <= event_time) or (
-                        event_group_name in keep_last and old_time >= event_time
-                    ):
-                        continue
+    assert np.all(
+        np.searchsorted(samples, window_starts, side="left")
+        < np.searchsorted(samples, window_stops, side="right")
+    )
 
-                if event_group_name not in event_id:
-                    # This is an HED. Strip redundant information from the
-                    # event name
-                    name = (
-                        event_name.replace(event_group_name, "")
-                        .replace("//", "/")
-                        .strip("/")
-                    )
-                    metadata.loc[row_idx, first_last_col] = name
-                    del name
+    def _find_in_windows(mask, last=False):
+        """Find the first or last of the masked events in each time window."""
+        these = np.where(mask)[0]
+        these_samples = samples[these]
+        if last:
+            idx = np.searchsorted(these_samples, window_stops, side="right") - 1
+            valid = idx >= 0
+            idx[~valid] = 0
+            valid &= these_samples[idx] >= window_starts
+            # of several events at the same sample, the first one is found
+            idx = np.searchsorted(these_samples, these_samples[idx], side="left")
+        else:
+            idx = np.searchsorted(these_samples, window_starts, side="left")
+            valid = idx < len(these)
+            idx[~valid] = 0
+            valid &= these_samples[idx] <= window_stops
+        pos = these[idx]
+        times = (samples[pos] - samples) / sfreq
+        times[np.isclose(times, 0)] = 0
+        times[~valid] = np.nan
+        return times, pos
+
+    # Event times: the first occurrence within each time window, or the last one
+    # for event names in keep_last
+    times = dict()
+    for event_name in event_id:
+        if event_name in names:
+            times[event_name] = _find_in_windows(
+                names == event_name, last=event_name in keep_last
+            )[0]
+
+    # Handle keep_first and keep_last event aggregation
+    first_last_names = dict()
+    first_positions = dict()
+    for event_group_name in keep_first + keep_last:
+        is_first = event_group_name in keep_first
+        group_times = np.full(n_events, np.nan)
+        group_pos = np.full(n_events, n_events)
+        group_names = np.full(n_events, None, dtype=object)
+        for event_name in match_event_names(event_id, [event_group_name]):
+            if event_name not in names:
+                continue
+            last = not is_first and event_name in keep_last
+            this_times, pos = _find_in_windows(names == event_name, last=last)
+            if not last and event_name in first_positions:
+                # this event name is also a keep_first group sharing its column,
+                # so its first event is skipped if the group was stored earlier
+                this_times[first_positions[event_name] < pos] = np.nan
+            valid = ~np.isnan(this_times)
+            # keep the earliest (or latest) event, and of several events at the
+            # same time the one that occurred first
+            if is_first:
+                better = this_times < group_times
+            else:
+                better = this_times > group_times
+            better |= np.isnan(group_times) | (
+                (this_times == group_times) & (pos < group_pos)
+            )
+            better &= valid
+            group_times[better] = this_times[better]
+            group_pos[better] = pos[better]
+            group_names[better] = event_name
+        if is_first and event_group_name in event_id:
+            first_positions[event_group_name] = group_pos
+        times[event_group_name] = group_times
+
+        if event_group_name not in event_id:
+            # This is an HED. Strip redundant information from the event name
+            first_last_names[event_group_name] = np.array(
+                [
+                    None
+                    if name is None
+                    else name.replace(event_group_name, "")
+                    .replace("//", "/")
+                    .strip("/")
+                    for name in group_names
+                ],
+                dtype=object,
+            )
 
-                metadata.loc[row_idx, event_group_name] = event_time
+    # Store the metadata in the original order of the events
+    orig_order = np.argsort(order)
+    for event_name, this_times in times.items():
+        metadata[event_name] = this_times[orig_order]
+    for event_group_name, group_names in first_last_names.items():
+        if event_group_name in keep_first:
+            first_last_col = f"first_{event_group_name}"
+        else:
+            first_last_col = f"last_{event_group_name}"
+        metadata[first_last_col] = pd.Series(
+            group_names[orig_order], index=metadata.index, dtype=object
+        )
 
     # Only keep rows of interest
     if row_events:
@@ -3603,7 +3662,7 @@ class Epochs(BaseEpochs):
         )
 
     @verbose
-    def _get_epoch_from_raw(self, idx, verbose=None):
+    def _get_epoch_from_raw(self, idx, verbose=None, *, annot_index=None):
         """Load one epoch from disk.
 
         Returns
@@ -3650,9 +3709,15 @@ class Epochs(BaseEpochs):
             reject_start,
             reject_stop,
             self.reject_by_annotation,
+            annot_index=annot_index,
         )
         return data
 
+    def _annotations_index(self):
+        """Index the annotations used to reject the epochs read from disk."""
+        if self._raw is not None and self.reject_by_annotation:
+            return self._raw.annotations._interval_index()
+
 
 @fill_doc
 class EpochsArray(BaseEpochs):
@@ -3732,7 +3797,7 @@ class EpochsArray(BaseEpochs):
         raw_sfreq=None,
         verbose=None,
     ):
-        dtype = np.complex128 if np.any(np.iscomplex(data)) else np.float64
+        dtype = np.complex128 if _has_imag(data) else np.float64
         data = np.asanyarray(data, dtype=dtype)
         if data.ndim != 3:
             raise ValueError(
@@ -4425,7 +4490,7 @@ class EpochsFIF(BaseEpochs):
         self._unsafe_annot_add = unsafe_annot_add
 
     @verbose
-    def _get_epoch_from_raw(self, idx, verbose=None):
+    def _get_epoch_from_raw(self, idx, verbose=None, *, annot_index=None):
         """Load one epoch from disk."""
         # Find the right file and offset to use
         event_samp = self.events[idx, 0]
@@ -4629,13 +4694,24 @@ def _concatenate_epochs(
     if with_data:
         offsets = np.cumsum(offsets)
         for start, stop, epochs in zip(offsets[:-1], offsets[1:], epochs_list):
-            this_data = epochs.get_data(copy=False)
-            if data is None:
-                data = np.empty(
-                    (offsets[-1], len(out.ch_names), len(out.times)),
-                    dtype=this_data.dtype,
+            if epochs.preload or start == stop:
+                parts = [epochs.get_data(copy=False)]
+            else:
+                # read the epochs one by one directly into the buffer rather
+                # than loading all of them first
+                detrend_picks = epochs._detrend_picks
+                annot_index = epochs._annotations_index()
+                parts = (
+                    epochs._load_good_epoch(idx, detrend_picks, annot_index)[np.newaxis]
+                    for idx in range(stop - start)
                 )
-            data[start:stop] = this_data
+            for ii, this_data in enumerate(parts, start):
+                if data is None:
+                    data = np.empty(
+                        (offsets[-1], len(out.ch_names), len(out.times)),
+                        dtype=this_data.dtype,
+                    )
+                data[ii : ii + len(this_data)] = this_data
     return (
         info,
         data,
@@ -375,49 +375,78 @@ def write_events(filename, events, *, overwrite=False, verbose=None):
                 f.write(f"{e[0]:6d} {e[1]:6d} {e[2]:3d}\n")
 
 
-def _find_stim_steps(data, first_samp, pad_start=None, pad_stop=None, merge=0):
-    changed = np.diff(data, axis=1) != 0
-    idx = np.where(np.all(changed, axis=0))[0]
-    if len(idx) == 0:
-        return np.empty((0, 3), dtype="int32")
-
-    pre_step = data[0, idx]
-    idx += 1
-    post_step = data[0, idx]
-    idx += first_samp
-    steps = np.c_[idx, pre_step, post_step]
-
-    if pad_start is not None:
-        v = steps[0, 1]
-        if v != pad_start:
-            steps = np.insert(steps, 0, [0, pad_start, v], axis=0)
-
-    if pad_stop is not None:
-        v = steps[-1, 2]
-        if v != pad_stop:
-            last_idx = len(data[0]) + first_samp
-            steps = np.append(steps, [[last_idx, v, pad_stop]], axis=0)
-
-    if merge != 0:
-        diff = np.diff(steps[:, 0])
-        idx = diff <= abs(merge)
-        if np.any(idx):
-            where = np.where(idx)[0]
-            keep = np.logical_not(idx)
-            if merge > 0:
-                # drop the earlier event
-                steps[where + 1, 1] = steps[where, 1]
-                keep = np.append(keep, True)
-            else:
-                # drop the later event
-                steps[where, 2] = steps[where + 1, 2]
-                keep = np.insert(keep, 0, True)
-
-            is_step = steps[:, 1] != steps[:, 2]
-            keep = np.logical_and(keep, is_step)
-            steps = steps[keep]
-
-    return steps
+# Number of samples of the stim channels that are read at once, so that the
+# data of long recordings never needs to be held in memory in full
+_STIM_BLOCK_SIZE = 1_000_000
+
+
+def _iter_stim_data(raw, picks):
+    """Read the stim channel data in consecutive blocks of samples."""
+    for start in range(0, raw.n_times, _STIM_BLOCK_SIZE):
+        yield raw[picks, start : start + _STIM_BLOCK_SIZE][0]
+
+
+class _StimSteps:
+    """Find the steps of stim channel data provided in consecutive blocks."""
+
+    def __init__(self, first_samp):
+        self.first_samp = first_samp
+        self.n_times = 0
+        self._last = None
+        self._steps = list()
+
+    def add(self, data):
+        """Add the next block of integer data, shape (n_channels, n_times)."""
+        if data.shape[1] == 0:
+            return
+        offset = self.n_times + self.first_samp
+        # carry the last sample of the previous block to find steps that fall
+        # exactly on the block boundary
+        if self._last is not None and np.all(data[:, 0] != self._last):
+            self._steps.append(np.array([[offset, self._last[0], data[0, 0]]]))
+        changed = np.diff(data, axis=1) != 0
+        idx = np.where(np.all(changed, axis=0))[0]
+        self._steps.append(np.c_[idx + 1 + offset, data[0, idx], data[0, idx + 1]])
+        self._last = data[:, -1].copy()
+        self.n_times += data.shape[1]
+
+    def get_steps(self, pad_start=None, pad_stop=None, merge=0):
+        """Get the steps of all the data added so far."""
+        steps = np.concatenate(self._steps) if len(self._steps) else []
+        if len(steps) == 0:
+            return np.empty((0, 3), dtype="int32")
+
+        if pad_start is not None:
+            v = steps[0, 1]
+            if v != pad_start:
+                steps = np.insert(steps, 0, [0, pad_start, v], axis=0)
+
+        if pad_stop is not None:
+            v = steps[-1, 2]
+            if v != pad_stop:
+                last_idx = self.n_times + self.first_samp
+                steps = np.append(steps, [[last_idx, v, pad_stop]], axis=0)
+
+        if merge != 0:
+            diff = np.diff(steps[:, 0])
+            idx = diff <= abs(merge)
+            if np.any(idx):
+                where = np.where(idx)[0]
+                keep = np.logical_not(idx)
+                if merge > 0:
+                    # drop the earlier event
+                    steps[where + 1, 1] = steps[where, 1]
+                    keep = np.append(keep, True)
+                else:
+                    # drop the later event
+                    steps[where, 2] = steps[where + 1, 2]
+                    keep = np.insert(keep, 0, True)
+
+                is_step = steps[:, 1] != steps[:, 2]
+                keep = np.logical_and(keep, is_step)
+                steps = steps[keep]
+
+        return steps
 
 
 def find_stim_steps(raw, pad_start=None, pad_stop=None, merge=0, stim_channel=None):
@@ -463,35 +492,35 @@ def find_stim_steps(raw, pad_start=None, pad_stop=None, merge=0, stim_channel=No
     picks = pick_channels(raw.info["ch_names"], include=stim_channel, ordered=False)
     if len(picks) == 0:
         raise ValueError("No stim channel found to extract event triggers.")
-    data, _ = raw[picks, :]
-    if np.any(data < 0):
+    stim_steps = _StimSteps(raw.first_samp)
+    negative = False
+    for data in _iter_stim_data(raw, picks):
+        negative |= np.any(data < 0)
+        # make sure trig channel is positive
+        stim_steps.add(np.abs(data).astype(np.int64))
+    if negative:
         warn("Trigger channel contains negative values, using absolute value.")
-        data = np.abs(data)  # make sure trig channel is positive
-    data = data.astype(np.int64)
 
-    return _find_stim_steps(
-        data, raw.first_samp, pad_start=pad_start, pad_stop=pad_stop, merge=merge
-    )
+    return stim_steps.get_steps(pad_start=pad_start, pad_stop=pad_stop, merge=merge)
 
 
 @verbose
 def _find_events(
-    data,
-    first_samp,
+    stim_steps,
+    initial_value,
     *,
     verbose=None,
     output="onset",
     consecutive="increasing",
     min_samples=0,
     mask=None,
-    uint_cast=False,
+    negative=False,
     mask_type="and",
     initial_event=False,
     ch_name=None,
 ):
-    """Help find events."""
-    assert data.shape[0] == 1  # data should be only a row vector
-
+    """Help find events from the steps of a single stim channel."""
+    first_samp = stim_steps.first_samp
     if min_samples > 0:
         merge = int(min_samples // 1)
         if merge == min_samples:
@@ -499,20 +528,15 @@ def _find_events(
     else:
         merge = 0
 
-    data = data.astype(np.int64)
-    if uint_cast:
-        data = data.astype(np.uint16).astype(np.int64)
-    if data.min() < 0:
+    if negative:
         warn(
             "Trigger channel contains negative values, using absolute "
             "value. If data were acquired on a Neuromag system with "
             "STI016 active, consider using uint_cast=True to work around "
             "an acquisition bug"
         )
-        data = np.abs(data)  # make sure trig channel is positive
 
-    events = _find_stim_steps(data, first_samp, pad_stop=0, merge=merge)
-    initial_value = data[0, 0]
+    events = stim_steps.get_steps(pad_stop=0, merge=merge)
     if initial_value != 0:
         if initial_event:
             events = np.insert(events, 0, [first_samp, 0, initial_value], axis=0)
@@ -767,19 +791,36 @@ def find_events(
     picks = pick_channels(raw.info["ch_names"], include=stim_channel)
     if len(picks) == 0:
         raise ValueError("No stim channel found to extract event triggers.")
-    data, _ = raw[picks, :]
+
+    # Read the stim channels block by block, carrying the state of each channel
+    # across the block boundaries
+    all_stim_steps = [_StimSteps(raw.first_samp) for _ in picks]
+    negative = np.zeros(len(picks), bool)
+    initial_values = None
+    for data in _iter_stim_data(raw, picks):
+        data = data.astype(np.int64)
+        if uint_cast:
+            data = data.astype(np.uint16).astype(np.int64)
+        negative |= data.min(axis=1) < 0
+        np.abs(data, out=data)  # make sure trig channel is positive
+        if initial_values is None:
+            initial_values = data[:, 0].copy()
+        for stim_steps, d in zip(all_stim_steps, data):
+            stim_steps.add(d[np.newaxis, :])
 
     events_list = []
-    for d, ch_name in zip(data, stim_channel):
+    for stim_steps, initial_value, neg, ch_name in zip(
+        all_stim_steps, initial_values, negative, stim_channel
+    ):
         events = _find_events(
-            d[np.newaxis, :],
-            raw.first_samp,
+            stim_steps,
+            initial_value,
             verbose=verbose,
             output=output,
             consecutive=consecutive,
             min_samples=min_samples,
             mask=mask,
-            uint_cast=uint_cast,
+            negative=neg,
             mask_type=mask_type,
             initial_event=initial_event,
             ch_name=ch_name,
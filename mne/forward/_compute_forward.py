@@ -11,17 +11,21 @@
 # 2) EEG and MEG: forward solutions for inverse methods. Mosher, Leahy, and
 #        Lewis, 1999. Generalized discussion of forward solutions.
 
+import hashlib
+import os
 from copy import deepcopy
+from pathlib import Path
 
 import numpy as np
+from scipy.sparse import csr_array
 
 from .._fiff.constants import FIFF
-from ..bem import _import_openmeeg, _make_openmeeg_geometry
+from ..bem import _bem_apply_solution, _import_openmeeg, _make_openmeeg_geometry
 from ..fixes import bincount, jit
 from ..parallel import parallel_func
 from ..surface import _jit_cross, _project_onto_surface
 from ..transforms import apply_trans, invert_transform
-from ..utils import _check_option, _pl, fill_doc, logger, verbose, warn
+from ..utils import _check_option, _pl, fill_doc, logger, object_hash, verbose, warn
 
 # #############################################################################
 # COIL SPECIFICATION AND FIELD COMPUTATION MATRIX
@@ -98,7 +102,6 @@ def _lin_field_coeff(surf, mult, rmags, cosmags, ws, bins, n_jobs):
     return mult * np.sum(coeffs, axis=0)
 
 
-@jit()
 def _do_lin_field_coeff(bem_rr, tris, tn, ta, rmags, cosmags, ws, bins):
     """Compute field coefficients (parallel-friendly).
 
@@ -129,33 +132,33 @@ def _do_lin_field_coeff(bem_rr, tris, tn, ta, rmags, cosmags, ws, bins):
     coeff : ndarray, shape (n_MEG_sensors, n_BEM_vertices)
         Linear coefficients with effect of each BEM vertex on each sensor (?)
     """
-    coeff = np.zeros((bins[-1] + 1, len(bem_rr)))
-    w_cosmags = ws.reshape(-1, 1) * cosmags
-    diff = rmags.reshape(rmags.shape[0], 1, rmags.shape[1]) - bem_rr
-    den = np.sum(diff * diff, axis=-1)
-    den *= np.sqrt(den)
-    den *= 3
-    for ti in range(len(tris)):
-        tri, tri_nn, tri_area = tris[ti], tn[ti], ta[ti]
-        # Accumulate the coefficients for each triangle node and add to the
-        # corresponding coefficient matrix
-
-        # Simple version (bem_lin_field_coeffs_simple)
-        # The following is equivalent to:
-        # tri_rr = bem_rr[tri]
-        # for j, coil in enumerate(coils['coils']):
-        #     x = func(coil['rmag'], coil['cosmag'],
-        #              tri_rr, tri_nn, tri_area)
-        #     res = np.sum(coil['w'][np.newaxis, :] * x, axis=1)
-        #     coeff[j][tri + off] += mult * res
-
-        c = np.empty((diff.shape[0], tri.shape[0], diff.shape[2]))
-        _jit_cross(c, diff[:, tri], tri_nn)
-        c *= w_cosmags.reshape(w_cosmags.shape[0], 1, w_cosmags.shape[1])
-        for ti in range(3):
-            x = np.sum(c[:, ti], axis=-1)
-            x /= den[:, tri[ti]] / tri_area
-            coeff[:, tri[ti]] += bincount(bins, weights=x, minlength=bins[-1] + 1)
+    # The following is equivalent to looping over triangles and doing:
+    #
+    #     c = np.cross(diff[:, tri], tri_nn) @ (ws * cosmags)
+    #     coeff[:, tri] += bincount(bins, c * tri_area / den[:, tri])
+    #
+    # but as (d x n) . m is linear in the normal n, the triangle normals
+    # weighted by their areas can be summed per vertex first, which avoids the
+    # Python loop over the triangles.
+    nn = np.zeros((len(bem_rr), 3))
+    np.add.at(nn, tris, (ta[:, np.newaxis] * tn)[:, np.newaxis])
+    w_cosmags = ws[:, np.newaxis] * cosmags
+    n_coils = bins[-1] + 1
+    sum_bins = csr_array(
+        (np.ones(len(bins)), (bins, np.arange(len(bins)))), shape=(n_coils, len(bins))
+    )
+    coeff = np.zeros((n_coils, len(bem_rr)))
+    # Only the vertices of these triangles contribute, chunked to save memory
+    used = np.unique(tris)
+    for start in range(0, len(used), 500):
+        idx = used[start : start + 500]
+        diff = rmags[:, np.newaxis] - bem_rr[idx]
+        den = np.sum(diff * diff, axis=-1)
+        den *= np.sqrt(den)
+        den *= 3
+        x = np.einsum("pvk,pk->pv", np.cross(diff, nn[idx]), w_cosmags)
+        x /= den
+        coeff[:, idx] = sum_bins @ x
     return coeff
 
 
@@ -209,7 +212,7 @@ def _bem_specify_coils(bem, coils, coord_frame, mults, n_jobs):
     rmags, cosmags, ws, bins = _triage_coils(coils)
     del coils
     lens = np.cumsum(np.r_[0, [len(s["rr"]) for s in bem["surfs"]]])
-    sol = np.zeros((bins[-1] + 1, bem["solution"].shape[1]))
+    sol = np.zeros((bins[-1] + 1, bem["nsol"]))
 
     lims = np.concatenate([np.arange(0, sol.shape[0], 100), [sol.shape[0]]])
     # Put through the bem (in channel-based chunks to save memory)
@@ -217,11 +220,12 @@ def _bem_specify_coils(bem, coils, coord_frame, mults, n_jobs):
         mask = np.logical_and(bins >= start, bins < stop)
         r, c, w, b = rmags[mask], cosmags[mask], ws[mask], bins[mask] - start
         # Compute coeffs for each surface, one at a time
+        coeff = np.zeros((stop - start, bem["nsol"]))
         for o1, o2, surf, mult in zip(
             lens[:-1], lens[1:], bem["surfs"], bem["field_mult"]
         ):
-            coeff = _lin_field_coeff(surf, mult, r, c, w, b, n_jobs)
-            sol[start:stop] += np.dot(coeff, bem["solution"][o1:o2])
+            coeff[:, o1:o2] = _lin_field_coeff(surf, mult, r, c, w, b, n_jobs)
+        sol[start:stop] = _bem_apply_solution(bem, coeff)
     sol *= mults
     return sol
 
@@ -243,7 +247,7 @@ def _bem_specify_els(bem, els, mults):
     sol : ndarray, shape (n_EEG_sensors, n_BEM_vertices)
         EEG solution
     """
-    sol = np.zeros((len(els), bem["solution"].shape[1]))
+    sol = np.zeros((len(els), bem["nsol"]))
     scalp = bem["surfs"][0]
 
     # Operate on all integration points for all electrodes (in MRI coords)
@@ -253,18 +257,85 @@ def _bem_specify_els(bem, els, mults):
     ws = np.concatenate([el["w"] for el in els])
     tri_weights, tri_idx = _project_onto_surface(rrs, scalp)
     tri_weights *= ws[:, np.newaxis]
+    edges = np.concatenate([[0], np.cumsum([len(el["w"]) for el in els])])
+    if "solution" not in bem:  # only factorized, solve for all weights at once
+        el_idx = np.repeat(np.arange(len(els)), np.diff(edges))
+        weights = np.zeros((len(els), bem["nsol"]))
+        np.add.at(
+            weights,
+            (el_idx[:, np.newaxis], scalp["tris"][tri_idx]),
+            tri_weights,
+        )
+        sol[:] = _bem_apply_solution(bem, weights)
+        sol *= mults
+        return sol
     weights = np.matmul(
         tri_weights[:, np.newaxis], bem["solution"][scalp["tris"][tri_idx]]
     )[:, 0]
     # there are way more vertices than electrodes generally, so let's iterate
     # over the electrodes
-    edges = np.concatenate([[0], np.cumsum([len(el["w"]) for el in els])])
     for ii, (start, stop) in enumerate(zip(edges[:-1], edges[1:])):
         sol[ii] = weights[start:stop].sum(0)
     sol *= mults
     return sol
 
 
+def _bem_specify_sensors(bem, coil_type, coils, mults, n_jobs, cache_dir=None):
+    """Set up for computing the solution at MEG coils or EEG electrodes.
+
+    If ``cache_dir`` is given, the result is stored there keyed by the
+    content of everything it depends on, and reused when available.
+    """
+    fname = None
+    if cache_dir is not None:
+        from .. import __version__
+
+        # hash the (large) solution arrays without making copies of them
+        h = hashlib.sha1()
+        if "solution" in bem:
+            arrays = [bem["solution"]]
+        else:
+            factors = bem["solution_lu"]
+            arrays = list(factors["lu"])
+            if factors["ip"] is not None:
+                arrays += list(factors["ip"]["lu"]) + [factors["ip"]["mult"]]
+        for arr in arrays:
+            h.update(np.ascontiguousarray(arr))
+        key = dict(
+            version=__version__,
+            coil_type=coil_type,
+            coils=coils,
+            mults=mults,
+            head_mri_t=bem["head_mri_t"]["trans"],
+            surfs=[dict(rr=surf["rr"], tris=surf["tris"]) for surf in bem["surfs"]],
+            field_mult=bem["field_mult"],
+            solution=h.hexdigest(),
+        )
+        fname = Path(cache_dir) / f"{coil_type}-{object_hash(key):032x}-fwd.npy"
+        if fname.is_file():
+            logger.info(f"Using cached {coil_type.upper()} solution from {fname}")
+            return np.load(fname)
+    if coil_type == "meg":
+        # MEG field computation matrices for BEM
+        logger.info("\nComposing the field computation matrix...")
+        cf = FIFF.FIFFV_COORD_HEAD
+        # multiply solution by "mults" here for simplicity
+        solution = _bem_specify_coils(bem, coils, cf, mults, n_jobs)
+    else:
+        # Compute solution for EEG sensor
+        logger.info("Setting up for EEG...")
+        solution = _bem_specify_els(bem, coils, mults)
+    if fname is not None:
+        # write to a temporary file first so that concurrent runs never see
+        # partially written files
+        fname_tmp = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+        with open(fname_tmp, "wb") as fid:
+            np.save(fid, solution)
+        os.replace(fname_tmp, fname)
+        logger.info(f"Cached {coil_type.upper()} solution to {fname}")
+    return solution
+
+
 # #############################################################################
 # BEM COMPUTATION
 
@@ -373,8 +444,9 @@ def _bem_inf_fields(rr, rmag, cosmag):
     return x
 
 
-@fill_doc
-def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type):
+def _bem_pot_or_field(
+    rr, mri_rr, mri_Q, coils, solution, bem_rr, coil_type, inf_pots=None
+):
     """Calculate the magnetic field or electric potential forward solution.
 
     The code is very similar between EEG and MEG potentials, so combine them.
@@ -395,9 +467,10 @@ def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_t
         Comes from _bem_specify_coils
     bem_rr : ndarray, shape (n_BEM_vertices, 3)
         3D vertex positions for all surfaces in the BEM
-    %(n_jobs)s
     coil_type : str
         'meg' or 'eeg'
+    inf_pots : ndarray, shape (n_dipoles * 3, n_BEM_vertices) | None
+        Precomputed infinite-medium potentials from _prep_inf_pots.
 
     Returns
     -------
@@ -405,28 +478,17 @@ def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_t
         Forward solution for a set of sensors
     """
     # Both MEG and EEG have the inifinite-medium potentials
-    # This could be just vectorized, but eats too much memory, so instead we
-    # reduce memory by chunking within _do_inf_pots and parallelize, too:
-    parallel, p_fun, n_jobs = parallel_func(_do_inf_pots, n_jobs, max_jobs=len(rr))
-    nas = np.array_split
-    B = np.sum(
-        parallel(
-            p_fun(
-                mri_rr, sr.copy(), np.ascontiguousarray(mri_Q), np.array(sol)
-            )  # copy and contig
-            for sr, sol in zip(nas(bem_rr, n_jobs), nas(solution.T, n_jobs))
-        ),
-        axis=0,
-    )
-    # The copy()s above should make it so the whole objects don't need to be
-    # pickled...
+    if inf_pots is not None:
+        B = inf_pots @ solution.T
+    else:
+        # This could be just vectorized, but eats too much memory, so instead
+        # we reduce memory by chunking within _do_inf_pots
+        B = _do_inf_pots(mri_rr, bem_rr, np.ascontiguousarray(mri_Q), solution.T)
 
     # Only MEG coils are sensitive to the primary current distribution.
     if coil_type == "meg":
         # Primary current contribution (can be calc. in coil/dipole coords)
-        parallel, p_fun, n_jobs = parallel_func(_do_prim_curr, n_jobs)
-        pcc = np.concatenate(parallel(p_fun(r, coils) for r in nas(rr, n_jobs)), axis=0)
-        B += pcc
+        B += _do_prim_curr(rr, coils)
         B *= _MAG_FACTOR
     return B
 
@@ -504,18 +566,65 @@ def _do_inf_pots(mri_rr, bem_rr, mri_Q, sol):
     return B
 
 
+def _do_inf_pots_all(mri_rr, bem_rr, mri_Q):
+    """Calculate the infinite potentials at all BEM vertices using chunks."""
+    v0s = np.empty((len(mri_rr) * 3, len(bem_rr)))
+    for start, stop in _rr_bounds(mri_rr):
+        v0s[3 * start : 3 * stop] = _bem_inf_pots(
+            mri_rr[start:stop], bem_rr, mri_Q
+        ).reshape(-1, len(bem_rr))
+    return v0s
+
+
+# Above this size, the infinite-medium potentials are recomputed per call
+_MAX_INF_POTS_BYTES = 2e9
+
+
+@fill_doc
+def _prep_inf_pots(rr, *, bem, n_jobs):
+    """Precompute the infinite-medium potentials of the sources.
+
+    These only depend on the source positions and the BEM geometry, not on the
+    sensors, so they can be reused when computing forward solutions for many
+    sensor positions (e.g., head positions) with the same sources.
+
+    Parameters
+    ----------
+    rr : ndarray, shape (n_dipoles, 3)
+        3D dipole source positions in head coordinates
+    bem : instance of ConductorModel
+        Boundary Element Model information
+    %(n_jobs)s
+
+    Returns
+    -------
+    inf_pots : ndarray, shape (n_dipoles * 3, n_BEM_vertices) | None
+        The potentials, or None if they cannot (sphere model or OpenMEEG) or
+        should not (too large) be stored.
+    """
+    if bem["is_sphere"] or bem.get("solver", "mne") != "mne":
+        return None
+    bem_rr = np.concatenate([s["rr"] for s in bem["surfs"]])
+    if 3 * len(rr) * len(bem_rr) * 8 > _MAX_INF_POTS_BYTES:
+        return None
+    mri_rr = np.ascontiguousarray(apply_trans(bem["head_mri_t"]["trans"], rr))
+    mri_Q = np.ascontiguousarray(bem["head_mri_t"]["trans"][:3, :3].T)
+    parallel, p_fun, n_jobs = parallel_func(_do_inf_pots_all, n_jobs, max_jobs=len(rr))
+    return np.concatenate(
+        parallel(
+            p_fun(this_rr, bem_rr, mri_Q) for this_rr in np.array_split(mri_rr, n_jobs)
+        )
+    )
+
+
 # #############################################################################
 # SPHERE COMPUTATION
 
 
-def _sphere_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type):
+def _sphere_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, coil_type):
     """Do potential or field for spherical model."""
     fun = _eeg_spherepot_coil if coil_type == "eeg" else _sphere_field
-    parallel, p_fun, n_jobs = parallel_func(fun, n_jobs, max_jobs=len(rr))
-    B = np.concatenate(
-        parallel(p_fun(r, coils, sphere=solution) for r in np.array_split(rr, n_jobs))
-    )
-    return B
+    return fun(rr, coils, sphere=solution)
 
 
 def _sphere_field(rrs, coils, sphere):
@@ -708,7 +817,7 @@ def _compute_mdfv(rrs, rmags, cosmags, ws, bins, too_close):
 
 
 @verbose
-def _prep_field_computation(rr, *, sensors, bem, n_jobs, verbose=None):
+def _prep_field_computation(rr, *, sensors, bem, n_jobs, cache_dir=None, verbose=None):
     """Precompute and store some things that are used for both MEG and EEG.
 
     Calculation includes multiplication factors, coordinate transforms,
@@ -725,6 +834,8 @@ def _prep_field_computation(rr, *, sensors, bem, n_jobs, verbose=None):
         Gets updated here with BEM and sensor information for later forward
         calculations.
     %(n_jobs)s
+    cache_dir : path-like | None
+        Directory to cache the sensor-side BEM solutions in.
     %(verbose)s
     """
     bem_rr = mults = mri_Q = head_mri_t = None
@@ -746,17 +857,9 @@ def _prep_field_computation(rr, *, sensors, bem, n_jobs, verbose=None):
     for coil_type in sensors:
         coils = sensors[coil_type]["defs"]
         if not bem["is_sphere"]:
-            if coil_type == "meg":
-                # MEG field computation matrices for BEM
-                start = "Composing the field computation matrix"
-                logger.info("\n" + start + "...")
-                cf = FIFF.FIFFV_COORD_HEAD
-                # multiply solution by "mults" here for simplicity
-                solution = _bem_specify_coils(bem, coils, cf, mults, n_jobs)
-            else:
-                # Compute solution for EEG sensor
-                logger.info("Setting up for EEG...")
-                solution = _bem_specify_els(bem, coils, mults)
+            solution = _bem_specify_sensors(
+                bem, coil_type, coils, mults, n_jobs, cache_dir
+            )
         else:
             solution = bem
             if coil_type == "eeg":
@@ -786,56 +889,91 @@ def _prep_field_computation(rr, *, sensors, bem, n_jobs, verbose=None):
 @fill_doc
 def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
     """Compute MEG and EEG forward solutions for all sensor types."""
-    Bs = dict()
     # The dipole location and orientation must be transformed to mri coords
     mri_rr = None
     if fwd_data["head_mri_t"] is not None:
         mri_rr = np.ascontiguousarray(apply_trans(fwd_data["head_mri_t"]["trans"], rr))
-    mri_Q, bem_rr, fun = fwd_data["mri_Q"], fwd_data["bem_rr"], fwd_data["fun"]
-    solutions = fwd_data["solutions"]
+    inf_pots = fwd_data.get("inf_pots", None)
+    kwargs = dict(
+        coils={coil_type: sens["defs"] for coil_type, sens in sensors.items()},
+        solutions=fwd_data["solutions"],
+        mri_Q=fwd_data["mri_Q"],
+        bem_rr=fwd_data["bem_rr"],
+        fun=fwd_data["fun"],
+    )
     del fwd_data
-    for coil_type, sens in sensors.items():
-        coils = sens["defs"]
-        compensator = sens.get("compensator", None)
-        post_picks = sens.get("post_picks", None)
-        solution = solutions.get(coil_type, None)
-
-        # Do the actual forward calculation for a list MEG/EEG sensors
-        if not silent:
+    if not silent:
+        for coil_type in sensors:
             logger.info(
                 f"Computing {coil_type.upper()} at {len(rr)} source location{_pl(rr)} "
                 "(free orientations)..."
             )
+    # Each job computes all sensor types for its own subset of the sources,
+    # so the (large) BEM solutions are only sent to each worker once
+    parallel, p_fun, n_jobs = parallel_func(_do_forwards_meeg, n_jobs, max_jobs=len(rr))
+    if n_jobs == 1:
+        Bs = _do_forwards_meeg(rr, mri_rr, inf_pots, **kwargs)
+    else:
+        bounds = np.linspace(0, len(rr), n_jobs + 1).round().astype(int)
+        chunks = parallel(
+            p_fun(
+                rr[start:stop],
+                None if mri_rr is None else mri_rr[start:stop],
+                None if inf_pots is None else inf_pots[3 * start : 3 * stop],
+                **kwargs,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        )
+        Bs = {
+            coil_type: np.concatenate([chunk[coil_type] for chunk in chunks])
+            for coil_type in sensors
+        }
+        del chunks
+    for coil_type, sens in sensors.items():
+        # Compensate if needed (only done for MEG systems w/compensation)
+        compensator = sens.get("compensator", None)
+        post_picks = sens.get("post_picks", None)
+        if compensator is not None:
+            Bs[coil_type] = Bs[coil_type] @ compensator.T
+        if post_picks is not None:
+            Bs[coil_type] = Bs[coil_type][:, post_picks]
+    return Bs
+
+
+def _do_forwards_meeg(rr, mri_rr, inf_pots, *, coils, solutions, mri_Q, bem_rr, fun):
+    """Compute the forward solutions of all sensor types for some sources."""
+    kwargs = dict() if inf_pots is None else dict(inf_pots=inf_pots)
+    Bs = dict()
+    for coil_type, this_coils in coils.items():
         # Calculate forward solution using spherical or BEM model
-        B = fun(
+        Bs[coil_type] = fun(
             rr,
             mri_rr,
             mri_Q,
-            coils=coils,
-            solution=solution,
+            coils=this_coils,
+            solution=solutions.get(coil_type, None),
             bem_rr=bem_rr,
-            n_jobs=n_jobs,
             coil_type=coil_type,
+            **kwargs,
         )
-
-        # Compensate if needed (only done for MEG systems w/compensation)
-        if compensator is not None:
-            B = B @ compensator.T
-        if post_picks is not None:
-            B = B[:, post_picks]
-        Bs[coil_type] = B
     return Bs
 
 
 @verbose
-def _compute_forwards(rr, *, bem, sensors, n_jobs, verbose=None):
+def _compute_forwards(
+    rr, *, bem, sensors, n_jobs, cache_dir=None, inf_pots=None, verbose=None
+):
     """Compute the MEG and EEG forward solutions."""
     # Split calculation into two steps to save (potentially) a lot of time
     # when e.g. dipole fitting
     solver = bem.get("solver", "mne")
     _check_option("solver", solver, ("mne", "openmeeg"))
     if bem["is_sphere"] or solver == "mne":
-        fwd_data = _prep_field_computation(rr, sensors=sensors, bem=bem, n_jobs=n_jobs)
+        fwd_data = _prep_field_computation(
+            rr, sensors=sensors, bem=bem, n_jobs=n_jobs, cache_dir=cache_dir
+        )
+        if inf_pots is not None:
+            fwd_data["inf_pots"] = inf_pots
         Bs = _compute_forwards_meeg(
             rr, sensors=sensors, fwd_data=fwd_data, n_jobs=n_jobs
         )
@@ -603,6 +603,7 @@ def make_forward_solution(
     mindist=0.0,
     ignore_ref=False,
     n_jobs=None,
+    cache_dir=None,
     verbose=None,
 ):
     """Calculate a forward solution for a subject.
@@ -633,6 +634,14 @@ def make_forward_solution(
         option should be True for KIT files, since forward computation
         with reference channels is not currently supported.
     %(n_jobs)s
+    cache_dir : path-like | None
+        Directory used to cache the sensor-side BEM computations, which
+        are the most expensive part of the computation. They only depend
+        on the BEM solution, the sensor definitions and the head-MRI
+        transformation, so they are reused when only the source space
+        changes. If None (default), nothing is cached.
+
+        .. versionadded:: 1.10
     %(verbose)s
 
     Returns
@@ -668,6 +677,9 @@ def make_forward_solution(
     # read the transformation from MRI to HEAD coordinates
     # (could also be HEAD to MRI)
     mri_head_t, trans = _get_trans(trans)
+    if cache_dir is not None:
+        cache_dir = _check_fname(cache_dir, overwrite="read", name="cache_dir")
+        cache_dir.mkdir(parents=True, exist_ok=True)
     if isinstance(bem, ConductorModel):
         bem_extra = "instance of ConductorModel"
     else:
@@ -713,7 +725,9 @@ def make_forward_solution(
     del (src, mri_head_t, trans, info_extra, bem_extra, mindist, meg, eeg, ignore_ref)
 
     # Time to do the heavy lifting: MEG first, then EEG
-    fwds = _compute_forwards(rr, bem=bem, sensors=sensors, n_jobs=n_jobs)
+    fwds = _compute_forwards(
+        rr, bem=bem, sensors=sensors, n_jobs=n_jobs, cache_dir=cache_dir
+    )
 
     # merge forwards
     fwds = {
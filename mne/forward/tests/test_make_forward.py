@@ -44,6 +44,7 @@ from mne.source_space._source_space import (
     write_source_spaces,
 )
 from mne.surface import _get_ico_surface
+from mne.tests.test_bem import _make_nested_surfs
 from mne.transforms import Transform
 from mne.utils import (
     _record_warnings,
@@ -504,6 +505,56 @@ def test_make_forward_solution_discrete(tmp_path, small_surf_src):
     convert_forward_solution(fwd, surf_ori=True)
 
 
+def _make_eeg_bem_inputs():
+    """Make a small EEG problem with a synthetic three-layer BEM."""
+    bem = make_bem_solution(_make_nested_surfs(), verbose=False)
+    info = create_info(["Fz", "Cz", "Pz", "Oz", "C3", "C4"], 1000.0, "eeg")
+    info.set_montage("standard_1020")
+    rr = np.array([[0, 0, 0.04], [0.02, 0, 0.03], [-0.02, 0.01, 0.0]])
+    src = setup_volume_source_space(pos=dict(rr=rr, nn=np.eye(3)[[2, 2, 2]]))
+    return info, dict(trans=None, src=src, bem=bem, meg=False)
+
+
+def test_make_forward_solution_cache(tmp_path):
+    """Test caching the sensor-side BEM computations on disk."""
+    info, kwargs = _make_eeg_bem_inputs()
+    fwd = make_forward_solution(info, **kwargs)
+    cache_dir = tmp_path / "cache"
+    with catch_logging() as log:
+        fwd_write = make_forward_solution(
+            info, cache_dir=cache_dir, verbose=True, **kwargs
+        )
+    assert "Cached EEG solution" in log.getvalue()
+    fnames = list(cache_dir.glob("eeg-*-fwd.npy"))
+    assert len(fnames) == 1
+    with catch_logging() as log:
+        fwd_read = make_forward_solution(
+            info, cache_dir=cache_dir, verbose=True, **kwargs
+        )
+    assert "Using cached EEG solution" in log.getvalue()
+    assert_array_equal(fwd_write["sol"]["data"], fwd["sol"]["data"])
+    assert_array_equal(fwd_read["sol"]["data"], fwd["sol"]["data"])
+    # a different conductor model must not reuse the cached file
+    surfs = _make_nested_surfs()
+    surfs[1]["sigma"] = 0.01
+    bem = make_bem_solution(surfs, verbose=False)
+    make_forward_solution(info, cache_dir=cache_dir, **dict(kwargs, bem=bem))
+    assert len(list(cache_dir.glob("eeg-*-fwd.npy"))) == 2
+
+
+def test_make_forward_solution_n_jobs():
+    """Test that computing in chunks of source points gives the same result."""
+    pytest.importorskip("joblib")
+    info, kwargs = _make_eeg_bem_inputs()
+    fwd = make_forward_solution(info, **kwargs)
+    fwd_par = make_forward_solution(info, n_jobs=2, **kwargs)
+    assert_allclose(fwd_par["sol"]["data"], fwd["sol"]["data"], rtol=1e-12)
+    sphere = make_sphere_model((0.0, 0.0, 0.0), 0.09)
+    fwd = make_forward_solution(info, **dict(kwargs, bem=sphere))
+    fwd_par = make_forward_solution(info, n_jobs=2, **dict(kwargs, bem=sphere))
+    assert_allclose(fwd_par["sol"]["data"], fwd["sol"]["data"], rtol=1e-12)
+
+
 n_src_small = 108  # this is the resulting # of verts in fwd
 
 
@@ -6,7 +6,7 @@
 
 import numpy as np
 
-from ...utils import _check_option, _validate_type, fill_doc, logger, verbose
+from ...utils import _check_option, _has_imag, _validate_type, fill_doc, logger, verbose
 from ..base import BaseRaw
 
 
@@ -54,7 +54,7 @@ class RawArray(BaseRaw):
     def __init__(self, data, info, first_samp=0, copy="auto", verbose=None):
         _validate_type(info, "info", "info")
         _check_option("copy", copy, ("data", "info", "both", "auto", None))
-        dtype = np.complex128 if np.any(np.iscomplex(data)) else np.float64
+        dtype = np.complex128 if _has_imag(data) else np.float64
         orig_data = data
         data = np.asanyarray(orig_data, dtype=dtype)
         if data.ndim != 2:
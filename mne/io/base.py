@@ -5,7 +5,8 @@
 import os
 import shutil
 from collections import defaultdict
-from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, nullcontext
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import timedelta
@@ -31,7 +32,7 @@ from .._fiff.pick import (
     pick_types,
 )
 from .._fiff.proj import ProjMixin, _proj_equal, activate_proj, setup_proj
-from .._fiff.utils import _check_orig_units, _make_split_fnames
+from .._fiff.utils import _check_orig_units, _get_io_n_threads, _make_split_fnames
 from .._fiff.write import (
     _NEXT_FILE_BUFFER,
     _get_split_size,
@@ -254,6 +255,7 @@ class BaseRaw(
         if self._read_comp_grade is not None and len(info["comps"]):
             logger.info("Current compensation grade : %d", self._read_comp_grade)
         self._comp = None
+        self._ica_op = None
         if filenames is None:
             filenames = [None] * len(first_samps)
         self.filenames = list(filenames)
@@ -332,6 +334,8 @@ class BaseRaw(
         grade = int(grade)
         current_comp = self.compensation_grade
         if current_comp != grade:
+            if self._ica_op is not None:
+                _check_preload(self, "changing compensation after applying ICA")
             if self.proj:
                 raise RuntimeError(
                     "Cannot change compensation on data where projectors have been "
@@ -437,6 +441,13 @@ class BaseRaw(
         else:
             mult = projector
         del projector, comp
+        # deferred ICA cleaning is applied last, see ICA.apply
+        ica_offset = None
+        if self._ica_op is not None:
+            ica_op, ica_offset = self._ica_op
+            mult = ica_op if mult is None else ica_op @ mult
+            ica_offset = ica_offset[idx, np.newaxis]
+            del ica_op
 
         if mult is None:
             cals = cals[idx, np.newaxis]
@@ -457,6 +468,7 @@ class BaseRaw(
 
         # read from necessary files
         offset = 0
+        reads = list()
         for fi in np.nonzero(files_used)[0]:
             start_file = self._first_samps[fi]
             # first iteration (only) could start in the middle somewhere
@@ -474,16 +486,38 @@ class BaseRaw(
             this_sl = slice(offset, offset + n_read)
             # reindex back to original file
             orig_idx = _convert_slice(self._read_picks[fi][need_idx])
-            _ReadSegmentFileProtector(self)._read_segment_file(
-                data[:, this_sl],
-                orig_idx,
-                fi,
-                int(start_file),
-                int(stop_file),
-                cals,
-                mult,
+            reads.append(
+                (
+                    data[:, this_sl],
+                    orig_idx,
+                    fi,
+                    int(start_file),
+                    int(stop_file),
+                    cals,
+                    mult,
+                )
             )
             offset += n_read
+        # each file part fills a disjoint slice of data, so parts can be read
+        # concurrently (threads suffice as the work is dominated by I/O)
+        n_threads = min(_get_io_n_threads(), len(reads))
+        if n_threads > 1:
+            logger.debug(f"Reading {len(reads)} file parts using {n_threads} threads")
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                futures = [
+                    executor.submit(
+                        _ReadSegmentFileProtector(self)._read_segment_file, *args
+                    )
+                    for args in reads
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for args in reads:
+                _ReadSegmentFileProtector(self)._read_segment_file(*args)
+        del reads
+        if ica_offset is not None:
+            data += ica_offset
         return data
 
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
@@ -520,7 +554,15 @@ class BaseRaw(
         raise NotImplementedError
 
     def _check_bad_segment(
-        self, start, stop, picks, reject_start, reject_stop, reject_by_annotation=False
+        self,
+        start,
+        stop,
+        picks,
+        reject_start,
+        reject_stop,
+        reject_by_annotation=False,
+        *,
+        annot_index=None,
     ):
         """Check if data segment is bad.
 
@@ -543,6 +585,9 @@ class BaseRaw(
         reject_by_annotation : bool
             Whether to perform rejection based on annotations.
             False by default.
+        annot_index : tuple | None
+            The index of the annotations (see ``Annotations._interval_index``),
+            if already computed for checking many segments.
 
         Returns
         -------
@@ -555,12 +600,19 @@ class BaseRaw(
         if reject_by_annotation and len(self.annotations) > 0:
             annot = self.annotations
             sfreq = self.info["sfreq"]
-            onset = _sync_onset(self, annot.onset)
+            lo, hi = annot._overlap_ranges(
+                *_sync_onset(
+                    self, np.array([reject_start, reject_stop]) / sfreq, inverse=True
+                ),
+                index=annot_index,
+            )
+            onset = _sync_onset(self, annot.onset[lo:hi])
+            duration = annot.duration[lo:hi]
             overlaps = np.where(onset < reject_stop / sfreq)
             overlaps = np.where(
-                onset[overlaps] + annot.duration[overlaps] > reject_start / sfreq
+                onset[overlaps] + duration[overlaps] > reject_start / sfreq
             )
-            for descr in annot.description[overlaps]:
+            for descr in annot.description[lo:hi][overlaps]:
                 if descr.lower().startswith("bad"):
                     return descr
         return self._getitem((picks, slice(start, stop)), return_times=False)
@@ -601,7 +653,7 @@ class BaseRaw(
         self._data = self._read_segment(data_buffer=data_buffer)
         assert len(self._data) == self.info["nchan"]
         self.preload = True
-        self._comp = None  # no longer needed
+        self._comp = self._ica_op = None  # no longer needed
         self.close()
 
     @property
@@ -1711,6 +1763,12 @@ class BaseRaw(
             ``_meg.fif`` (common MEG data), ``_eeg.fif`` (common EEG data),
             or ``_ieeg.fif`` (common intracranial EEG data). You may also
             append an additional ``.gz`` suffix to enable gzip compression.
+            The data are compressed in independent blocks, so that reading
+            a segment of the file only needs to decompress the blocks it
+            spans.
+
+            .. versionchanged:: 1.10
+               Compressed files are written in independent gzip blocks.
         %(picks_all)s
         %(tmin_raw)s
         %(tmax_raw)s
@@ -2101,6 +2159,16 @@ class BaseRaw(
                 preload = False
 
         if preload is False:
+            ica_ops = [r._ica_op for r in all_raws]
+            if any(
+                (op is None) != (ica_ops[0] is None)
+                or (op is not None and not all(map(np.array_equal, op, ica_ops[0])))
+                for op in ica_ops
+            ):
+                raise RuntimeError(
+                    "Cannot concatenate Raw instances without preloading when ICA "
+                    "has been applied differently to them."
+                )
             if self.preload:
                 self._data = None
             self.preload = False
@@ -2110,14 +2178,14 @@ class BaseRaw(
             c_ns = np.cumsum([rr.n_times for rr in ([self] + raws)])
             nsamp = c_ns[-1]
 
+            # allocate the buffer
+            dtype = self._data.dtype if self.preload else self._dtype
+            _data = _allocate_data(preload, (nchan, nsamp), dtype)
             if not self.preload:
-                this_data = self._read_segment()
+                # read the data directly into the buffer
+                self._read_segment(data_buffer=_data[:, 0 : c_ns[0]])
             else:
-                this_data = self._data
-
-            # allocate the buffer
-            _data = _allocate_data(preload, (nchan, nsamp), this_data.dtype)
-            _data[:, 0 : c_ns[0]] = this_data
+                _data[:, 0 : c_ns[0]] = self._data
 
             for ri in range(len(raws)):
                 if not raws[ri].preload:
@@ -2758,36 +2826,39 @@ def _write_raw(raw_fid_writer, fpath, split_naming, overwrite):
     )
     is_next_split, prev_fname = True, None
     output_fnames = []
-    for part_idx in range(0, MAX_N_SPLITS):
-        if not is_next_split:
-            break
-        bids_special_behavior = part_idx == 0 and split_naming == "bids"
-        if bids_special_behavior:
-            reserved_fname = dir_path / split_fnames[0]
-            logger.info(f"Reserving possible split file {reserved_fname.name}")
-            _check_fname(reserved_fname, overwrite)
-            reserved_ctx = _ReservedFilename(reserved_fname)
-            use_fpath = fpath
-        else:
-            reserved_ctx = nullcontext()
-            use_fpath = dir_path / split_fnames[part_idx]
-        next_fname = split_fnames[part_idx + 1]
-        _check_fname(use_fpath, overwrite)
-
-        logger.info(f"Writing {use_fpath}")
-        with start_and_end_file(use_fpath) as fid, reserved_ctx:
-            is_next_split = raw_fid_writer.write(fid, part_idx, prev_fname, next_fname)
-            logger.info(f"Closing {use_fpath}")
-        if bids_special_behavior and is_next_split:
-            logger.info(f"Renaming BIDS split file {fpath.name}")
-            prev_fname = dir_path / split_fnames[0]
-            shutil.move(use_fpath, prev_fname)
-            output_fnames.append(prev_fname)
+    with closing(raw_fid_writer):
+        for part_idx in range(0, MAX_N_SPLITS):
+            if not is_next_split:
+                break
+            bids_special_behavior = part_idx == 0 and split_naming == "bids"
+            if bids_special_behavior:
+                reserved_fname = dir_path / split_fnames[0]
+                logger.info(f"Reserving possible split file {reserved_fname.name}")
+                _check_fname(reserved_fname, overwrite)
+                reserved_ctx = _ReservedFilename(reserved_fname)
+                use_fpath = fpath
+            else:
+                reserved_ctx = nullcontext()
+                use_fpath = dir_path / split_fnames[part_idx]
+            next_fname = split_fnames[part_idx + 1]
+            _check_fname(use_fpath, overwrite)
+
+            logger.info(f"Writing {use_fpath}")
+            with start_and_end_file(use_fpath) as fid, reserved_ctx:
+                is_next_split = raw_fid_writer.write(
+                    fid, part_idx, prev_fname, next_fname
+                )
+                logger.info(f"Closing {use_fpath}")
+            if bids_special_behavior and is_next_split:
+                logger.info(f"Renaming BIDS split file {fpath.name}")
+                prev_fname = dir_path / split_fnames[0]
+                shutil.move(use_fpath, prev_fname)
+                output_fnames.append(prev_fname)
+            else:
+                output_fnames.append(use_fpath)
+            prev_fname = use_fpath
         else:
-            output_fnames.append(use_fpath)
-        prev_fname = use_fpath
-    else:
-        raise RuntimeError(f"Exceeded maximum number of splits ({MAX_N_SPLITS}).")
+            raise RuntimeError(f"Exceeded maximum number of splits ({MAX_N_SPLITS}).")
 
     logger.info("[done]")
     return output_fnames
@@ -2842,9 +2913,24 @@ class _RawFidWriter:
             if cfg.reset_range:
                 self.info["chs"][k]["range"] = 1.0
         self.projector = projector
-        # self.start is the only mutable attribute in this design!
+        # self.start is the only mutable attribute in this design (besides the
+        # buffer reader, which is shared by all split parts)!
         self.start, self.stop = start, stop
         self.cfg = cfg
+        self._reader = None
+
+    def _get_reader(self):
+        if self._reader is None:
+            cals = [ch["cal"] * ch["range"] for ch in self.info["chs"]]
+            self._reader = _RawBufferReader(
+                self.raw, self.picks, self.projector, cals, self.cfg.fmt
+            )
+        return self._reader
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
 
     def write(self, fid, part_idx, prev_fname, next_fname):
         self._check_start_stop_within_bounds()
@@ -2868,9 +2954,8 @@ class _RawFidWriter:
             prev_fname,
             self.cfg.split_size,
             next_fname,
-            self.projector,
             self.cfg.drop_small_buffer,
-            self.cfg.fmt,
+            self._get_reader(),
         )
         end_block(fid, FIFF.FIFFB_MEAS)
         is_next_split = self.start < self.stop
@@ -2899,9 +2984,8 @@ def _write_raw_data(
     prev_fname,
     split_size,
     next_fname,
-    projector,
     drop_small_buffer,
-    fmt,
+    reader,
 ):
     # Start the raw data
     data_kind = "IAS_" if info.get("maxshield", False) else ""
@@ -2949,13 +3033,23 @@ def _write_raw_data(
                     "output buffer_size, will be written as zeroes."
                 )
 
-    cals = [ch["cal"] * ch["range"] for ch in info["chs"]]
+    skips = [
+        do_skips and bool(((first >= sk_onsets) & (last <= sk_ends)).any())
+        for first, last in zip(firsts, lasts)
+    ]
+    buffers = reader.iter_buffers(
+        [
+            (first, int(last))
+            for first, last, skip in zip(firsts, lasts, skips)
+            if not skip
+        ]
+    )
     # Write the blocks
     n_current_skip = 0
     new_start = start
-    for first, last in zip(firsts, lasts):
-        if do_skips:
-            if ((first >= sk_onsets) & (last <= sk_ends)).any():
+    with closing(buffers):
+        for first, last, skip in zip(firsts, lasts, skips):
+            if skip:
                 # Track how many we have
                 n_current_skip += 1
                 continue
@@ -2967,51 +3061,46 @@ def _write_raw_data(
                 # write_nop(fid)
                 # write_nop(fid)
                 n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
-
-        if projector is not None:
-            data = np.dot(projector, data)
-
-        if drop_small_buffer and (first > start) and (len(times) < buffer_size):
-            logger.info("Skipping data chunk due to small buffer ... [done]")
-            break
-        logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
-        _write_raw_buffer(fid, data, cals, fmt)
-
-        pos = fid.tell()
-        this_buff_size_bytes = pos - pos_prev
-        overage = pos - split_size + _NEXT_FILE_BUFFER
-        if overage > 0:
-            # This should occur on the first buffer write of the file, so
-            # we should mention the space required for the meas info
-            raise ValueError(
-                f"buffer size ({this_buff_size_bytes}) is too large for the "
-                f"given split size ({split_size}) "
-                f"by {overage} bytes after writing info ({pos_prev}) and "
-                "leaving enough space "
-                f'for end tags ({_NEXT_FILE_BUFFER}): decrease "buffer_size_sec" '
-                'or increase "split_size".'
-            )
-
-        new_start = last
-        # Split files if necessary, leave some space for next file info
-        # make sure we check to make sure we actually *need* another buffer
-        # with the "and" check
-        if (
-            pos >= split_size - this_buff_size_bytes - _NEXT_FILE_BUFFER
-            and first + buffer_size < stop
-        ):
-            start_block(fid, FIFF.FIFFB_REF)
-            write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
-            write_string(fid, FIFF.FIFF_REF_FILE_NAME, next_fname.name)
-            if info["meas_id"] is not None:
-                write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
-            write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
-            end_block(fid, FIFF.FIFFB_REF)
+            if drop_small_buffer and (first > start) and (last - first < buffer_size):
+                logger.info("Skipping data chunk due to small buffer ... [done]")
+                break
+            write_function, data = next(buffers)
+            logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
+            write_function(fid, FIFF.FIFF_DATA_BUFFER, data)
+
+            pos = fid.tell()
+            this_buff_size_bytes = pos - pos_prev
+            overage = pos - split_size + _NEXT_FILE_BUFFER
+            if overage > 0:
+                # This should occur on the first buffer write of the file, so
+                # we should mention the space required for the meas info
+                raise ValueError(
+                    f"buffer size ({this_buff_size_bytes}) is too large for the "
+                    f"given split size ({split_size}) "
+                    f"by {overage} bytes after writing info ({pos_prev}) and "
+                    "leaving enough space "
+                    f'for end tags ({_NEXT_FILE_BUFFER}): decrease "buffer_size_sec" '
+                    'or increase "split_size".'
+                )
 
-            break
-        pos_prev = pos
+            new_start = last
+            # Split files if necessary, leave some space for next file info
+            # make sure we check to make sure we actually *need* another buffer
+            # with the "and" check
+            if (
+                pos >= split_size - this_buff_size_bytes - _NEXT_FILE_BUFFER
+                and first + buffer_size < stop
+            ):
+                start_block(fid, FIFF.FIFFB_REF)
+                write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
+                write_string(fid, FIFF.FIFF_REF_FILE_NAME, next_fname.name)
+                if info["meas_id"] is not None:
+                    write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
+                write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
+                end_block(fid, FIFF.FIFFB_REF)
+
+                break
+            pos_prev = pos
 
     end_block(fid, data_kind)
     return new_start
@@ -3051,13 +3140,64 @@ def _write_raw_metadata(fid, info, data_type, reset_range, annotations):
         _write_annotations(fid, annotations)
 
 
-def _write_raw_buffer(fid, buf, cals, fmt):
-    """Write raw buffer.
+class _RawBufferReader:
+    """Read, project, and scale the raw buffers to write.
+
+    When using multiple I/O threads, the next buffers are read (and scaled) in
+    the background while the current one is written. Reads that are still
+    pending when a split part ends are kept for the next part.
+    """
+
+    def __init__(self, raw, picks, projector, cals, fmt):
+        self.raw = raw
+        self.picks = picks
+        self.projector = projector
+        self.cals = cals
+        self.fmt = fmt
+        self._n_prefetch = _get_io_n_threads() - 1
+        self._executor = None
+        if self._n_prefetch > 0:
+            self._executor = ThreadPoolExecutor(max_workers=self._n_prefetch)
+        self._futures = dict()
+
+    def _read_buffer(self, first, last):
+        data, times = self.raw[self.picks, first:last]
+        assert len(times) == last - first
+        if self.projector is not None:
+            data = np.dot(self.projector, data)
+        return _scale_raw_buffer(data, self.cals, self.fmt)
+
+    def iter_buffers(self, blocks):
+        """Yield the buffers of a list of (first, last) blocks in order."""
+        if self._executor is None:
+            for first, last in blocks:
+                yield self._read_buffer(first, last)
+            return
+        # reads left over from the previous part that are not needed anymore
+        for block in set(self._futures) - set(blocks):
+            self._futures.pop(block).cancel()
+        for bi, block in enumerate(blocks):
+            for next_block in blocks[bi : bi + self._n_prefetch + 1]:
+                if next_block not in self._futures:
+                    self._futures[next_block] = self._executor.submit(
+                        self._read_buffer, *next_block
+                    )
+            yield self._futures.pop(block).result()
+
+    def close(self):
+        """Cancel the pending reads and stop the threads."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+def _scale_raw_buffer(buf, cals, fmt):
+    """Scale a raw buffer for writing.
 
     Parameters
     ----------
-    fid : file descriptor
-        an open raw data file.
     buf : array
         The buffer to write.
     cals : array
@@ -3066,6 +3206,13 @@ def _write_raw_buffer(fid, buf, cals, fmt):
         'short', 'int', 'single', or 'double' for 16/32 bit int or 32/64 bit
         float for each item. This will be doubled for complex datatypes. Note
         that short and int formats cannot be used for complex data.
+
+    Returns
+    -------
+    write_function : callable
+        The function to use to write the scaled buffer.
+    buf : array
+        The scaled buffer.
     """
     if buf.shape[0] != len(cals):
         raise ValueError("buffer and calibration sizes do not match")
@@ -3097,7 +3244,7 @@ def _write_raw_buffer(fid, buf, cals, fmt):
     buf = buf / np.ravel(cals)[:, None]
     if cast_int:
         buf = buf.astype(np.int32)
-    write_function(fid, FIFF.FIFF_DATA_BUFFER, buf)
+    return write_function, buf
 
 
 def _check_raw_compatibility(raw):
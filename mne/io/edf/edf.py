@@ -338,10 +338,13 @@ def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     # BDF
     if subtype == "bdf":
         ch_data = np.fromfile(fid, dtype=dtype, count=samp * dtype_byte)
-        ch_data = ch_data.reshape(-1, 3).astype(INT32)
-        ch_data = (ch_data[:, 0]) + (ch_data[:, 1] << 8) + (ch_data[:, 2] << 16)
-        # 24th bit determines the sign
-        ch_data[ch_data >= (1 << 23)] -= 1 << 24
+        # Each little-endian 3-byte sample becomes the upper three bytes of an
+        # (unaligned, overlapping) 32-bit integer view, the arithmetic shift
+        # then drops the lowest byte and takes care of the sign (24th bit)
+        buf = np.empty(len(ch_data) + 1, np.uint8)
+        buf[0] = 0
+        buf[1:] = ch_data
+        ch_data = np.ndarray((len(ch_data) // 3,), INT32, buf, strides=(3,)) >> 8
 
     # GDF data and EDF data
     else:
@@ -405,11 +408,11 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
             # loop over selected channels, ci=channel selection
             for ii, ci in enumerate(read_sel):
                 # This now has size (n_chunks_read, n_samp[ci])
-                ch_data = many_chunk[:, ch_offsets[ci] : ch_offsets[ci + 1]].copy()
+                ch_data = many_chunk[:, ch_offsets[ci] : ch_offsets[ci + 1]]
 
                 # annotation channel has to be treated separately
                 if ci in tal_idx:
-                    tal_data.append(ch_data)
+                    tal_data.append(ch_data.copy())
                     continue
 
                 orig_idx = idx_arr[ii]
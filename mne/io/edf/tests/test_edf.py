@@ -191,6 +191,20 @@ def test_bdf_data():
     assert (raw_py.info["chs"][63]["loc"]).any()
 
 
+def test_read_ch_bdf_24bit(tmp_path):
+    """Test decoding of 24-bit BDF samples."""
+    want = np.array([-(2**23), -(2**16) - 1, -256, -1, 0, 1, 255, 2**16, 2**23 - 1])
+    fname = tmp_path / "test.dat"
+    with open(fname, "wb") as fid:
+        fid.write(b"\x01\x02")  # some leading bytes to skip
+        fid.write(want.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].tobytes())
+    with open(fname, "rb") as fid:
+        fid.seek(2)
+        data = _read_ch(fid, "bdf", len(want), 3, "<u1")
+    assert data.dtype == np.dtype("<i4")
+    assert_array_equal(data, want)
+
+
 @testing.requires_testing_data
 def test_bdf_crop_save_stim_channel(tmp_path):
     """Test EDF with various sampling rates."""
@@ -30,7 +30,7 @@ from mne._fiff.pick import _ELECTRODE_CH_TYPES, _FNIRS_CH_TYPES_SPLIT
 from mne._fiff.proj import Projection
 from mne._fiff.utils import _mult_cal_one
 from mne.io import BaseRaw, RawArray, read_raw_fif
-from mne.io.base import _get_scaling
+from mne.io.base import _get_scaling, _RawBufferReader
 from mne.transforms import Transform
 from mne.utils import (
     _import_h5io_funcs,
@@ -1080,3 +1080,58 @@ def test_rescale():
     orig = raw.get_data()
     raw.rescale(4)  # a scalar works
     assert_allclose(raw.get_data(), orig * 4)
+
+
+def test_read_segment_threads(tmp_path, monkeypatch):
+    """Test reading the files of a concatenated raw concurrently."""
+    rng = np.random.default_rng(0)
+    info = create_info(6, 1000.0, ["mag"] * 3 + ["eeg"] * 3)
+    raw = RawArray(rng.standard_normal((6, 1000)) * 1e-6, info)
+    raws = list()
+    for ri in range(3):
+        fname = tmp_path / f"run{ri}_raw.fif"
+        raw.save(fname)
+        raws.append(read_raw_fif(fname))
+    raw_cat = concatenate_raws(raws)
+    assert len(raw_cat.filenames) == 3
+    picks = [0, 2, 3, 4]
+    start, stop = 100, len(raw_cat.times) - 100
+    want = raw_cat.get_data(picks, start, stop)
+    monkeypatch.setenv("MNE_IO_N_THREADS", "3")
+    assert_array_equal(raw_cat.get_data(picks, start, stop), want)
+    raw_cat.load_data()
+    assert_array_equal(raw_cat.get_data(picks, start, stop), want)
+    monkeypatch.setenv("MNE_IO_N_THREADS", "0")
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        raws[1].load_data()
+
+
+@pytest.mark.parametrize("preload", (True, False))
+def test_write_raw_threads(tmp_path, monkeypatch, preload):
+    """Test prefetching raw buffers in the background when writing splits."""
+    rng = np.random.default_rng(0)
+    info = create_info(6, 1000.0, ["mag"] * 3 + ["eeg"] * 3)
+    raw = RawArray(rng.standard_normal((6, 100000)) * 1e-6, info)
+    raw.set_annotations(Annotations([2.0], [1.0], ["bad_acq_skip"]))
+    raw.save(tmp_path / "orig_raw.fif", buffer_size_sec=1.0)
+    raw = read_raw_fif(tmp_path / "orig_raw.fif", preload=preload)
+    kwargs = dict(buffer_size_sec=0.5, split_size="2MB")
+    fnames = raw.save(tmp_path / "serial_raw.fif", **kwargs)
+    assert len(fnames) > 2
+    monkeypatch.setenv("MNE_IO_N_THREADS", "3")
+    # each buffer is read once, also when prefetching across split parts
+    read_blocks = list()
+    read_buffer = _RawBufferReader._read_buffer
+
+    def _read_buffer(self, first, last):
+        read_blocks.append((first, last))
+        return read_buffer(self, first, last)
+
+    monkeypatch.setattr(_RawBufferReader, "_read_buffer", _read_buffer)
+    fnames_threads = raw.save(tmp_path / "thread_raw.fif", **kwargs)
+    assert len(read_blocks) == len(set(read_blocks)) == 198  # 200 minus 1 s skip
+    assert [op.getsize(f) for f in fnames] == [op.getsize(f) for f in fnames_threads]
+    want = read_raw_fif(fnames[0]).get_data()
+    got = read_raw_fif(fnames_threads[0]).get_data()
+    assert_array_equal(got, want)
+    assert_array_equal(got, raw.get_data())
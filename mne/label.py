@@ -19,6 +19,7 @@ from .source_estimate import (
     SourceEstimate,
     VolSourceEstimate,
     _center_of_mass,
+    _prepare_label_extraction,
     extract_label_time_course,
     spatial_src_adjacency,
 )
@@ -2331,10 +2332,16 @@ def read_labels_from_annot(
             len(annot),
             extra=f"for annotation file {fname}",
         )
-        for label_id, label_name, label_rgba in zip(
-            label_ids, label_names, label_rgbas
+        # group the vertices by label id once rather than scanning all
+        # vertices for each label
+        order = np.argsort(annot, kind="stable")
+        sorted_ids = annot[order]
+        starts = np.searchsorted(sorted_ids, label_ids, side="left")
+        stops = np.searchsorted(sorted_ids, label_ids, side="right")
+        for label_name, label_rgba, start, stop in zip(
+            label_names, label_rgbas, starts, stops
         ):
-            vertices = np.where(annot == label_id)[0]
+            vertices = order[start:stop]
             if len(vertices) == 0:
                 # label is not part of cortical surface
                 continue
@@ -2532,16 +2539,40 @@ def labels_to_stc(
             klass = VolSourceEstimate
         else:
             klass = SourceEstimate
-        # Easiest way is to get a dot-able operator and use it
         vertices = [s["vertno"].copy() for s in src]
-        stc = klass(np.eye(sum(len(v) for v in vertices)), vertices, 0, 1, subject)
-        label_op = extract_label_time_course(
-            stc, labels, src=src, mode="mean", allow_empty=True
-        )
-        _check_values_labels(values, label_op.shape[0])
-        rev_op = np.zeros(label_op.shape[::-1])
-        rev_op[np.arange(label_op.shape[1]), np.argmax(label_op, axis=0)] = 1.0
-        data = rev_op @ values
+        n_vertices = sum(len(v) for v in vertices)
+        if kind == "surface":
+            if not isinstance(labels, list):
+                labels = [labels]
+            label_vertidx, _ = _prepare_label_extraction(
+                None, labels, src, "mean", allow_empty=True, use_sparse=False
+            )
+            _check_values_labels(values, len(label_vertidx))
+            # Each vertex gets the value of the smallest label containing it
+            # (i.e., the one with the largest "mean" weight), the first one
+            # in case of ties
+            label_vertidx = [
+                np.array([], int) if v is None else v for v in label_vertidx
+            ]
+            sizes = np.array([len(v) for v in label_vertidx])
+            cols = np.concatenate(label_vertidx)
+            rows = np.repeat(np.arange(len(label_vertidx)), sizes)
+            order = np.lexsort((rows, sizes[rows], cols))
+            cols, rows = cols[order], rows[order]
+            first = np.concatenate([[True], cols[1:] != cols[:-1]])
+            which = np.zeros(n_vertices, int)
+            which[cols[first]] = rows[first]
+            data = values[which]
+        else:
+            # Easiest way is to get a dot-able operator and use it
+            stc = klass(np.eye(n_vertices), vertices, 0, 1, subject)
+            label_op = extract_label_time_course(
+                stc, labels, src=src, mode="mean", allow_empty=True
+            )
+            _check_values_labels(values, label_op.shape[0])
+            rev_op = np.zeros(label_op.shape[::-1])
+            rev_op[np.arange(label_op.shape[1]), np.argmax(label_op, axis=0)] = 1.0
+            data = rev_op @ values
     return klass(data, vertices, tmin, tstep, subject, verbose=verbose)
 
 
@@ -3,8 +3,10 @@
 # Copyright the MNE-Python contributors.
 
 import copy
+import os
 import os.path as op
 import warnings
+from pathlib import Path
 
 import numpy as np
 from scipy import sparse
@@ -34,6 +36,7 @@ from .utils import (
     fill_doc,
     get_subjects_dir,
     logger,
+    object_hash,
     use_log_level,
     verbose,
     warn,
@@ -59,6 +62,9 @@ def compute_source_morph(
     sparse=False,
     src_to=None,
     precompute=False,
+    *,
+    cache_dir=None,
+    n_jobs=None,
     verbose=None,
 ):
     """Create a SourceMorph from one subject to another.
@@ -150,6 +156,20 @@ def compute_source_morph(
         later if desired) for more information.
 
         .. versionadded:: 0.22
+    cache_dir : path-like | None
+        Directory used to cache the surface morph matrices. The matrices are
+        keyed by the subjects, the source and destination vertices, the
+        smoothing and the modification times of the subjects' spherical
+        registration surfaces, so the cache can be shared between pipelines
+        and subjects. Warnings emitted when a matrix was computed are not
+        repeated when it is read from the cache. If None (default), nothing
+        is cached.
+
+        .. versionadded:: 1.10
+    %(n_jobs)s
+        Only used when ``precompute=True``.
+
+        .. versionadded:: 1.10
     %(verbose)s
 
     Returns
@@ -206,6 +226,9 @@ def compute_source_morph(
         raise ValueError("Only surface source estimates can compute a sparse morph.")
 
     subjects_dir = str(get_subjects_dir(subjects_dir, raise_error=True))
+    if cache_dir is not None:
+        cache_dir = _check_fname(cache_dir, overwrite="read", name="cache_dir")
+        cache_dir.mkdir(parents=True, exist_ok=True)
     shape = affine = pre_affine = sdr_morph = morph_mat = None
     vertices_to_surf, vertices_to_vol = list(), list()
 
@@ -287,6 +310,7 @@ def compute_source_morph(
                 smooth=smooth,
                 warn=warn,
                 xhemi=xhemi,
+                cache_dir=cache_dir,
             )
             n_verts = sum(len(v) for v in vertices_to_surf)
             assert morph_mat.shape[0] == n_verts
@@ -314,7 +338,7 @@ def compute_source_morph(
         None,
     )
     if precompute:
-        morph.compute_vol_morph_mat()
+        morph.compute_vol_morph_mat(n_jobs=n_jobs)
     logger.info("[done]")
     return morph
 
@@ -506,7 +530,14 @@ class SourceMorph:
 
     @verbose
     def apply(
-        self, stc_from, output="stc", mri_resolution=False, mri_space=None, verbose=None
+        self,
+        stc_from,
+        output="stc",
+        mri_resolution=False,
+        mri_space=None,
+        *,
+        n_jobs=None,
+        verbose=None,
     ):
         """Morph source space data.
 
@@ -526,6 +557,11 @@ class SourceMorph:
         mri_space : bool | None
             Whether the image to world registration should be in mri space. The
             default (None) is mri_space=mri_resolution.
+        %(n_jobs)s
+            Used to morph volumes in parallel when the sparse volumetric
+            morph matrix has not been computed.
+
+            .. versionadded:: 1.10
         %(verbose)s
 
         Returns
@@ -555,7 +591,7 @@ class SourceMorph:
                 "morph.subject_from "
                 f"must match. ({stc.subject} != {self.subject_from})"
             )
-        out = _apply_morph_data(self, stc)
+        out = _apply_morph_data(self, stc, n_jobs=n_jobs)
         if output != "stc":  # convert to volume
             out = _morphed_stc_as_volume(
                 self,
@@ -567,11 +603,15 @@ class SourceMorph:
         return out
 
     @verbose
-    def compute_vol_morph_mat(self, *, verbose=None):
+    def compute_vol_morph_mat(self, *, n_jobs=None, verbose=None):
         """Compute the sparse matrix representation of the volumetric morph.
 
         Parameters
         ----------
+        %(n_jobs)s
+            The source vertices are split into one chunk per job.
+
+            .. versionadded:: 1.10
         %(verbose)s
 
         Returns
@@ -599,33 +639,22 @@ class SourceMorph:
         if self.affine is None or self.vol_morph_mat is not None:
             return
         logger.info("Computing sparse volumetric morph matrix (will take some time...)")
-        self.vol_morph_mat = self._morph_vols(None, "Vertex")
+        self.vol_morph_mat = self._morph_vols(None, "Vertex", n_jobs=n_jobs)
         return self
 
-    def _morph_vols(self, vols, mesg, subselect=True):
-        from dipy.align.reslice import reslice
-
+    def _morph_vols(self, vols, mesg, subselect=True, n_jobs=None):
         interp = self.src_data["interpolator"].tocsc()[
             :, np.concatenate(self._vol_vertices_from)
         ]
         n_vols = interp.shape[1] if vols is None else vols.shape[1]
-        attrs = ("real", "imag") if np.iscomplexobj(vols) else ("real",)
-        dtype = np.complex128 if len(attrs) == 2 else np.float64
         if vols is None:  # sparse -> sparse mode
-            img_to = (list(), list(), [0])  # data, indices, indptr
             assert subselect
-        else:  # dense -> dense mode
-            img_to = None
         if subselect:
             vol_verts = np.concatenate(self._vol_vertices_to)
         else:
             vol_verts = slice(None)
         # morph data
-        from_affine = np.dot(
-            self.src_data["src_affine_ras"],  # mri_ras_t
-            self.src_data["src_affine_vox"],
-        )  # vox_mri_t
-        from_affine[:3] *= 1000.0
+        from_affine = _vol_from_affine(self.src_data)
         # equivalent of:
         # _resample_from_to(img_real, from_affine,
         #                   (self.pre_affine.codomain_shape,
@@ -649,83 +678,35 @@ class SourceMorph:
             @ self.pre_affine.domain_grid2world,
         )
         resamp_0_1 = resamp_1 @ resamp_0
-        resamp_2 = None
-        for ii in ProgressBar(list(range(n_vols)), mesg=mesg):
-            for attr in attrs:
-                # transform from source space to mri_from resolution/space
-                if vols is None:
-                    img_real = interp[:, [ii]]
-                else:
-                    img_real = interp @ getattr(vols[:, ii], attr)
-                _debug_img(img_real, from_affine, "From", src_shape)
-
-                img_real = resamp_0_1 @ img_real
-                if sparse.issparse(img_real):
-                    img_real = img_real.toarray()
-                img_real = img_real.reshape(self.pre_affine.domain_shape, order="F")
-                if self.sdr_morph is not None:
-                    img_real = self.sdr_morph.transform(img_real)
-                _debug_img(img_real, self.affine, "From-reslice-transform")
-
-                # subselect the correct cube if src_to is provided
-                if self.src_data["to_vox_map"] is not None:
-                    affine = self.affine
-                    to_zooms = np.diag(self.src_data["to_vox_map"][1])[:3]
-                    # There might be some sparse equivalent to this but
-                    # not sure...
-                    if not np.allclose(self.zooms, to_zooms, atol=1e-3):
-                        img_real, affine = reslice(
-                            img_real, self.affine, self.zooms, to_zooms
-                        )
-                    _debug_img(img_real, affine, "From-reslice-transform-src")
-                    if resamp_2 is None:
-                        resamp_2 = _grid_interp(
-                            img_real.shape,
-                            self.src_data["to_vox_map"][0],
-                            np.linalg.inv(affine) @ self.src_data["to_vox_map"][1],
-                        )
-                    # Equivalent to:
-                    # _resample_from_to(
-                    #     img_real, affine, self.src_data['to_vox_map'])
-                    img_real = resamp_2 @ img_real.ravel(order="F")
-                    _debug_img(
-                        img_real,
-                        self.src_data["to_vox_map"][1],
-                        "From-reslice-transform-src-subselect",
-                        self.src_data["to_vox_map"][0],
-                    )
-
-                # This can be used to help debug, but it really should just
-                # show the brain filling the volume:
-                # img_want = np.zeros(np.prod(img_real.shape))
-                # img_want[np.concatenate(self._vol_vertices_to)] = 1.
-                # img_want = np.reshape(
-                #     img_want, self.src_data['src_shape'][::-1], order='F')
-                # _debug_img(img_want, self.src_data['to_vox_map'][1],
-                #            'To mask')
-                # raise RuntimeError('Check')
-
-                # combine real and complex parts
-                img_real = img_real.ravel(order="F")[vol_verts]
-
-                # initialize output
-                if img_to is None and vols is not None:
-                    img_to = np.zeros((img_real.size, n_vols), dtype=dtype)
-
-                if vols is None:
-                    idx = np.where(img_real)[0]
-                    img_to[0].extend(img_real[idx])
-                    img_to[1].extend(idx)
-                    img_to[2].append(img_to[2][-1] + len(idx))
-                else:
-                    if attr == "real":
-                        img_to[:, ii] = img_to[:, ii] + img_real
-                    else:
-                        img_to[:, ii] = img_to[:, ii] + 1j * img_real
-
+        # Each volume (source vertex or time point) is morphed independently,
+        # so split them into one contiguous chunk per job
+        parallel, p_fun, n_jobs = parallel_func(_morph_vols_chunk, n_jobs)
+        if n_jobs == 1:
+            img_to = [
+                _morph_vols_chunk(self, vols, interp, resamp_0_1, vol_verts, mesg)
+            ]
+        else:
+            bounds = np.linspace(0, n_vols, n_jobs + 1).astype(int)
+            sls = [
+                slice(start, stop)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            img_to = parallel(
+                p_fun(
+                    self,
+                    None if vols is None else vols[:, sl],
+                    interp[:, sl] if vols is None else interp,
+                    resamp_0_1,
+                    vol_verts,
+                    None,
+                )
+                for sl in sls
+            )
         if vols is None:
-            img_to = sparse.csc_array(img_to, shape=(len(vol_verts), n_vols)).tocsr()
-
+            img_to = sparse.hstack(img_to, format="csr")
+        else:
+            img_to = np.concatenate(img_to, axis=1)
         return img_to
 
     def __repr__(self):  # noqa: D105
@@ -769,6 +750,111 @@ class SourceMorph:
 _slicers = list()
 
 
+def _vol_from_affine(src_data):
+    """Get the voxel -> MRI (mm) affine of the source volume."""
+    from_affine = np.dot(
+        src_data["src_affine_ras"],  # mri_ras_t
+        src_data["src_affine_vox"],
+    )  # vox_mri_t
+    from_affine[:3] *= 1000.0
+    return from_affine
+
+
+def _morph_vols_chunk(morph, vols, interp, resamp_0_1, vol_verts, mesg):
+    """Morph a chunk of volumes (or of identity volumes if vols is None)."""
+    from dipy.align.reslice import reslice
+
+    n_vols = interp.shape[1] if vols is None else vols.shape[1]
+    attrs = ("real", "imag") if np.iscomplexobj(vols) else ("real",)
+    dtype = np.complex128 if len(attrs) == 2 else np.float64
+    if vols is None:  # sparse -> sparse mode
+        img_to = (list(), list(), [0])  # data, indices, indptr
+    else:  # dense -> dense mode
+        img_to = None
+    from_affine = _vol_from_affine(morph.src_data)
+    src_shape = morph.src_data["src_shape_full"][::-1]
+    resamp_2 = None
+    iter_vols = range(n_vols)
+    if mesg is not None:
+        iter_vols = ProgressBar(list(iter_vols), mesg=mesg)
+    for ii in iter_vols:
+        for attr in attrs:
+            # transform from source space to mri_from resolution/space
+            if vols is None:
+                img_real = interp[:, [ii]]
+            else:
+                img_real = interp @ getattr(vols[:, ii], attr)
+            _debug_img(img_real, from_affine, "From", src_shape)
+
+            img_real = resamp_0_1 @ img_real
+            if sparse.issparse(img_real):
+                img_real = img_real.toarray()
+            img_real = img_real.reshape(morph.pre_affine.domain_shape, order="F")
+            if morph.sdr_morph is not None:
+                img_real = morph.sdr_morph.transform(img_real)
+            _debug_img(img_real, morph.affine, "From-reslice-transform")
+
+            # subselect the correct cube if src_to is provided
+            if morph.src_data["to_vox_map"] is not None:
+                affine = morph.affine
+                to_zooms = np.diag(morph.src_data["to_vox_map"][1])[:3]
+                # There might be some sparse equivalent to this but
+                # not sure...
+                if not np.allclose(morph.zooms, to_zooms, atol=1e-3):
+                    img_real, affine = reslice(
+                        img_real, morph.affine, morph.zooms, to_zooms
+                    )
+                _debug_img(img_real, affine, "From-reslice-transform-src")
+                if resamp_2 is None:
+                    resamp_2 = _grid_interp(
+                        img_real.shape,
+                        morph.src_data["to_vox_map"][0],
+                        np.linalg.inv(affine) @ morph.src_data["to_vox_map"][1],
+                    )
+                # Equivalent to:
+                # _resample_from_to(
+                #     img_real, affine, morph.src_data['to_vox_map'])
+                img_real = resamp_2 @ img_real.ravel(order="F")
+                _debug_img(
+                    img_real,
+                    morph.src_data["to_vox_map"][1],
+                    "From-reslice-transform-src-subselect",
+                    morph.src_data["to_vox_map"][0],
+                )
+
+            # This can be used to help debug, but it really should just
+            # show the brain filling the volume:
+            # img_want = np.zeros(np.prod(img_real.shape))
+            # img_want[np.concatenate(morph._vol_vertices_to)] = 1.
+            # img_want = np.reshape(
+            #     img_want, morph.src_data['src_shape'][::-1], order='F')
+            # _debug_img(img_want, morph.src_data['to_vox_map'][1],
+            #            'To mask')
+            # raise RuntimeError('Check')
+
+            # combine real and complex parts
+            img_real = img_real.ravel(order="F")[vol_verts]
+
+            # initialize output
+            if img_to is None and vols is not None:
+                img_to = np.zeros((img_real.size, n_vols), dtype=dtype)
+
+            if vols is None:
+                idx = np.where(img_real)[0]
+                img_to[0].extend(img_real[idx])
+                img_to[1].extend(idx)
+                img_to[2].append(img_to[2][-1] + len(idx))
+            else:
+                if attr == "real":
+                    img_to[:, ii] = img_to[:, ii] + img_real
+                else:
+                    img_to[:, ii] = img_to[:, ii] + 1j * img_real
+
+    if vols is None:
+        img_to = sparse.csc_array(img_to, shape=(len(vol_verts), n_vols))
+    return img_to
+
+
 def _debug_img(data, affine, title, shape=None):
     # Uncomment these lines for debugging help with volume morph:
     #
@@ -1178,10 +1264,26 @@ def _compute_morph_matrix(
     subjects_dir=None,
     warn=True,
     xhemi=False,
+    cache_dir=None,
 ):
     """Compute morph matrix."""
-    logger.info("Computing morph matrix...")
     subjects_dir = get_subjects_dir(subjects_dir, raise_error=True)
+    fname = None
+    if cache_dir is not None:
+        fname = _morph_matrix_cache_fname(
+            cache_dir,
+            subject_from,
+            subject_to,
+            vertices_from,
+            vertices_to,
+            smooth,
+            subjects_dir,
+            xhemi,
+        )
+        if fname.is_file():
+            logger.info(f"Using cached morph matrix from {fname}")
+            return sparse.csr_array(sparse.load_npz(fname))
+    logger.info("Computing morph matrix...")
 
     tris = _get_subject_sphere_tris(subject_from, subjects_dir)
     maps = read_morph_map(subject_from, subject_to, subjects_dir, xhemi)
@@ -1217,10 +1319,55 @@ def _compute_morph_matrix(
     # this is equivalent to morpher = sparse_block_diag(morpher).tocsr(),
     # but works for xhemi mode
     morpher = sparse.csr_array((data, indices, indptr), shape=shape)
+    if fname is not None:
+        # write to a temporary file first so that concurrent runs never see
+        # partially written files
+        fname_tmp = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+        with open(fname_tmp, "wb") as fid:
+            sparse.save_npz(fid, morpher)
+        os.replace(fname_tmp, fname)
+        logger.info(f"Cached morph matrix to {fname}")
     logger.info("[done]")
     return morpher
 
 
+def _morph_matrix_cache_fname(
+    cache_dir,
+    subject_from,
+    subject_to,
+    vertices_from,
+    vertices_to,
+    smooth,
+    subjects_dir,
+    xhemi,
+):
+    """Get the file name of a cached morph matrix."""
+    from . import __version__
+
+    # The morph maps are derived from (and get cached next to) these surfaces
+    stats = list()
+    for subject in (subject_from, subject_to):
+        for hemi in ("lh", "rh"):
+            for kind in ("reg", "left_right"):
+                fname = subjects_dir / subject / "surf" / f"{hemi}.sphere.{kind}"
+                if fname.is_file():
+                    stat = fname.stat()
+                    stats.append((str(fname), stat.st_mtime_ns, stat.st_size))
+    key = dict(
+        version=__version__,
+        subject_from=subject_from,
+        subject_to=subject_to,
+        vertices_from=[np.asarray(v) for v in vertices_from],
+        vertices_to=[np.asarray(v) for v in vertices_to],
+        smooth=smooth,
+        xhemi=xhemi,
+        surfaces=stats,
+    )
+    return Path(cache_dir) / (
+        f"{subject_from}-{subject_to}-{object_hash(key):032x}-morph.npz"
+    )
+
+
 def _hemi_morph(tris, vertices_to, vertices_from, smooth, maps, warn):
     _validate_type(smooth, (str, None, "int-like"), "smoothing steps")
     if len(vertices_from) == 0:
@@ -1391,13 +1538,9 @@ def _surf_upsampling_mat(idx_from, e, smooth):
     recompute_idx_sum = True  # always compute at least once
     mult = np.zeros(n_tot)
     for k in range(100):  # the maximum allowed
-        # on first iteration it's already restricted, so we need to re-restrict
-        if k != 0 and len(idx) < n_tot:
-            data = data[idx]
-        # smoothing multiplication
-        use_e = e[:, idx] if len(idx) < n_tot else e
-        data = use_e @ data
-        del use_e
+        # smoothing multiplication; after the first iteration, the rows of
+        # data outside idx are all zero, so there is no need to restrict
+        data = (e[:, idx] if k == 0 and len(idx) < n_tot else e) @ data
         # compute row sums + output indices
         if recompute_idx_sum:
             if len(idx) == n_tot:
@@ -1464,7 +1607,7 @@ def _check_vertices_match(v1, v2, name):
 _VOL_MAT_CHECK_RATIO = 1.0
 
 
-def _apply_morph_data(morph, stc_from):
+def _apply_morph_data(morph, stc_from, n_jobs=None):
     """Morph a source estimate from one subject to another."""
     if stc_from.subject is not None and stc_from.subject != morph.subject_from:
         raise ValueError(
@@ -1535,10 +1678,10 @@ def _apply_morph_data(morph, stc_from):
                 "Consider (re-)saving your instance to disk to avoid "
                 "subsequent recomputation."
             )
-            morph.compute_vol_morph_mat()
+            morph.compute_vol_morph_mat(n_jobs=n_jobs)
         if morph.vol_morph_mat is None:
             logger.debug("Using individual volume morph")
-            data[to_sl, :] = morph._morph_vols(data_from[from_sl], mesg)
+            data[to_sl, :] = morph._morph_vols(data_from[from_sl], mesg, n_jobs=n_jobs)
         else:
             logger.debug("Using sparse volume morph matrix")
             data[to_sl, :] = morph.vol_morph_mat @ data_from[from_sl]
@@ -30,6 +30,7 @@ from .._fiff.pick import (
     _contains_ch_type,
     _picks_by_type,
     _picks_to_idx,
+    channel_indices_by_type,
     pick_channels,
     pick_channels_regexp,
     pick_info,
@@ -51,7 +52,7 @@ from .._fiff.write import (
 from ..channels.layout import _find_topomap_coords
 from ..cov import Covariance, compute_whitener
 from ..defaults import _BORDER_DEFAULT, _EXTRAPOLATE_DEFAULT, _INTERPOLATION_DEFAULT
-from ..epochs import BaseEpochs
+from ..epochs import BaseEpochs, _is_good
 from ..evoked import Evoked
 from ..filter import filter_data
 from ..fixes import _safe_svd
@@ -84,6 +85,7 @@ from ..utils import (
     logger,
     pinv,
     repr_html,
+    use_log_level,
     verbose,
     warn,
 )
@@ -603,6 +605,8 @@ class ICA(ContainsMixin):
         flat=None,
         tstep=2.0,
         reject_by_annotation=True,
+        *,
+        max_samples=None,
         verbose=None,
     ):
         """Run the ICA decomposition on raw data.
@@ -658,6 +662,19 @@ class ICA(ContainsMixin):
         %(reject_by_annotation_raw)s
 
             .. versionadded:: 0.14.0
+        max_samples : int | None
+            If an int, `~mne.io.Raw` data are read in chunks of ``tstep``
+            seconds instead of all at once. The pre-whitener and the PCA are
+            computed from the running mean and covariance of all chunks, and
+            only a random subset (a reservoir sample) of at most
+            ``max_samples`` time points is kept in memory for the ICA
+            decomposition itself. This allows fitting long recordings that do
+            not fit in memory. If ``None`` (default), all data are loaded.
+
+            .. note:: This parameter only has an effect if ``inst`` is
+                      `~mne.io.Raw` data.
+
+            .. versionadded:: 1.10
         %(verbose)s
 
         Returns
@@ -671,6 +688,10 @@ class ICA(ContainsMixin):
                 _require_version(mod, f"use method={repr(method)}")
 
         _validate_type(inst, (BaseRaw, BaseEpochs), "inst", "Raw or Epochs")
+        if max_samples is not None:
+            max_samples = _ensure_int(max_samples, "max_samples")
+            if max_samples < 1:
+                raise ValueError(f"max_samples must be >= 1, got {max_samples}")
 
         if np.isclose(inst.info["highpass"], 0.0):
             warn(
@@ -690,7 +711,8 @@ class ICA(ContainsMixin):
             ignored_params = [
                 param_name
                 for param_name, param_val in zip(
-                    ("start", "stop", "reject", "flat"), (start, stop, reject, flat)
+                    ("start", "stop", "reject", "flat", "max_samples"),
+                    (start, stop, reject, flat, max_samples),
                 )
                 if param_val is not None
             ]
@@ -734,7 +756,21 @@ class ICA(ContainsMixin):
                 self.info["comps"] = []
         self.ch_names = self.info["ch_names"]
 
-        if isinstance(inst, BaseRaw):
+        var = None
+        if isinstance(inst, BaseRaw) and max_samples is not None:
+            var = self._fit_raw_chunked(
+                inst,
+                picks,
+                start,
+                stop,
+                decim,
+                reject,
+                flat,
+                tstep,
+                reject_by_annotation,
+                max_samples,
+            )
+        elif isinstance(inst, BaseRaw):
             self._fit_raw(
                 inst,
                 picks,
@@ -752,7 +788,8 @@ class ICA(ContainsMixin):
             self._fit_epochs(inst, picks, decim, verbose)
 
         # sort ICA components by explained variance
-        var = _ica_explained_variance(self, inst)
+        if var is None:
+            var = _ica_explained_variance(self, inst)
         var_ord = var.argsort()[::-1]
         _sort_components(self, var_ord, copy=False)
         t_stop = time()
@@ -816,6 +853,117 @@ class ICA(ContainsMixin):
 
         return self
 
+    def _fit_raw_chunked(
+        self,
+        raw,
+        picks,
+        start,
+        stop,
+        decim,
+        reject,
+        flat,
+        tstep,
+        reject_by_annotation,
+        max_samples,
+    ):
+        """Fit raw data chunk by chunk, keeping only a subsample for ICA."""
+        start, stop = _check_start_stop(raw, start, stop)
+        reject_by_annotation = "omit" if reject_by_annotation else None
+        decim = 1 if decim is None else _ensure_int(decim, "decim")
+        # use the same segments as _reject_data_segments
+        step = int(np.ceil(tstep * raw.info["sfreq"]))
+        n_read = step
+        step = int(np.ceil(step / float(decim)))
+        do_reject = (reject is not None) or (flat is not None)
+        self.reject_ = reject if do_reject else None
+        idx_by_type = channel_indices_by_type(self.info)
+        rng = check_random_state(self.random_state)
+        n_channels = len(picks)
+        reservoir = np.empty((n_channels, max_samples))
+        moments = dict(
+            n=0,
+            ref=None,
+            sum=np.zeros(n_channels),
+            gram=np.zeros((n_channels, n_channels)),
+        )
+        drop_inds = list()
+        pending = np.empty((n_channels, 0))
+        n_seen = n_pending = 0  # samples before and after decimation
+        logger.info(
+            f"    Reading data in chunks of {n_read / raw.info['sfreq']:0.1f} s, "
+            f"keeping up to {max_samples} samples"
+        )
+        for first in range(start, stop, n_read):
+            # this will be a copy
+            data = raw.get_data(
+                picks, first, min(first + n_read, stop), reject_by_annotation
+            )
+            # keep the decimation phase consistent across chunks
+            offset = (-n_seen) % decim
+            n_seen += data.shape[1]
+            data = data[:, offset::decim]
+            if not do_reject:
+                _accumulate_ica_chunk(data, moments, reservoir, rng)
+                continue
+            pending = np.concatenate([pending, data], axis=1)
+            n_use = (pending.shape[1] // step) * step
+            for seg_first in range(0, n_use, step):
+                segment = pending[:, seg_first : seg_first + step]
+                if _is_good(
+                    segment,
+                    self.info["ch_names"],
+                    idx_by_type,
+                    reject,
+                    flat,
+                    ignore_chs=self.info["bads"],
+                ):
+                    _accumulate_ica_chunk(segment, moments, reservoir, rng)
+                else:
+                    seg_first += n_pending
+                    logger.info(
+                        f"Artifact detected in [{seg_first}, {seg_first + step}]"
+                    )
+                    drop_inds.append((seg_first, seg_first + step))
+            pending = pending[:, n_use:]
+            n_pending += n_use
+        if do_reject:
+            self.drop_inds_ = drop_inds
+        n_samples = moments["n"]
+        if n_samples < 2:
+            raise RuntimeError(
+                "No clean segment found. Please consider updating your rejection "
+                "thresholds."
+            )
+        self.n_samples_ = n_samples
+        reservoir = reservoir[:, : min(n_samples, max_samples)]
+
+        # mean and covariance of the channel data
+        mean = moments["sum"] / n_samples
+        cov = moments["gram"] / n_samples - np.outer(mean, mean)
+        mean += moments["ref"]
+        self._compute_pre_whitener_moments(mean, cov)
+        # the pre-whitening (and projection) is linear
+        with use_log_level(False):
+            pre_whitener = self._pre_whiten(np.eye(n_channels))
+        pre_mean = pre_whitener @ mean
+        pre_cov = pre_whitener @ cov @ pre_whitener.T * (n_samples / (n_samples - 1))
+        pca = _PCA(n_components=self._max_pca_components, whiten=True)
+        pca._fit_cov(pre_mean, pre_cov, n_samples)
+        logger.info(
+            f"    Using {reservoir.shape[1]} of {n_samples} samples for the ICA "
+            "decomposition"
+        )
+        data = pca.transform((pre_whitener @ reservoir).T)
+        del reservoir
+        self._fit_ica(data, pca, "raw")
+
+        # variance of the sources over all samples, used for sorting
+        unmixing = self.unmixing_matrix_ @ self.pca_components_[: self.n_components_]
+        var = np.sum(self.mixing_matrix_**2, axis=0) * np.einsum(
+            "ij,jk,ik->i", unmixing, pre_cov, unmixing
+        )
+        return var
+
     def _fit_epochs(self, epochs, picks, decim, verbose):
         """Aux method."""
         if epochs.events.size == 0:
@@ -864,6 +1012,32 @@ class ICA(ContainsMixin):
             assert data.shape[0] == pre_whitener.shape[1]
         self.pre_whitener_ = pre_whitener
 
+    def _compute_pre_whitener_moments(self, mean, cov):
+        """Compute the pre-whitener from the channel mean and covariance."""
+        if self.noise_cov is not None:
+            self._compute_pre_whitener(np.zeros((len(mean), 1)))
+            return
+        proj = np.eye(len(mean))
+        proj = self._do_proj(proj, log_suffix="(pre-whitener computation)")
+        mean = proj @ mean
+        power = np.einsum("ij,jk,ik->i", proj, cov, proj) + mean**2
+
+        def _std(picks_):
+            return np.sqrt(max(power[picks_].mean() - mean[picks_].mean() ** 2, 0))
+
+        # match the standardization in _compute_pre_whitener
+        info = self.info
+        pre_whitener = np.empty([len(mean), 1])
+        for _, picks_ in _picks_by_type(info, ref_meg=False, exclude=[]):
+            pre_whitener[picks_] = _std(picks_)
+        if _contains_ch_type(info, "ref_meg"):
+            picks_ = pick_types(info, ref_meg=True, exclude=[])
+            pre_whitener[picks_] = _std(picks_)
+        if _contains_ch_type(info, "eog"):
+            picks_ = pick_types(info, eog=True, exclude=[])
+            pre_whitener[picks_] = _std(picks_)
+        self.pre_whitener_ = pre_whitener
+
     def _do_proj(self, data, log_suffix=""):
         if self.info is not None and self.info["projs"]:
             proj, nproj, _ = make_projector(
@@ -891,13 +1065,16 @@ class ICA(ContainsMixin):
 
     def _fit(self, data, fit_type):
         """Aux function."""
-        random_state = check_random_state(self.random_state)
-        n_channels, n_samples = data.shape
         self._compute_pre_whitener(data)
         data = self._pre_whiten(data)
 
         pca = _PCA(n_components=self._max_pca_components, whiten=True)
         data = pca.fit_transform(data.T)
+        self._fit_ica(data, pca, fit_type)
+
+    def _fit_ica(self, data, pca, fit_type):
+        """Fit ICA to PCA-whitened data of shape (n_samples, n_pca)."""
+        random_state = check_random_state(self.random_state)
         use_ev = pca.explained_variance_ratio_
         n_pca = self.n_pca_components
         if isinstance(n_pca, float):
@@ -1015,17 +1192,10 @@ class ICA(ContainsMixin):
         self._ica_names = [f"ICA{ii:03d}" for ii in range(self.n_components_)]
 
     def _transform(self, data):
-        """Compute sources from data (operates inplace)."""
-        data = self._pre_whiten(data)
-        if self.pca_mean_ is not None:
-            data -= self.pca_mean_[:, None]
-
-        # Apply unmixing
-        pca_data = np.dot(
-            self.unmixing_matrix_, self.pca_components_[: self.n_components_]
-        )
-        # Apply PCA
-        sources = np.dot(pca_data, data)
+        """Compute sources from data."""
+        unmixing, offset = self._get_sources_operator()
+        sources = unmixing @ data
+        sources += offset[:, np.newaxis]
         return sources
 
     def _transform_raw(self, raw, start, stop, reject_by_annotation=False):
@@ -1034,20 +1204,30 @@ class ICA(ContainsMixin):
             raise RuntimeError("No fit available. Please fit ICA.")
         start, stop = _check_start_stop(raw, start, stop)
         picks = self._get_picks(raw)
-        reject = "omit" if reject_by_annotation else None
-        data = raw.get_data(picks, start, stop, reject)
-        return self._transform(data)
+        if reject_by_annotation:
+            data = raw.get_data(picks, start, stop, "omit")
+            return self._transform(data)
+        # read and transform in blocks so that the sensor data are never
+        # held in memory all at once
+        unmixing, offset = self._get_sources_operator()
+        sources = np.empty((len(unmixing), stop - start))
+        lims = np.concatenate([np.arange(start, stop, 10000), [stop]])
+        for first, last in zip(lims[:-1], lims[1:]):
+            data = raw.get_data(picks, first, last)
+            sources[:, first - start : last - start] = unmixing @ data
+        sources += offset[:, np.newaxis]
+        return sources
 
     def _transform_epochs(self, epochs, concatenate):
         """Aux method."""
         if not hasattr(self, "mixing_matrix_"):
             raise RuntimeError("No fit available. Please fit ICA.")
         picks = self._get_picks(epochs)
-        data = np.hstack(epochs.get_data(picks=picks))
-        sources = self._transform(data)
-        if not concatenate:
-            # Put the data back in 3D
-            sources = np.array(np.split(sources, len(epochs.events), 1))
+        unmixing, offset = self._get_sources_operator()
+        sources = np.matmul(unmixing, epochs.get_data(picks=picks))
+        sources += offset[:, np.newaxis]
+        if concatenate:
+            sources = np.hstack(sources)
         return sources
 
     def _transform_evoked(self, evoked):
@@ -1299,7 +1479,7 @@ class ICA(ContainsMixin):
         out._last_samps = [out.last_samp]
         out.filenames = [None]
         out.preload = True
-        out._projector = None
+        out._projector = out._ica_op = None
         self._export_info(out.info, raw, add_channels)
 
         return out
@@ -2192,7 +2372,10 @@ class ICA(ContainsMixin):
         ----------
         inst : instance of Raw, Epochs or Evoked
             The data to be processed (i.e., cleaned). It will be modified
-            in-place.
+            in-place. Raw data do not need to be preloaded, in which case
+            cleaning is applied whenever the data are read (e.g., by
+            :meth:`~mne.io.Raw.load_data`, :meth:`~mne.io.Raw.save`, or when
+            creating :class:`~mne.Epochs`).
         include : array_like of int
             The indices referring to columns in the ummixing matrix. The
             components to be kept. If ``None`` (default), all components
@@ -2231,6 +2414,9 @@ class ICA(ContainsMixin):
 
         .. versionchanged:: 0.23
             Warn if instance was baseline-corrected.
+
+        .. versionchanged:: 1.10
+            Support Raw data that are not preloaded.
         """
         _validate_type(
             inst, (BaseRaw, BaseEpochs, Evoked), "inst", "Raw, Epochs, or Evoked"
@@ -2281,18 +2467,37 @@ class ICA(ContainsMixin):
 
     def _apply_raw(self, raw, include, exclude, n_pca_components, start, stop):
         """Aux method."""
-        _check_preload(raw, "ica.apply")
-
         start, stop = _check_start_stop(raw, start, stop)
 
         picks = pick_types(
             raw.info, meg=False, include=self.ch_names, exclude="bads", ref_meg=False
         )
-
-        data = raw[picks, start:stop][0]
-        data = self._pick_sources(data, include, exclude, n_pca_components)
-
-        raw[picks, start:stop] = data
+        if not raw.preload and (start, stop) != (0, raw.n_times):
+            raise ValueError(
+                "start and stop can only be used when applying ICA to preloaded "
+                "Raw data."
+            )
+        op, offset = self._get_cleaning_operator(include, exclude, n_pca_components)
+
+        if not raw.preload:
+            # defer cleaning to the point where the data are read, folded into
+            # the compensation and projection operators of the instance
+            full_op = np.eye(raw.info["nchan"])
+            full_op[np.ix_(picks, picks)] = op
+            full_offset = np.zeros(raw.info["nchan"])
+            full_offset[picks] = offset
+            if raw._ica_op is not None:
+                full_offset += full_op @ raw._ica_op[1]
+                full_op = full_op @ raw._ica_op[0]
+            raw._ica_op = (full_op, full_offset)
+            logger.info("    ICA will be applied while reading the data")
+            return raw
+
+        lims = np.concatenate([np.arange(start, stop, 10000), [stop]])
+        for first, last in zip(lims[:-1], lims[1:]):
+            data = op @ raw._data[picks, first:last]
+            data += offset[:, np.newaxis]
+            raw._data[picks, first:last] = data
         return raw
 
     def _apply_epochs(self, epochs, include, exclude, n_pca_components):
@@ -2311,11 +2516,14 @@ class ICA(ContainsMixin):
                 "provide Epochs compatible with 'ica.ch_names'."
             )
 
-        data = np.hstack(epochs.get_data(picks))
-        data = self._pick_sources(data, include, exclude, n_pca_components)
-
-        # restore epochs, channels, tsl order
-        epochs._data[:, picks] = np.array(np.split(data, len(epochs.events), 1))
+        op, offset = self._get_cleaning_operator(include, exclude, n_pca_components)
+        # clean batches of epochs in place
+        n_batch = max(10000 // len(epochs.times), 1)
+        for first in range(0, len(epochs._data), n_batch):
+            sl = slice(first, first + n_batch)
+            data = np.matmul(op, epochs._data[sl][:, picks])
+            data += offset[:, np.newaxis]
+            epochs._data[sl, picks] = data
         epochs.preload = True
 
         return epochs
@@ -2344,12 +2552,66 @@ class ICA(ContainsMixin):
 
     def _pick_sources(self, data, include, exclude, n_pca_components):
         """Aux function."""
+        op, offset = self._get_cleaning_operator(include, exclude, n_pca_components)
+        data = op @ data
+        data += offset[:, np.newaxis]
+        return data
+
+    def _get_operator_cache(self):
+        """Get the cache of application operators for the current fit."""
+        # Fitted attributes can be modified in place, so key on their values
+        arrays = [
+            self.pre_whitener_,
+            self.pca_mean_,
+            self.pca_components_,
+            self.unmixing_matrix_,
+            self.mixing_matrix_,
+        ]
+        if self.info is not None:
+            arrays.extend(p["data"]["data"] for p in self.info["projs"] if p["active"])
+        key = tuple(
+            None if arr is None else hash(np.ascontiguousarray(arr).tobytes())
+            for arr in arrays
+        )
+        cache = getattr(self, "_operator_cache", None)
+        if cache is None or cache[0] != key:
+            cache = self._operator_cache = (key, dict())
+        return cache[1]
+
+    def _get_pre_whitening_operators(self):
+        """Get the pre-whitening operator and its inverse."""
+        n_ch = len(self.ch_names)
+        whitener = self._pre_whiten(np.eye(n_ch))
+        if self.noise_cov is None:  # revert standardization
+            unwhitener = np.diag(self.pre_whitener_[:, 0])
+        else:
+            unwhitener = np.linalg.pinv(self.pre_whitener_, rcond=1e-14)
+        return whitener, unwhitener
+
+    def _get_sources_operator(self):
+        """Get the affine operator that computes sources from data."""
+        cache = self._get_operator_cache()
+        if "sources" not in cache:
+            whitener, _ = self._get_pre_whitening_operators()
+            unmixing = (
+                self.unmixing_matrix_ @ self.pca_components_[: self.n_components_]
+            )
+            offset = np.zeros(self.n_components_)
+            if self.pca_mean_ is not None:
+                offset -= unmixing @ self.pca_mean_
+            cache["sources"] = (unmixing @ whitener, offset)
+        return cache["sources"]
+
+    def _get_cleaning_operator(self, include, exclude, n_pca_components):
+        """Get the affine operator that removes components from data.
+
+        The cleaned data are ``op @ data + offset[:, np.newaxis]``.
+        """
         if n_pca_components is None:
             n_pca_components = self.n_pca_components
-        data = self._pre_whiten(data)
         exclude = self._check_exclude(exclude)
         _n_pca_comp = self._check_n_pca_components(n_pca_components)
-        n_ch, _ = data.shape
+        n_ch = len(self.ch_names)
 
         max_pca_components = self.pca_components_.shape[0]
         if not self.n_components_ <= _n_pca_comp <= max_pca_components:
@@ -2365,10 +2627,6 @@ class ICA(ContainsMixin):
             f"component{_pl(self.n_components_)})"
         )
 
-        # Apply first PCA
-        if self.pca_mean_ is not None:
-            data -= self.pca_mean_[:, None]
-
         sel_keep = np.arange(self.n_components_)
         if include not in (None, []):
             sel_keep = np.unique(include)
@@ -2377,6 +2635,14 @@ class ICA(ContainsMixin):
 
         n_zero = self.n_components_ - len(sel_keep)
         logger.info(f"    Zeroing out {n_zero} ICA component{_pl(n_zero)}")
+        logger.info(
+            f"    Projecting back using {_n_pca_comp} PCA component{_pl(_n_pca_comp)}"
+        )
+
+        cache = self._get_operator_cache()
+        key = (tuple(sel_keep.tolist()), _n_pca_comp)
+        if key in cache:
+            return cache[key]
 
         # Mixing and unmixing should both be shape (self.n_components_, 2),
         # and we need to put these into the upper left part of larger mixing
@@ -2392,9 +2658,6 @@ class ICA(ContainsMixin):
         unmixing[: self.n_components_, : self.n_components_] = self.unmixing_matrix_
         unmixing = np.dot(unmixing, pca_components)
 
-        logger.info(
-            f"    Projecting back using {_n_pca_comp} PCA component{_pl(_n_pca_comp)}"
-        )
         mixing = np.eye(_n_pca_comp)
         mixing[: self.n_components_, : self.n_components_] = self.mixing_matrix_
         mixing = pca_components.T @ mixing
@@ -2405,19 +2668,17 @@ class ICA(ContainsMixin):
             (sel_keep, np.arange(self.n_components_, _n_pca_comp))
         )
         proj_mat = np.dot(mixing[:, sel_keep], unmixing[sel_keep, :])
-        data = np.dot(proj_mat, data)
         assert proj_mat.shape == (n_ch,) * 2
 
+        # pre-whiten, remove the PCA mean, project, add the mean back, and
+        # restore scaling, all as one affine operator
+        whitener, unwhitener = self._get_pre_whitening_operators()
+        op = unwhitener @ proj_mat @ whitener
+        offset = np.zeros(n_ch)
         if self.pca_mean_ is not None:
-            data += self.pca_mean_[:, None]
-
-        # restore scaling
-        if self.noise_cov is None:  # revert standardization
-            data *= self.pre_whitener_
-        else:
-            data = np.linalg.pinv(self.pre_whitener_, rcond=1e-14) @ data
-
-        return data
+            offset = unwhitener @ (self.pca_mean_ - proj_mat @ self.pca_mean_)
+        cache[key] = (op, offset)
+        return op, offset
 
     @verbose
     def save(self, fname, *, overwrite=False, verbose=None):
@@ -2835,6 +3096,28 @@ def _find_sources(sources, target, score_func):
     return scores
 
 
+def _accumulate_ica_chunk(data, moments, reservoir, rng):
+    """Update running moments and the reservoir sample with a chunk of data."""
+    n_new = data.shape[1]
+    if n_new == 0:
+        return
+    if moments["ref"] is None:  # shift to reduce round-off in the covariance
+        moments["ref"] = data.mean(axis=1)
+    shifted = data - moments["ref"][:, np.newaxis]
+    moments["sum"] += shifted.sum(axis=1)
+    moments["gram"] += shifted @ shifted.T
+    # reservoir sampling (Algorithm R) of the time points
+    n_seen = moments["n"]
+    max_samples = reservoir.shape[1]
+    n_fill = min(max(max_samples - n_seen, 0), n_new)
+    reservoir[:, n_seen : n_seen + n_fill] = data[:, :n_fill]
+    if n_fill < n_new:
+        idx = rng.randint(0, n_seen + np.arange(n_fill, n_new) + 1)
+        keep = np.where(idx < max_samples)[0]
+        reservoir[:, idx[keep]] = data[:, n_fill + keep]
+    moments["n"] = n_seen + n_new
+
+
 def _ica_explained_variance(ica, inst, normalize=False):
     """Check variance accounted for by each component in supplied data.
 
@@ -3,6 +3,7 @@
 # Copyright the MNE-Python contributors.
 
 import math
+import time
 
 import numpy as np
 from scipy.special import expit
@@ -156,7 +157,13 @@ def infomax(
 
     BI = block * np.identity(n_features, dtype=np.float64)
     bias = np.zeros((n_features, 1), dtype=np.float64)
-    onesrow = np.ones((1, block), dtype=np.float64)
+    # preallocate the buffers used in the training blocks
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    u = np.empty((block, n_features), dtype=np.float64)
+    y = np.empty_like(u)
+    uu = np.empty((n_features, n_features), dtype=np.float64)
+    uy = np.empty_like(uu)
+    dweights = np.empty_like(uu)
     startweights = weights.copy()
     oldweights = startweights.copy()
     step = 0
@@ -179,6 +186,7 @@ def infomax(
 
     # trainings loop
     olddelta, oldchange = 1.0, 0.0
+    t_step = time.perf_counter()
     while step < max_iter:
         # shuffle data at each step
         permute = random_permutation(n_samples, rng)
@@ -186,15 +194,22 @@ def infomax(
         # ICA training block
         # loop across block samples
         for t in range(0, lastt, block):
-            u = np.dot(data[permute[t : t + block], :], weights)
-            u += np.dot(bias, onesrow).T
+            # operate in place on the preallocated buffers
+            np.take(data, permute[t : t + block], axis=0, out=y)
+            np.matmul(y, weights, out=u)
+            u += bias.T
 
             if extended:
                 # extended ICA update
-                y = np.tanh(u)
-                weights += l_rate * np.dot(
-                    weights, BI - signs[None, :] * np.dot(u.T, y) - np.dot(u.T, u)
-                )
+                np.tanh(u, out=y)
+                np.matmul(u.T, y, out=uy)
+                np.matmul(u.T, u, out=uu)
+                uy *= signs[None, :]
+                np.subtract(BI, uy, out=uy)
+                uy -= uu
+                np.matmul(weights, uy, out=dweights)
+                dweights *= l_rate
+                weights += dweights
                 if use_bias:
                     bias += l_rate * np.reshape(
                         np.sum(y, axis=0, dtype=np.float64) * -2.0, (n_features, 1)
@@ -202,12 +217,18 @@ def infomax(
 
             else:
                 # logistic ICA weights update
-                y = expit(u)
-                weights += l_rate * np.dot(weights, BI + np.dot(u.T, (1.0 - 2.0 * y)))
+                expit(u, out=y)
+                y *= -2.0
+                y += 1.0
+                np.matmul(u.T, y, out=uy)
+                uy += BI
+                np.matmul(weights, uy, out=dweights)
+                dweights *= l_rate
+                weights += dweights
 
                 if use_bias:
                     bias += l_rate * np.reshape(
-                        np.sum((1.0 - 2.0 * y), axis=0, dtype=np.float64),
+                        np.sum(y, axis=0, dtype=np.float64),
                         (n_features, 1),
                     )
 
@@ -264,13 +285,16 @@ def infomax(
                 )
                 angledelta *= degconst
 
+            t_step, t_last = time.perf_counter(), t_step
             if verbose:
                 logger.info(
-                    "step %d - lrate %5f, wchange %8.8f, angledelta %4.1f deg",
+                    "step %d - lrate %5f, wchange %8.8f, angledelta %4.1f deg "
+                    "(%0.3f s)",
                     step,
                     l_rate,
                     change,
                     angledelta,
+                    t_step - t_last,
                 )
 
             # anneal learning rate
@@ -25,6 +25,7 @@ from mne import (
     EpochsArray,
     EvokedArray,
     Info,
+    concatenate_raws,
     create_info,
     make_ad_hoc_cov,
     pick_channels_regexp,
@@ -538,12 +539,6 @@ def test_ica_core(method, n_components, noise_cov, n_pca_components, browser_bac
     sources = raw_sources[:, :][0]
     assert sources.shape[0] == ica.n_components_
 
-    # test preload filter
-    raw3 = raw.copy()
-    raw3.preload = False
-    with pytest.raises(RuntimeError, match="to be loaded"):
-        ica.apply(raw3)
-
     #######################################################################
     # test epochs decomposition
     ica = ICA(noise_cov=noise_cov, n_components=n_components, method=method)
@@ -1173,6 +1168,97 @@ def test_ica_reject_buffer(method):
     _assert_ica_attributes(ica)
 
 
+@pytest.mark.parametrize("cov", (False, True))
+@pytest.mark.parametrize("reject", (None, dict(mag=2.5e-12)))
+def test_ica_max_samples(cov, reject):
+    """Test ICA fitting on chunks of non-preloaded raw data."""
+    raw = read_raw_fif(raw_fname).crop(1.5, stop)
+    picks = pick_types(raw.info, meg="mag", exclude="bads")[::4]
+    noise_cov = read_cov(test_cov_name) if cov else None
+    kwargs = dict(picks=picks, decim=2, reject=reject, tstep=0.5)
+    ica = ICA(n_components=0.999, noise_cov=noise_cov, method="infomax")
+    ica.fit(raw, **kwargs)
+    # if all samples fit in the reservoir, the decomposition is the same
+    ica_chunk = ICA(n_components=0.999, noise_cov=noise_cov, method="infomax")
+    ica_chunk.fit(raw, max_samples=len(raw.times), **kwargs)
+    assert not raw.preload
+    _assert_ica_attributes(ica_chunk)
+    assert ica_chunk.n_samples_ == ica.n_samples_
+    assert ica_chunk.n_components_ == ica.n_components_
+    if reject is not None:
+        assert ica_chunk.drop_inds_ == ica.drop_inds_
+    assert_allclose(ica_chunk.pre_whitener_, ica.pre_whitener_, rtol=1e-7)
+    assert_allclose(ica_chunk.pca_mean_, ica.pca_mean_, rtol=1e-7, atol=1e-10)
+    n_use = ica.n_components_
+    assert_allclose(
+        ica_chunk.pca_explained_variance_[:n_use],
+        ica.pca_explained_variance_[:n_use],
+        rtol=1e-6,
+    )
+    assert_allclose(
+        np.abs(ica_chunk.pca_components_[:n_use]),
+        np.abs(ica.pca_components_[:n_use]),
+        atol=1e-6,
+    )
+    # only a subset of the samples is used for the ICA
+    ica_sub = ICA(n_components=0.999, noise_cov=noise_cov, method="infomax")
+    with catch_logging() as log:
+        ica_sub.fit(raw, max_samples=500, verbose=True, **kwargs)
+    assert f"Using 500 of {ica.n_samples_} samples" in log.getvalue()
+    _assert_ica_attributes(ica_sub)
+    assert ica_sub.n_samples_ == ica.n_samples_
+    assert_allclose(ica_sub.pre_whitener_, ica.pre_whitener_, rtol=1e-7)
+    with pytest.raises(ValueError, match="max_samples must be"):
+        ica_sub.fit(raw, max_samples=0)
+
+
+def test_ica_apply_not_preloaded(tmp_path):
+    """Test applying ICA to raw data that are not preloaded."""
+    raw = read_raw_fif(raw_fname).crop(1.5, stop)
+    picks = pick_types(raw.info, meg="mag", exclude="bads")[::4]
+    ica = ICA(n_components=5, method="infomax", random_state=0)
+    ica.fit(raw, picks=picks)
+    op, offset = ica._get_cleaning_operator(None, [0], None)
+    assert ica._get_cleaning_operator(None, [0], None)[0] is op
+    raw_clean = ica.apply(raw.copy().load_data(), exclude=[0, 1])
+    raw_clean = ica.apply(raw_clean, exclude=[2])
+    raw_lazy = ica.apply(raw.copy(), exclude=[0, 1])
+    raw_lazy = ica.apply(raw_lazy, exclude=[2])
+    assert not raw_lazy.preload
+    atol = 1e-6 * np.abs(raw_clean.get_data(picks)).max()
+    assert_allclose(raw_lazy.get_data(), raw_clean.get_data(), atol=atol)
+    assert_allclose(raw_lazy.get_data(picks[:2]), raw_clean.get_data(picks[:2]))
+    events = make_fixed_length_events(raw, duration=0.5)
+    epochs = Epochs(raw_lazy, events, tmin=0, tmax=0.2, baseline=None, proj=False)
+    epochs_clean = Epochs(
+        raw_clean, events, tmin=0, tmax=0.2, baseline=None, proj=False
+    )
+    assert_allclose(epochs.get_data(), epochs_clean.get_data(), atol=atol)
+    # cleaning is streamed to disk
+    fname = tmp_path / "test_ica_raw.fif"
+    raw_lazy.save(fname)
+    raw_read = read_raw_fif(fname)
+    assert_allclose(raw_read.get_data(picks), raw_clean.get_data(picks), atol=atol)
+    # operations that would change the order of operations are not allowed
+    with pytest.raises(RuntimeError, match="after calling ICA.apply"):
+        raw_lazy.copy().drop_channels(raw.ch_names[0])
+    with pytest.raises(RuntimeError, match="after calling ICA.apply"):
+        raw_lazy.copy().apply_proj()
+    with pytest.raises(RuntimeError, match="applied differently"):
+        concatenate_raws([raw_lazy.copy(), raw.copy()])
+    with pytest.raises(ValueError, match="start and stop can only"):
+        ica.apply(raw.copy(), start=0.5)
+    raw_lazy.load_data()
+    assert raw_lazy._ica_op is None
+    assert_allclose(raw_lazy.get_data(), raw_clean.get_data(), atol=atol)
+    # sources are computed in blocks
+    sources = ica.get_sources(raw).get_data()
+    assert_allclose(sources, ica._transform(raw.get_data(picks)), rtol=1e-10)
+    # the cached operators follow changes to the fit
+    ica.mixing_matrix_[:] = 0.0
+    assert ica._get_cleaning_operator(None, [0], None)[0] is not op
+
+
 @pytest.mark.parametrize("method", ["fastica", "picard"])
 def test_ica_twice(method):
     """Test running ICA twice."""
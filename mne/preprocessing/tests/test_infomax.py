@@ -4,13 +4,15 @@
 
 # Parts of this code are taken from scikit-learn
 
+import re
+
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
 from scipy import stats
 
 from mne.preprocessing.infomax_ import infomax
-from mne.utils import pinv
+from mne.utils import catch_logging, pinv
 
 pytest.importorskip("sklearn")
 
@@ -196,3 +198,45 @@ def _get_pca(rng=None):
     from sklearn.decomposition import PCA
 
     return PCA(n_components=2, whiten=True, svd_solver="randomized", random_state=rng)
+
+
+def test_infomax_step_log():
+    """Test that the per-step log includes the step duration."""
+    rng = np.random.RandomState(0)
+    X = rng.laplace(size=(1000, 3))
+    with catch_logging() as log:
+        infomax(X, max_iter=3, random_state=0, verbose=True)
+    log = [line for line in log.getvalue().splitlines() if line.startswith("step")]
+    assert len(log) == 3
+    for line in log:
+        assert re.search(r"angledelta .* deg \(\d+\.\d{3} s\)$", line) is not None
+
+
+@pytest.mark.parametrize(
+    "extended, want",
+    [
+        (
+            False,
+            [
+                [1.182413377729546, 0.44116842641370585, -0.5186540564877676],
+                [0.8627266379082993, 1.586226968166391, 0.7270405613405976],
+                [-1.0745350965231044, 0.5460191139736257, 4.876330495654348],
+            ],
+        ),
+        (
+            True,
+            [
+                [0.5839248501850554, 0.5061885204155573, -0.6085666675447193],
+                [0.3003769176884654, 0.23063514133283947, 0.4736043064825172],
+                [-0.3463719981878343, 0.4028324271589886, 1.763633416756799],
+            ],
+        ),
+    ],
+)
+def test_infomax_regression(extended, want):
+    """Test that the unmixing matrix for a given random_state is unchanged."""
+    # reference values computed before the update was done in place
+    rng = np.random.RandomState(0)
+    X = rng.laplace(size=(1000, 3)) @ rng.randn(3, 3)
+    weights = infomax(X, max_iter=5, extended=extended, random_state=0)
+    assert_allclose(weights, want, rtol=1e-12)
@@ -33,6 +33,7 @@ from ..forward import (
     convert_forward_solution,
     restrict_forward_to_stc,
 )
+from ..forward._compute_forward import _prep_inf_pots
 from ..io import BaseRaw, RawArray
 from ..source_estimate import _BaseSourceEstimate
 from ..source_space._source_space import (
@@ -837,17 +838,28 @@ def _iter_forward_solutions(
     if eegfwd is not None:
         fwds["eeg"] = eegfwd
     del eegfwd
+    # The source-side (infinite-medium) BEM potentials do not depend on the
+    # head position, so only the coil-side terms need to be recomputed
+    inf_pots = None
+    if forward is None and len(dev_head_ts) > 1:
+        inf_pots = _prep_inf_pots(rr, bem=bem, n_jobs=n_jobs)
+    last_trans = megB = None
     for ti, dev_head_t in enumerate(dev_head_ts):
-        # Could be *slightly* more efficient not to do this N times,
-        # but the cost here is tiny compared to actual fwd calculation
-        logger.info(f"Computing gain matrix for transform #{ti + 1}/{len(dev_head_ts)}")
-        _transform_orig_meg_coils(megcoils, dev_head_t)
-
-        # Make sure our sensors are all outside our BEM
-        coil_rr = np.array([coil["r0"] for coil in megcoils])
-
         # Compute forward
-        if forward is None:
+        if forward is None and np.array_equal(dev_head_t["trans"], last_trans):
+            logger.info(f"Reusing gain matrix for transform #{ti + 1}")
+            megfwd = _to_forward_dict(megB.copy(), megnames)
+        elif forward is None:
+            last_trans = dev_head_t["trans"]
+            # Could be *slightly* more efficient not to do this N times,
+            # but the cost here is tiny compared to actual fwd calculation
+            logger.info(
+                f"Computing gain matrix for transform #{ti + 1}/{len(dev_head_ts)}"
+            )
+            _transform_orig_meg_coils(megcoils, dev_head_t)
+
+            # Make sure our sensors are all outside our BEM
+            coil_rr = np.array([coil["r0"] for coil in megcoils])
             if not bem["is_sphere"]:
                 outside = ~_CheckInside(bem_surf)(coil_rr, n_jobs, verbose=False)
             elif bem.radius is not None:
@@ -860,10 +872,17 @@ def _iter_forward_solutions(
                     f"{np.sum(~outside)} MEG sensors collided with inner skull "
                     f"surface for transform {ti}"
                 )
-            megfwd = _compute_forwards(
-                rr, sensors=sensors, bem=bem, n_jobs=n_jobs, verbose=False
+            # _compute_forwards replaces the definitions with triaged coils
+            sensors["meg"]["defs"] = megcoils
+            megB = _compute_forwards(
+                rr,
+                sensors=sensors,
+                bem=bem,
+                n_jobs=n_jobs,
+                inf_pots=inf_pots,
+                verbose=False,
             )["meg"]
-            megfwd = _to_forward_dict(megfwd, megnames)
+            megfwd = _to_forward_dict(megB, megnames)
         else:
             megfwd = pick_channels_forward(forward, megnames, verbose=False)
         fwds["meg"] = megfwd
@@ -21,6 +21,7 @@ from mne import (
     make_bem_solution,
     make_forward_solution,
     make_sphere_model,
+    pick_channels_forward,
     pick_types,
     read_bem_solution,
     read_cov,
@@ -40,7 +41,7 @@ from mne.chpi import (
     read_head_pos,
 )
 from mne.datasets import testing
-from mne.io import RawArray, read_raw_fif
+from mne.io import RawArray, read_info, read_raw_fif
 from mne.label import Label
 from mne.simulation import (
     add_chpi,
@@ -50,6 +51,7 @@ from mne.simulation import (
     simulate_raw,
     simulate_sparse_stc,
 )
+from mne.simulation.raw import _iter_forward_solutions
 from mne.simulation.source import SourceSimulator
 from mne.source_space._source_space import _compare_source_spaces
 from mne.surface import _get_ico_surface
@@ -188,6 +190,47 @@ def test_iterable():
         simulate_raw(raw.info, stc, trans, src, bem, None)
 
 
+def test_iter_forward_solutions_head_pos():
+    """Test computing forward solutions for several head positions."""
+    info = read_info(raw_fname_short)
+    picks = pick_types(info, meg=True)
+    surf = _get_ico_surface(2)
+    surf["rr"] *= 80  # mm
+    model = _surfaces_to_bem([surf], [FIFF.FIFFV_BEM_SURF_ID_BRAIN], [0.3])
+    bem = make_bem_solution(model)
+    bem_sph = make_sphere_model("auto", "auto", info)
+    src = setup_volume_source_space(
+        pos=dict(rr=np.array([[0.0, 0.0, 0.04], [0.02, 0.01, 0.03]]), nn=np.eye(3)[:2])
+    )
+    dev_head_ts = list()
+    for shift in (0.0, 0.002, 0.002, 0.0):
+        dev_head_t = deepcopy(info["dev_head_t"])
+        dev_head_t["trans"][:3, 3] += shift
+        dev_head_ts.append(dev_head_t)
+    for this_bem in (bem, bem_sph):
+        with catch_logging() as log:
+            fwds = list(
+                _iter_forward_solutions(
+                    info, None, src, this_bem, dev_head_ts, 0.0, None, None, picks
+                )
+            )
+        assert "Reusing gain matrix for transform #3" in log.getvalue()
+        assert len(fwds) == len(dev_head_ts) + 1
+        assert_array_equal(fwds[2]["sol"]["data"], fwds[1]["sol"]["data"])
+        for fwd, dev_head_t in zip(fwds, dev_head_ts):
+            this_info = info.copy()
+            with this_info._unlock():
+                this_info["dev_head_t"] = dev_head_t
+            want = make_forward_solution(
+                this_info, None, src, this_bem, mindist=0.0, eeg=False
+            )
+            want = pick_channels_forward(want, fwd["sol"]["row_names"])
+            assert_allclose(
+                fwd["sol"]["data"], want["sol"]["data"], rtol=1e-7, atol=1e-20
+            )
+        assert not np.allclose(fwds[0]["sol"]["data"], fwds[1]["sol"]["data"])
+
+
 def _make_stc(raw, src):
     """Make a STC."""
     seed = 42
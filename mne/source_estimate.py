@@ -3438,6 +3438,8 @@ def _prepare_label_extraction(stc, labels, src, mode, allow_empty, use_sparse):
     _check_stc_src(stc, src)
     vertno = [s["vertno"] for s in src] if stc is None else stc.vertices
     nvert = [len(vn) for vn in vertno]
+    # vertex number -> index lookups, built once for all labels
+    vertno_idx = dict()
 
     # initialization
     label_flip = list()
@@ -3485,15 +3487,13 @@ def _prepare_label_extraction(stc, labels, src, mode, allow_empty, use_sparse):
             sub_labels = [label]
         this_vertidx = list()
         for slabel in sub_labels:
-            if slabel.hemi == "lh":
-                this_vertices = np.intersect1d(vertno[0], slabel.vertices)
-                vertidx = np.searchsorted(vertno[0], this_vertices)
-            elif slabel.hemi == "rh":
-                this_vertices = np.intersect1d(vertno[1], slabel.vertices)
-                vertidx = nvert[0] + np.searchsorted(vertno[1], this_vertices)
-            else:
+            if slabel.hemi not in ("lh", "rh"):
                 raise ValueError(f"label {label.name} has invalid hemi")
-            this_vertidx.append(vertidx)
+            hi = 0 if slabel.hemi == "lh" else 1
+            if hi not in vertno_idx:
+                vertno_idx[hi] = _vertno_to_idx(vertno[hi])
+            vertidx = _vertices_to_idx(vertno_idx[hi], slabel.vertices)
+            this_vertidx.append(vertidx + (nvert[0] if hi else 0))
 
         # convert it to an array
         this_vertidx = np.concatenate(this_vertidx)
@@ -3532,6 +3532,20 @@ def _prepare_label_extraction(stc, labels, src, mode, allow_empty, use_sparse):
     return label_vertidx, label_flip
 
 
+def _vertno_to_idx(vertno):
+    """Build a lookup table from vertex numbers to their index in vertno."""
+    lut = np.full(vertno.max() + 1 if len(vertno) else 0, -1, int)
+    lut[vertno] = np.arange(len(vertno))
+    return lut
+
+
+def _vertices_to_idx(lut, vertices):
+    """Get the (sorted) indices of the vertices present in a lookup table."""
+    vertices = np.asarray(vertices, int)
+    idx = lut[vertices[vertices < len(lut)]]
+    return np.sort(idx[idx >= 0])
+
+
 def _vol_src_rr(src):
     return apply_trans(
         src[0]["src_mri_t"],
@@ -5,6 +5,7 @@
 # Many of the computations in this code were derived from Matti Hämäläinen's
 # C code.
 
+import heapq
 import os
 import os.path as op
 from copy import deepcopy
@@ -41,7 +42,7 @@ from .._freesurfer import (
     read_freesurfer_lut,
 )
 from ..bem import ConductorModel, read_bem_surfaces
-from ..fixes import _get_img_fdata
+from ..fixes import _get_img_fdata, has_numba, jit
 from ..parallel import parallel_func
 from ..surface import (
     _CheckInside,
@@ -2701,6 +2702,13 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
     (2012) running 6 jobs in parallel, an ico-5 (10242 per hemi) source space
     takes about 10 minutes to compute all distances (``dist_limit = np.inf``).
     With ``dist_limit = 0.007``, computing distances takes about 1 minute.
+    If :mod:`numba` is installed, a compiled Dijkstra search that stops at
+    ``dist_limit`` is used instead, which is much faster for small limits and
+    only ever stores the distances within the limit.
+
+    .. versionchanged:: 1.10
+       Added the compiled search, and distances are no longer stored densely
+       while they are computed.
 
     We recommend computing distances once per source space and then saving
     the source space to disk, as the computed distances will automatically be
@@ -2714,7 +2722,10 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
     if src.kind != "surface":
         raise RuntimeError("Currently all source spaces must be of surface type")
 
-    parallel, p_fun, n_jobs = parallel_func(_do_src_distances, n_jobs)
+    # the compiled version releases the GIL, so the adjacency can be shared
+    parallel, p_fun, n_jobs = parallel_func(
+        _do_src_distances, n_jobs, prefer="threads" if has_numba else None
+    )
     min_dists = list()
     min_idxs = list()
     msg = "patch information" if patch_only else "source space distances"
@@ -2749,13 +2760,8 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
             min_idx = min_idx[midx, range_idx]
             min_dists.append(min_dist)
             min_idxs.append(min_idx)
-            # convert to sparse representation
-            d = np.concatenate([dd[0] for dd in d]).ravel()  # already float32
-            idx = d > 0
-            d = d[idx]
-            i, j = np.meshgrid(s["vertno"], s["vertno"])
-            i = i.ravel()[idx]
-            j = j.ravel()[idx]
+            # convert to sparse representation (already float32)
+            i, j, d = (np.concatenate([dd[0][k] for dd in d]) for k in range(3))
             s["dist"] = csr_array(
                 (d, (i, j)), shape=(s["np"], s["np"]), dtype=np.float32
             )
@@ -2773,29 +2779,102 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
     return src
 
 
-def _do_src_distances(con, vertno, run_inds, limit):
+def _do_src_distances_fallback(con, vertno, run_inds, limit):
     """Compute source space distances in chunks."""
     func = partial(dijkstra, limit=limit)
     chunk_size = 20  # save memory by chunking (only a little slower)
     lims = np.r_[np.arange(0, len(run_inds), chunk_size), len(run_inds)]
-    n_chunks = len(lims) - 1
-    # eventually we want this in float32, so save memory by only storing 32-bit
-    d = np.empty((len(run_inds), len(vertno)), np.float32)
-    min_dist = np.empty((n_chunks, con.shape[0]))
-    min_idx = np.empty((n_chunks, con.shape[0]), np.int32)
+    min_dist = np.full(con.shape[0], np.inf)
+    min_idx = np.zeros(con.shape[0], np.int32)
     range_idx = np.arange(con.shape[0])
-    for li, (l1, l2) in enumerate(zip(lims[:-1], lims[1:])):
+    rows, cols, vals = [np.zeros(0, int)], [np.zeros(0, int)], [np.zeros(0, np.float32)]
+    for l1, l2 in zip(lims[:-1], lims[1:]):
         idx = vertno[run_inds[l1:l2]]
         out = func(con, indices=idx)
         midx = np.argmin(out, axis=0)
-        min_idx[li] = idx[midx]
-        min_dist[li] = out[midx, range_idx]
-        d[l1:l2] = out[:, vertno]
-    midx = np.argmin(min_dist, axis=0)
-    min_dist = min_dist[midx, range_idx]
-    min_idx = min_idx[midx, range_idx]
-    d[d == np.inf] = 0  # scipy will give us np.inf for uncalc. distances
-    return d, min_idx, min_dist
+        mask = out[midx, range_idx] < min_dist
+        min_idx[mask] = idx[midx[mask]]
+        min_dist[mask] = out[midx[mask], range_idx[mask]]
+        # eventually we want this in float32, so save memory by only storing
+        # 32-bit, and keep only the computed (finite) distances
+        out = out[:, vertno].astype(np.float32)
+        out[out == np.inf] = 0
+        ii, jj = np.nonzero(out)
+        rows.append(vertno[jj])
+        cols.append(idx[ii])
+        vals.append(out[ii, jj])
+    rows, cols, vals = (np.concatenate(x) for x in (rows, cols, vals))
+    return (rows, cols, vals), min_idx, min_dist
+
+
+if has_numba:
+
+    @jit(fastmath=False)
+    def _bounded_dijkstra(
+        indptr, indices, weights, sources, used, limit, min_dist, min_idx
+    ):
+        """Run Dijkstra from each source, stopping at the distance limit."""
+        n_vert = len(indptr) - 1
+        dist = np.full(n_vert, np.inf)
+        done = np.zeros(n_vert, np.bool_)
+        touched = np.empty(n_vert, np.int64)
+        rows, cols, vals = [0], [0], [0.0]  # type hints for Numba
+        rows.pop()
+        cols.pop()
+        vals.pop()
+        for source in sources:
+            dist[source] = 0.0
+            touched[0] = source
+            n_touched = 1
+            heap = [(0.0, source)]
+            while len(heap):
+                d, vert = heapq.heappop(heap)
+                if done[vert]:
+                    continue
+                done[vert] = True
+                if d < min_dist[vert]:
+                    min_dist[vert] = d
+                    min_idx[vert] = source
+                if used[vert] and d > 0:
+                    rows.append(vert)
+                    cols.append(source)
+                    vals.append(d)
+                for ii in range(indptr[vert], indptr[vert + 1]):
+                    other = indices[ii]
+                    this_d = d + weights[ii]
+                    if this_d <= limit and this_d < dist[other]:
+                        if dist[other] == np.inf:
+                            touched[n_touched] = other
+                            n_touched += 1
+                        dist[other] = this_d
+                        heapq.heappush(heap, (this_d, other))
+            # only reset what this source reached, keeping the work O(nnz)
+            for ii in range(n_touched):
+                dist[touched[ii]] = np.inf
+                done[touched[ii]] = False
+        return np.array(rows), np.array(cols), np.array(vals)
+
+    def _do_src_distances(con, vertno, run_inds, limit):
+        """Compute source space distances with a bounded Dijkstra."""
+        con = csr_array(con)
+        used = np.zeros(con.shape[0], bool)
+        used[vertno] = True
+        min_dist = np.full(con.shape[0], np.inf)
+        min_idx = np.zeros(con.shape[0], np.int32)
+        rows, cols, vals = _bounded_dijkstra(
+            con.indptr.astype(np.int64),
+            con.indices.astype(np.int64),
+            con.data.astype(np.float64),
+            vertno[run_inds].astype(np.int64),
+            used,
+            limit,
+            min_dist,
+            min_idx,
+        )
+        return (rows, cols, vals.astype(np.float32)), min_idx, min_dist
+
+else:  # pragma: no cover
+    _do_src_distances = _do_src_distances_fallback
 
 
 # XXX this should probably be deprecated because it returns surface Labels,
@@ -13,6 +13,7 @@ from numpy.testing import (
     assert_array_less,
     assert_equal,
 )
+from scipy.sparse.csgraph import dijkstra
 
 import mne
 from mne import (
@@ -41,8 +42,13 @@ from mne.source_space import (
     compute_distance_to_sensors,
     get_decimated_surfaces,
 )
-from mne.source_space._source_space import _compare_source_spaces
-from mne.surface import _accumulate_normals, _triangle_neighbors
+from mne.source_space._source_space import SourceSpaces, _compare_source_spaces
+from mne.surface import (
+    _accumulate_normals,
+    _get_ico_surface,
+    _triangle_neighbors,
+    mesh_dist,
+)
 from mne.utils import _record_warnings, requires_mne, run_subprocess
 
 data_path = testing.data_path(download=False)
@@ -135,6 +141,53 @@ def _read_small_src(remove=True):
     return src
 
 
+@pytest.mark.parametrize("dist_limit", [np.inf, 0.02])
+def test_add_source_space_distances_bounded(dist_limit, numba_conditional):
+    """Test bounded source space distances against a dense Dijkstra."""
+    surf = _get_ico_surface(3)
+    src = list()
+    for id_ in (FIFF.FIFFV_MNE_SURF_LEFT_HEMI, FIFF.FIFFV_MNE_SURF_RIGHT_HEMI):
+        vertno = np.arange(0, len(surf["rr"]), 3)
+        inuse = np.zeros(len(surf["rr"]), int)
+        inuse[vertno] = 1
+        src.append(
+            dict(
+                type="surf",
+                id=id_,
+                rr=surf["rr"] * 0.08,
+                nn=surf["rr"].copy(),
+                tris=surf["tris"].copy(),
+                np=len(surf["rr"]),
+                ntri=len(surf["tris"]),
+                coord_frame=FIFF.FIFFV_COORD_MRI,
+                inuse=inuse,
+                vertno=vertno,
+                nuse=len(vertno),
+                dist=None,
+                dist_limit=None,
+                nearest=None,
+                nearest_dist=None,
+                pinfo=None,
+                patch_inds=None,
+            )
+        )
+    src = SourceSpaces(src)
+    add_source_space_distances(src, dist_limit=dist_limit)
+    for s in src:
+        all_dist = dijkstra(mesh_dist(s["tris"], s["rr"]), indices=s["vertno"])
+        want = all_dist[:, s["vertno"]]
+        want[want > dist_limit] = 0
+        got = s["dist"][s["vertno"]][:, s["vertno"]].toarray()
+        assert_allclose(got, want, rtol=1e-6)
+        assert s["dist"].nnz == np.count_nonzero(want)
+        if dist_limit == np.inf:
+            assert_allclose(s["nearest_dist"], all_dist.min(0), rtol=1e-7)
+            assert_array_equal(s["nearest"], s["vertno"][all_dist.argmin(0)])
+            assert s["nearest"].dtype == np.int32
+        else:
+            assert s["nearest"] is None
+
+
 def test_add_patch_info(monkeypatch):
     """Test adding patch info to source space."""
     # let's setup a small source space
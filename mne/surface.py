@@ -387,18 +387,11 @@ def _accumulate_normals(tris, tri_nn, npts):
 
 def _triangle_neighbors(tris, npts):
     """Efficiently compute vertex neighboring triangles."""
-    # this code replaces the following, but is faster (vectorized):
-    # neighbor_tri = [list() for _ in range(npts)]
-    # for ti, tri in enumerate(tris):
-    #     for t in tri:
-    #         neighbor_tri[t].append(ti)
-    rows = tris.ravel()
-    cols = np.repeat(np.arange(len(tris)), 3)
-    data = np.ones(len(cols))
-    csr = coo_array((data, (rows, cols)), shape=(npts, len(tris))).tocsr()
-    neighbor_tri = [
-        csr.indices[start:stop] for start, stop in zip(csr.indptr[:-1], csr.indptr[1:])
-    ]
+    tri_idx, indptr = _vertex_triangles(_hashable_ndarray(tris))
+    # read-only views into the cached arrays
+    neighbor_tri = [tri_idx[start:stop] for start, stop in zip(indptr[:-1], indptr[1:])]
+    # vertices that are not part of any triangle
+    neighbor_tri += [np.array([], int) for _ in range(npts - len(neighbor_tri))]
     assert len(neighbor_tri) == npts
     return neighbor_tri
 
@@ -1708,27 +1701,48 @@ def mesh_edges(tris):
     edges : scipy.sparse.spmatrix
         The adjacency matrix.
     """
-    tris = _hashable_ndarray(tris)
-    return _mesh_edges(tris=tris)
+    # copy because callers are free to modify the result in place
+    return _mesh_edges(_hashable_ndarray(tris)).copy()
 
 
-@lru_cache(maxsize=10)
-def _mesh_edges(tris=None):
-    if np.max(tris) > len(np.unique(tris)):
-        raise ValueError("Cannot compute adjacency on a selection of triangles.")
+# The topology of a triangulation (adjacency, vertex-triangle incidence) and
+# its edge lengths are cached because they are needed repeatedly for the same
+# surfaces (e.g., by spatial_src_adjacency, grow_labels, split_label,
+# add_source_space_distances and morph maps). Each entry holds O(n_tris)
+# arrays, which is about 12 MB for a full-resolution FreeSurfer hemisphere.
+# The cached arrays are read-only, public functions return copies.
 
-    npoints = np.max(tris) + 1
-    ones_ntris = np.ones(3 * len(tris))
 
+@lru_cache(maxsize=10)
+def _mesh_edges(tris):
+    tris = np.asarray(tris)  # not the hashable subclass
+    npoints = int(np.max(tris)) + 1
+    if npoints - 1 > np.count_nonzero(np.bincount(tris.ravel(), minlength=npoints)):
+        raise ValueError("Cannot compute adjacency on a selection of triangles.")
+    # both directions at once, duplicates are summed during conversion
     a, b, c = tris.T
-    x = np.concatenate((a, b, c))
-    y = np.concatenate((b, c, a))
-    edges = coo_array((ones_ntris, (x, y)), shape=(npoints, npoints))
-    edges = edges.tocsr()
-    edges = edges + edges.T
+    x = np.concatenate((a, b, c, b, c, a))
+    y = np.concatenate((b, c, a, a, b, c))
+    edges = coo_array((np.ones(len(x)), (x, y)), shape=(npoints, npoints)).tocsr()
+    for arr in (edges.data, edges.indices, edges.indptr):
+        arr.setflags(write=False)
     return edges
 
 
+@lru_cache(maxsize=10)
+def _vertex_triangles(tris):
+    """Get the triangles of each vertex in CSR format (indices, indptr)."""
+    tris = np.asarray(tris)  # not the hashable subclass
+    npoints = int(np.max(tris)) + 1 if tris.size else 0
+    # group the triangle indices by vertex, keeping them sorted
+    tri_idx = np.argsort(tris.ravel(), kind="stable") // 3
+    indptr = np.zeros(npoints + 1, np.int64)
+    np.cumsum(np.bincount(tris.ravel(), minlength=npoints), out=indptr[1:])
+    tri_idx.setflags(write=False)
+    indptr.setflags(write=False)
+    return tri_idx, indptr
+
+
 def mesh_dist(tris, vert):
     """Compute adjacency matrix weighted by distances.
 
@@ -1747,12 +1761,20 @@ def mesh_dist(tris, vert):
     dist_matrix : scipy.sparse.csr_array
         Sparse matrix with distances between adjacent vertices.
     """
-    edges = mesh_edges(tris).tocoo()
+    # copy because callers are free to modify the result in place
+    return _mesh_dist(_hashable_ndarray(tris), _hashable_ndarray(vert)).copy()
 
+
+@lru_cache(maxsize=10)
+def _mesh_dist(tris, vert):
+    edges = _mesh_edges(tris)
+    vert = np.asarray(vert)  # not the hashable subclass
     # Euclidean distances between neighboring vertices
-    dist = np.linalg.norm(vert[edges.row, :] - vert[edges.col, :], axis=1)
-    dist_matrix = csr_array((dist, (edges.row, edges.col)), shape=edges.shape)
-    return dist_matrix
+    rows = np.repeat(np.arange(edges.shape[0]), np.diff(edges.indptr))
+    dist = np.linalg.norm(vert[rows] - vert[edges.indices], axis=1)
+    dist.setflags(write=False)
+    # the sparsity structure is shared with the (read-only) adjacency
+    return csr_array((dist, edges.indices, edges.indptr), shape=edges.shape)
 
 
 @verbose
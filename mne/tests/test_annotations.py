@@ -946,6 +946,22 @@ def test_event_id_function_using_custom_function():
     assert event_id == expected_event_id
 
 
+def test_event_id_function_once_per_description():
+    """Test that descriptions are mapped once per unique description."""
+    calls = list()
+
+    def _event_id(desc):
+        calls.append(desc)
+        return None if desc == "drop" else len(desc)
+
+    description = ["a", "bb", "drop", "a", "drop", "bb", "a"]
+    raw = _create_annotation_based_on_descr(description)
+    events, event_id = events_from_annotations(raw, event_id=_event_id)
+    assert calls == ["a", "bb", "drop"]
+    assert event_id == dict(a=1, bb=2)
+    assert_array_equal(events[:, 2], [1, 2, 1, 2, 1])
+
+
 # Test for IO with .csv files
 
 
@@ -1241,6 +1257,56 @@ def test_sorting():
     assert_array_equal(annot.duration, duration)
 
 
+def test_overlap_ranges():
+    """Test the interval index used for annotation overlap queries."""
+    rng = np.random.default_rng(0)
+    onset = rng.uniform(0, 100, 500)
+    duration = rng.choice([0, 0.5, 2, 5, np.nan], 500)
+    annot = Annotations(onset, duration, "BAD")
+    tmin = rng.uniform(-5, 105, 200)
+    tmax = tmin + rng.uniform(0, 10, 200)
+
+    def _check(annot):
+        lo, hi = annot._overlap_ranges(tmin, tmax)
+        ends = annot.onset + np.nan_to_num(annot.duration)
+        for this_lo, this_hi, this_tmin, this_tmax in zip(lo, hi, tmin, tmax):
+            overlap = np.where((annot.onset <= this_tmax) & (ends >= this_tmin))[0]
+            assert this_lo <= this_hi
+            assert np.isin(overlap, np.arange(this_lo, this_hi)).all()
+        return hi - lo
+
+    n_check = _check(annot)
+    assert n_check.mean() < len(annot) / 5
+    # the annotations can be changed through their methods or in place
+    annot.append(50, 60, "BAD")
+    assert (_check(annot) >= n_check).all()
+    annot.onset += 3.0
+    _check(annot)
+    annot.onset[[0, -1]] = annot.onset[[-1, 0]]  # unsorted
+    _check(annot)
+    annot._sort()
+    annot.delete(np.arange(0, len(annot), 2))
+    _check(annot)
+    annot.set_durations(100)
+    _check(annot)
+    annot.crop(20, 40)
+    _check(annot)
+
+
+def test_reject_by_annotation_modified_in_place():
+    """Test rejecting epochs by annotations that were modified in place."""
+    info = create_info(1, 100.0, "eeg")
+    raw = RawArray(np.zeros((1, 10000)), info)
+    raw.set_annotations(Annotations([20.5], [1.0], ["BAD"]))
+    events = np.array([[ii * 100, 0, 1] for ii in range(1, 99)])
+    kwargs = dict(tmin=0, tmax=0.5, baseline=None, preload=True)
+    epochs = Epochs(raw, events, **kwargs)
+    assert [ii for ii, log in enumerate(epochs.drop_log) if log] == [19, 20]
+    raw.annotations.onset += 50.0
+    epochs = Epochs(raw, events, **kwargs)
+    assert [ii for ii, log in enumerate(epochs.drop_log) if log] == [69, 70]
+
+
 def test_date_none(tmp_path):
     """Test that DATE_NONE is used properly."""
     # Regression test for gh-5908
@@ -10,7 +10,7 @@ from shutil import copy
 
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose, assert_equal
+from numpy.testing import assert_allclose, assert_array_equal, assert_equal
 
 import mne
 from mne import (
@@ -30,18 +30,23 @@ from mne._fiff.constants import FIFF
 from mne.bem import (
     _assert_complete_surface,
     _assert_inside,
+    _bem_apply_solution,
     _bem_find_surface,
     _check_surface_size,
+    _correct_auto_elements,
+    _fwd_bem_lin_pot_coeff,
     _get_ico_map,
     _ico_downsample,
+    _lin_pot_coeff,
     _order_surfaces,
     distance_to_bem,
     fit_sphere_to_headshape,
     make_scalp_surfaces,
 )
 from mne.datasets import testing
+from mne.forward._compute_forward import _bem_specify_els
 from mne.io import read_info
-from mne.surface import _get_ico_surface, read_surface
+from mne.surface import _get_ico_surface, complete_surface_info, read_surface
 from mne.transforms import translation
 from mne.utils import _record_warnings, catch_logging, check_version
 
@@ -319,6 +324,99 @@ def test_bem_solution(tmp_path, cond, fname):
     _compare_bem_solutions(solution_read, solution)
 
 
+def _make_nested_surfs(grade=2):
+    """Make slightly deformed nested spherical BEM surfaces."""
+    surfs = list()
+    for rad, sigma, id_ in zip(
+        (0.09, 0.085, 0.08),
+        (0.3, 0.006, 0.3),
+        (
+            FIFF.FIFFV_BEM_SURF_ID_HEAD,
+            FIFF.FIFFV_BEM_SURF_ID_SKULL,
+            FIFF.FIFFV_BEM_SURF_ID_BRAIN,
+        ),
+    ):
+        surf = _get_ico_surface(grade)
+        surf.update(
+            rr=surf["rr"] * rad * (1 + 0.05 * np.sin(3 * surf["rr"][:, [0]])),
+            np=len(surf["rr"]),
+            ntri=len(surf["tris"]),
+            id=id_,
+            sigma=sigma,
+            coord_frame=FIFF.FIFFV_COORD_MRI,
+        )
+        surfs.append(complete_surface_info(surf, copy=False, verbose=False))
+    return surfs
+
+
+def test_lin_pot_coeff_batches(monkeypatch):
+    """Test that batched BEM coefficients match per-triangle ones."""
+    surfs = _make_nested_surfs()
+    coeff = _fwd_bem_lin_pot_coeff(surfs)
+    assert coeff.shape == (3 * 162,) * 2
+    # one triangle at a time, as done in fwd_bem_linear_collocation.c
+    want = np.zeros_like(coeff)
+    for si_1, surf_1 in enumerate(surfs):
+        for si_2, surf_2 in enumerate(surfs):
+            submat = want[162 * si_1 : 162 * (si_1 + 1), 162 * si_2 : 162 * (si_2 + 1)]
+            for tri, tri_rr, tri_nn, tri_area in zip(
+                surf_2["tris"],
+                surf_2["rr"][surf_2["tris"]],
+                surf_2["tri_nn"],
+                surf_2["tri_area"],
+            ):
+                coeffs = _lin_pot_coeff(surf_1["rr"], tri_rr, tri_nn, tri_area)
+                if si_1 == si_2:
+                    coeffs[tri] = 0.0
+                submat[:, tri] -= coeffs
+            if si_1 == si_2:
+                _correct_auto_elements(surf_1, submat)
+    assert_array_equal(coeff, want)
+    assert_array_equal(_fwd_bem_lin_pot_coeff(surfs, n_jobs=2), want)
+    # small blocks of field points and triangles give identical results
+    monkeypatch.setattr(mne.bem, "_BEM_ROW_BLOCK", 50)
+    monkeypatch.setattr(mne.bem, "_BEM_TRI_BATCH", 7)
+    assert_array_equal(_fwd_bem_lin_pot_coeff(surfs), want)
+
+
+@pytest.mark.parametrize("n_layers", (1, 3))
+def test_bem_solution_factorized(tmp_path, n_layers):
+    """Test storing and applying the LU factorization of a BEM solution."""
+    surfs = _make_nested_surfs()[-n_layers:]
+    with catch_logging() as log:
+        bem = make_bem_solution(surfs, verbose=True)
+    assert ("IP approach required" in log.getvalue()) == (n_layers == 3)
+    bem_lu = make_bem_solution(surfs, factorize=True)
+    assert "solution" not in bem_lu
+    assert bem_lu["nsol"] == bem["nsol"] == len(bem["solution"])
+    coeff = np.random.default_rng(0).standard_normal((10, bem["nsol"]))
+    want = coeff @ bem["solution"]
+    assert_allclose(_bem_apply_solution(bem_lu, coeff), want, rtol=1e-7, atol=1e-10)
+    assert_array_equal(_bem_apply_solution(bem, coeff), want)
+    # EEG electrodes with two integration points each
+    rng = np.random.default_rng(0)
+    els = [
+        dict(rmag=surfs[0]["rr"][idx] * 1.01, w=np.array([0.5, 0.5]))
+        for idx in rng.choice(surfs[0]["np"], (5, 2))
+    ]
+    mults = rng.random((1, bem["nsol"]))
+    for b in (bem, bem_lu):
+        b["head_mri_t"] = Transform("head", "mri")
+    assert_allclose(
+        _bem_specify_els(bem_lu, els, mults),
+        _bem_specify_els(bem, els, mults),
+        rtol=1e-7,
+        atol=1e-10,
+    )
+    # the inverse is computed for writing
+    fname = tmp_path / "temp-bem-sol.fif"
+    write_bem_solution(fname, bem_lu)
+    bem_read = read_bem_solution(fname)
+    assert_allclose(bem_read["solution"], bem["solution"], rtol=1e-5, atol=1e-6)
+    with pytest.raises(ValueError, match="only supported with solver='mne'"):
+        make_bem_solution(surfs, solver="openmeeg", factorize=True)
+
+
 def test_fit_sphere_to_headshape():
     """Test fitting a sphere to digitization points."""
     # Create points of various kinds
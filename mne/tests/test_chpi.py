@@ -13,9 +13,11 @@ from scipy.spatial.distance import cdist
 from mne import pick_info, pick_types
 from mne._fiff.constants import FIFF
 from mne.chpi import (
+    HeadTracker,
     _chpi_locs_to_times_dig,
     _compute_good_distances,
     _get_hpi_initial_fit,
+    _setup_chpi_dipole_fits,
     _setup_ext_proj,
     compute_chpi_amplitudes,
     compute_chpi_locs,
@@ -31,7 +33,7 @@ from mne.chpi import (
     write_head_pos,
 )
 from mne.datasets import testing
-from mne.forward._compute_forward import _MAG_FACTOR
+from mne.forward._compute_forward import _MAG_FACTOR, _magnetic_dipole_field_vec
 from mne.io import (
     RawArray,
     read_info,
@@ -41,7 +43,12 @@ from mne.io import (
     read_raw_kit,
 )
 from mne.simulation import add_chpi
-from mne.transforms import _angle_between_quats, rot_to_quat
+from mne.transforms import (
+    _angle_between_quats,
+    apply_trans,
+    invert_transform,
+    rot_to_quat,
+)
 from mne.utils import (
     _record_warnings,
     assert_meg_snr,
@@ -55,6 +62,7 @@ base_dir = Path(__file__).parents[1] / "io" / "tests" / "data"
 ctf_fname = base_dir / "test_ctf_raw.fif"
 hp_fif_fname = base_dir / "test_chpi_raw_sss.fif"
 raw_fname = base_dir / "test_raw.fif"
+ave_fname = base_dir / "test-ave.fif.gz"
 
 data_path = testing.data_path(download=False)
 sample_fname = data_path / "MEG" / "sample" / "sample_audvis_trunc_raw.fif"
@@ -446,6 +454,9 @@ def test_initial_fit_redo():
     proj, _, _ = _setup_ext_proj(raw.info, ext_order=1)
     chpi_amplitudes = dict(times=np.zeros(1), slopes=slopes, proj=proj)
     chpi_locs = compute_chpi_locs(raw.info, chpi_amplitudes)
+    chpi_locs_par = compute_chpi_locs(raw.info, chpi_amplitudes, n_jobs=2)
+    for key, val in chpi_locs.items():
+        assert_array_equal(val, chpi_locs_par[key], err_msg=key)
 
     # check GOF
     coil_gof = raw.info["hpi_results"][0]["goodness"]
@@ -477,6 +488,49 @@ def test_initial_fit_redo():
     assert_allclose(gof, 0.9999, atol=1e-4)
 
 
+def test_compute_chpi_locs_windows():
+    """Test fitting coils over several windows serially and in parallel."""
+    info = read_info(ave_fname)
+    proj, _, _ = _setup_ext_proj(info, ext_order=1)
+    info_fit, meg_coils, _, _ = _setup_chpi_dipole_fits(info, proj, "raise")
+    hpi_rrs = apply_trans(
+        invert_transform(info["dev_head_t"]), _get_hpi_initial_fit(info)
+    )
+    n_hpi = len(hpi_rrs)
+    # coils drifting by 2 mm per window, the fourth window repeats the third
+    # and is skipped, the sixth one is bad
+    drift = np.array([0.002, -0.001, 0.0015])
+    coil_idx = [0, 1, 2, 2, 3, 4]
+    rng = np.random.default_rng(0)
+    moments = rng.standard_normal((n_hpi, 3)) * 1e-8
+    slopes = np.array(
+        [
+            [
+                moment
+                @ _magnetic_dipole_field_vec(rr[np.newaxis] + ci * drift, meg_coils)
+                for rr, moment in zip(hpi_rrs, moments)
+            ]
+            for ci in coil_idx
+        ]
+    )
+    slopes[-1, 0, 0] = np.nan
+    assert slopes.shape == (6, n_hpi, len(info_fit["ch_names"]))
+    times = np.array([0.0, 1.0, 2.0, 2.1, 3.0, 4.0])
+    chpi_amplitudes = dict(times=times, slopes=slopes, proj=proj)
+    chpi_locs = compute_chpi_locs(info, chpi_amplitudes, t_step_max=0.5)
+    assert_array_equal(chpi_locs["times"], [0.0, 1.0, 2.0, 3.0])
+    assert chpi_locs["rrs"].shape == (4, n_hpi, 3)
+    assert chpi_locs["gofs"].shape == (4, n_hpi)
+    assert chpi_locs["moments"].shape == (4, n_hpi, 3)
+    want = hpi_rrs + np.array([0, 1, 2, 3])[:, np.newaxis, np.newaxis] * drift
+    assert_allclose(chpi_locs["rrs"], want, atol=1e-4)
+    assert_allclose(chpi_locs["gofs"], 1.0, atol=1e-3)
+    chpi_locs_par = compute_chpi_locs(info, chpi_amplitudes, t_step_max=0.5, n_jobs=2)
+    assert set(chpi_locs_par) == set(chpi_locs)
+    for key, val in chpi_locs.items():
+        assert_array_equal(val, chpi_locs_par[key], err_msg=key)
+
+
 @testing.requires_testing_data
 def test_calculate_head_pos_chpi_on_chpi5_in_one_second_steps():
     """Comparing estimated cHPI positions with MF results (one second)."""
@@ -496,6 +550,32 @@ def test_calculate_head_pos_chpi_on_chpi5_in_one_second_steps():
     )  # 3 mm/s
 
 
+@testing.requires_testing_data
+def test_head_tracker():
+    """Test incremental cHPI head position estimation on streamed buffers."""
+    mf_quats = read_head_pos(chpi5_pos_fname)
+    raw = read_raw_fif(chpi5_fif_fname, allow_maxshield="yes")
+    raw = _decimate_chpi(raw.crop(0.0, 10.0).load_data(), decim=8)
+    kwargs = dict(t_step_min=1.0, t_step_max=1.0, t_window=1.0)
+    tracker = HeadTracker(raw.info, first_samp=raw.first_samp, **kwargs)
+    assert_allclose(tracker.dev_head_t["trans"], raw.info["dev_head_t"]["trans"])
+    data = raw.get_data()
+    n_buffer = 100  # not a divisor of the window or step size
+    py_quats = list()
+    for start in range(0, data.shape[1], n_buffer):
+        quats = tracker.update(data[:, start : start + n_buffer])
+        assert quats.shape[1] == 10
+        py_quats.append(quats)
+        # only the samples for the next window are retained
+        assert tracker._buffer.shape[1] <= tracker._hpi["n_window"] + n_buffer
+    py_quats = np.concatenate(py_quats)
+    assert tracker.n_samples == len(raw.times)
+    _assert_quats(py_quats, mf_quats, dist_tol=0.002, angle_tol=1.2, vel_atol=3e-3)
+    assert_allclose(tracker.dev_head_t["trans"][:3, 3], py_quats[-1, 4:7], rtol=1e-7)
+    with pytest.raises(ValueError, match="data must have shape"):
+        tracker.update(data[1:])
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_calculate_head_pos_chpi_on_chpi5_in_shorter_steps():
@@ -1654,6 +1654,23 @@ def test_split_saving_and_loading_back(tmp_path, epochs_to_split, preload):
     assert_array_equal(epochs.events, epochs2.events)
 
 
+def test_split_saving_threads(tmp_path, epochs_factory, monkeypatch):
+    """Test writing the split files of epochs concurrently."""
+    epochs = epochs_factory(8, metadata=False, concat=False).load_data()
+    epochs_data = epochs.get_data()
+    fname = tmp_path / "test-epo.fif"
+    monkeypatch.setenv("MNE_IO_N_THREADS", "3")
+    fnames = epochs.save(fname, split_size="1.5MB")
+    assert len(fnames) == 6
+    _assert_splits(fname, 6, _get_split_size("1.5MB"))
+    # the data of the instance are left untouched
+    assert_array_equal(epochs.get_data(), epochs_data)
+    epochs2 = mne.read_epochs(fname)
+    assert_allclose(epochs2.get_data(), epochs_data)
+    assert_array_equal(epochs.events, epochs2.events)
+    assert epochs.drop_log == epochs2.drop_log
+
+
 @pytest.mark.parametrize(
     "split_naming, dst_fname, split_fname_fn, check_bids",
     [
@@ -3882,6 +3899,25 @@ def test_concatenate_epochs_large():
     assert np.max(many_epochs_cat.events[:, 0]) < max_expected_sample_index
 
 
+@pytest.mark.parametrize("proj", (True, "delayed"))
+def test_concatenate_epochs_not_preloaded(proj):
+    """Test concatenating epochs that are read into the output one by one."""
+    rng = np.random.default_rng(0)
+    info = create_info(4, 100.0, "eeg")
+    raws = [RawArray(rng.standard_normal((4, 2000)), info) for _ in range(3)]
+    epochs_list = list()
+    for raw in raws:
+        raw.set_eeg_reference(projection=True)
+        events = make_fixed_length_events(raw, duration=1.5)
+        epochs_list.append(Epochs(raw, events, tmin=-0.2, tmax=0.5, proj=proj))
+    epochs_list[1].drop([0, 3])
+    want = concatenate_epochs([epochs.copy().load_data() for epochs in epochs_list])
+    got = concatenate_epochs(epochs_list)
+    assert_array_equal(got.events, want.events)
+    assert_array_equal(got.get_data(), want.get_data())
+    assert_array_equal(got.apply_proj().get_data(), want.apply_proj().get_data())
+
+
 def test_add_channels():
     """Test epoch splitting / re-appending channel types."""
     raw, events, picks = _get_data()
@@ -4382,6 +4418,40 @@ def test_make_metadata_bounded_by_row_or_tmin_tmax_event_names(tmin, tmax):
         assert metadata.iloc[2][last_event_name] > 0
 
 
+def test_make_metadata_first_last():
+    """Test make_metadata() picking the first and last events of each window."""
+    pytest.importorskip("pandas")
+    event_id = {"cue": 1, "resp/left": 2, "resp/right": 3, "stim": 4}
+    events = np.array(
+        [
+            [0, 0, 1],
+            [2, 0, 4],
+            [3, 0, 3],
+            [3, 0, 2],  # same sample as the previous event
+            [5, 0, 4],
+            [8, 0, 2],
+            [10, 0, 1],
+            [14, 0, 3],
+        ]
+    )
+    metadata, events_new, _ = make_metadata(
+        events=events,
+        event_id=event_id,
+        tmin=None,
+        tmax=None,
+        sfreq=10.0,
+        row_events="cue",
+        keep_first="resp",
+        keep_last="stim",
+    )
+    assert_array_equal(events_new, events[[0, 6]])
+    assert_allclose(metadata["stim"], [0.5, np.nan])
+    assert_allclose(metadata["resp/left"], [0.3, np.nan])
+    assert_allclose(metadata["resp/right"], [0.3, 0.4])
+    assert_allclose(metadata["resp"], [0.3, 0.4])
+    assert list(metadata["first_resp"]) == ["right", "right"]
+
+
 def test_events_list():
     """Test that events can be a list."""
     events = [[100, 0, 1], [200, 0, 1], [300, 0, 1]]
@@ -14,6 +14,7 @@ from numpy.testing import (
     assert_equal,
 )
 
+import mne
 from mne import (
     Annotations,
     Epochs,
@@ -414,6 +415,32 @@ def test_find_events():
         find_events(raw)
 
 
+@pytest.mark.parametrize("block_size", (3, 10, 1000))
+def test_find_events_blocks(block_size, monkeypatch):
+    """Test finding events across the blocks the stim channels are read in."""
+    monkeypatch.setattr(mne.event, "_STIM_BLOCK_SIZE", block_size)
+    data = np.zeros((2, 40))
+    data[0, 0:4] = 5  # initial value
+    data[0, 9:10] = 1  # a single sample on a block boundary
+    data[0, 10:13] = 2
+    data[0, 13:20] = -32765  # negative value from a Neuromag acquisition bug
+    data[1, 30:32] = 4
+    raw = RawArray(data, create_info(["STI1", "STI2"], 1000.0, "stim"), first_samp=5)
+    with pytest.warns(RuntimeWarning, match="negative values"):
+        steps = find_stim_steps(raw, stim_channel="STI1")
+    assert_array_equal(
+        steps, [[9, 5, 0], [14, 0, 1], [15, 1, 2], [18, 2, 32765], [25, 32765, 0]]
+    )
+    kwargs = dict(stim_channel=["STI1", "STI2"], shortest_event=1)
+    with pytest.warns(RuntimeWarning, match="negative values"):
+        events = find_events(raw, consecutive=True, initial_event=True, **kwargs)
+    assert_array_equal(
+        events, [[5, 0, 5], [14, 0, 1], [15, 1, 2], [18, 2, 32765], [35, 0, 4]]
+    )
+    events = find_events(raw, uint_cast=True, min_duration=0.002, **kwargs)
+    assert_array_equal(events, [[15, 0, 2], [18, 2, 32771], [35, 0, 4]])
+
+
 def test_pick_events():
     """Test pick events in a events ndarray."""
     events = np.array([[1, 0, 1], [2, 1, 0], [3, 0, 4], [4, 4, 2], [5, 2, 0]])
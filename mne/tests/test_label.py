@@ -465,6 +465,31 @@ def test_labels_to_stc():
     stc = read_source_estimate(stc_fname, "sample")
 
 
+def test_labels_to_stc_src_overlap():
+    """Test labels_to_stc with a surface source space and overlapping labels."""
+    src = SourceSpaces(
+        [
+            dict(type="surf", vertno=np.arange(0, 20, 2), np=20, coord_frame=5),
+            dict(type="surf", vertno=np.arange(1, 20, 2), np=20, coord_frame=5),
+        ]
+    )
+    labels = [
+        Label(np.arange(10), hemi="lh", subject="sample"),
+        Label(np.arange(4), hemi="lh", subject="sample"),
+        Label(np.arange(4), hemi="lh", subject="sample"),
+        Label(np.arange(5, 12), hemi="rh", subject="sample"),
+        Label(np.array([21, 22]), hemi="rh", subject="sample"),  # empty in src
+    ]
+    values = np.arange(1.0, len(labels) + 1)
+    with pytest.warns(RuntimeWarning, match="does not contain any vertices"):
+        stc = labels_to_stc(labels, values, src=src)
+    # the smallest label containing a vertex wins, the first one on ties
+    assert_array_equal(stc.lh_data[:, 0], [2, 2, 1, 1, 1, 1, 1, 1, 1, 1])
+    assert_array_equal(stc.rh_data[:, 0], [1, 1, 4, 4, 4, 4, 1, 1, 1, 1])
+    with pytest.raises(ValueError, match=r"values\.shape"):
+        labels_to_stc(labels[:-1], values[2:], src=src)
+
+
 @testing.requires_testing_data
 def test_read_labels_from_annot(tmp_path):
     """Test reading labels from FreeSurfer parcellation."""
@@ -2,6 +2,7 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import os
 from inspect import signature
 
 import numpy as np
@@ -36,6 +37,7 @@ from mne.datasets import testing
 from mne.fixes import _get_img_fdata
 from mne.minimum_norm import apply_inverse, make_inverse_operator, read_inverse_operator
 from mne.source_space._source_space import _add_interpolator, _grid_interp
+from mne.surface import _get_ico_surface, write_surface
 from mne.transforms import quat_to_rot
 from mne.utils import _record_warnings, catch_logging
 
@@ -281,6 +283,49 @@ def test_surface_source_morph_shortcut():
     assert abs_sum < 1e-4
 
 
+def test_surface_source_morph_cache(tmp_path):
+    """Test caching surface morph matrices on disk."""
+    this_subjects_dir = tmp_path / "subjects"
+    for subject, grade in (("from", 3), ("to", 4)):
+        surf = _get_ico_surface(grade)
+        (this_subjects_dir / subject / "surf").mkdir(parents=True)
+        for hemi in ("lh", "rh"):
+            fname = this_subjects_dir / subject / "surf" / f"{hemi}.sphere.reg"
+            write_surface(fname, surf["rr"] * 100, surf["tris"])
+    vertices = [np.arange(0, 642, 2), np.arange(1, 642, 3)]
+    stc = SourceEstimate(
+        np.ones((sum(len(v) for v in vertices), 1)), vertices, 0, 1, subject="from"
+    )
+    kwargs = dict(
+        subject_from="from",
+        subject_to="to",
+        subjects_dir=this_subjects_dir,
+        spacing=[np.arange(2562), np.arange(0, 2562, 2)],
+    )
+    # write the morph maps first, so that all morphs below read them
+    mne.read_morph_map("from", "to", this_subjects_dir)
+    morph = compute_source_morph(stc, **kwargs)
+    cache_dir = tmp_path / "cache"
+    with catch_logging() as log:
+        compute_source_morph(stc, cache_dir=cache_dir, verbose=True, **kwargs)
+    assert "Cached morph matrix" in log.getvalue()
+    with catch_logging() as log:
+        morph_cached = compute_source_morph(
+            stc, cache_dir=cache_dir, verbose=True, **kwargs
+        )
+    assert "Using cached morph matrix" in log.getvalue()
+    assert isinstance(morph_cached.morph_mat, csr_array)
+    assert_array_equal(morph_cached.morph_mat.toarray(), morph.morph_mat.toarray())
+    assert len(list(cache_dir.glob("from-to-*-morph.npz"))) == 1
+    # other smoothing, or modified surfaces, must not use the cached matrix
+    compute_source_morph(stc, smooth=2, cache_dir=cache_dir, **kwargs)
+    assert len(list(cache_dir.glob("from-to-*-morph.npz"))) == 2
+    fname = this_subjects_dir / "to" / "surf" / "lh.sphere.reg"
+    os.utime(fname, ns=(fname.stat().st_atime_ns, fname.stat().st_mtime_ns + 10**9))
+    compute_source_morph(stc, cache_dir=cache_dir, **kwargs)
+    assert len(list(cache_dir.glob("from-to-*-morph.npz"))) == 3
+
+
 def assert_power_preserved(orig, new, limits=(1.0, 1.05)):
     """Assert that the power is preserved during a round-trip morph."""
     __tracebackhide__ = True
@@ -664,6 +709,11 @@ def test_volume_source_morph_round_trip(
     stc_from_unit_rt = morph_to_from.apply(morph_from_to.apply(stc_from_unit))
     assert_power_preserved(stc_from_unit, stc_from_unit_rt, limits=limits)
     if morph_mat:
+        stc_from_unit_rt_par = morph_to_from.apply(
+            morph_from_to.apply(stc_from_unit, n_jobs=2), n_jobs=2
+        )
+        assert_allclose(stc_from_unit_rt.data, stc_from_unit_rt_par.data)
+        del stc_from_unit_rt_par
         fname = tmp_path / "temp-morph.h5"
         morph_to_from.save(fname)
         morph_to_from = read_source_morph(fname)
@@ -28,10 +28,13 @@ from mne.surface import (
     _project_onto_surface,
     _read_patch,
     _tessellate_sphere,
+    _triangle_neighbors,
     _voxel_neighbors,
     fast_cross_3d,
     get_head_surf,
     get_meg_helmet_surf,
+    mesh_dist,
+    mesh_edges,
     read_curvature,
 )
 from mne.transforms import _get_trans
@@ -155,6 +158,44 @@ def test_io_surface(tmp_path):
     _read_patch(fname_patch)
 
 
+def test_mesh_topology():
+    """Test the shared adjacency computations of a triangulation."""
+    surf = _get_ico_surface(3)
+    tris, rr = surf["tris"], surf["rr"]
+    edges = mesh_edges(tris)
+    assert edges.format == "csr"
+    assert_array_equal(edges.toarray(), edges.T.toarray())
+    # each edge is shared by two triangles of the closed surface
+    assert_array_equal(edges.data, 2)
+    assert edges.nnz == 3 * len(tris)
+    # modifying the output must not affect subsequent calls
+    edges.data[:] = 1
+    assert_array_equal(mesh_edges(tris).data, 2)
+    dist = mesh_dist(tris, rr)
+    assert_array_equal(dist.indices, edges.indices)
+    assert_array_equal(dist.indptr, edges.indptr)
+    row, col = dist.nonzero()
+    assert_allclose(dist[row, col], np.linalg.norm(rr[row] - rr[col], axis=1))
+    # a different geometry with the same triangulation
+    dist_2 = mesh_dist(tris, 2 * rr)
+    assert_allclose(dist_2.data, 2 * dist.data)
+    neighbor_tri = _triangle_neighbors(tris, len(rr) + 1)
+    assert len(neighbor_tri) == len(rr) + 1
+    assert len(neighbor_tri[-1]) == 0
+    for ii in (0, len(rr) // 2, len(rr) - 1):
+        assert_array_equal(neighbor_tri[ii], np.where((tris == ii).any(axis=1))[0])
+    # the neighbors are views into the cache, so they must not be writable
+    with pytest.raises(ValueError, match="read-only"):
+        neighbor_tri[0][0] = 1
+    dist.indices[:] = 0
+    dist.data[:] = 0
+    dist_3 = mesh_dist(tris, rr)
+    assert_array_equal(dist_3.indices, edges.indices)
+    assert_array_equal(dist_3.data, dist_2.data / 2)
+    with pytest.raises(ValueError, match="selection of triangles"):
+        mesh_edges(tris[:10])
+
+
 @testing.requires_testing_data
 def test_read_curv():
     """Test reading curvature data."""
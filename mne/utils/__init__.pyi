@@ -79,6 +79,7 @@ __all__ = [
     "_get_numpy_libs",
     "_get_root_dir",
     "_get_stim_channel",
+    "_has_imag",
     "_hashable_ndarray",
     "_import_h5io_funcs",
     "_import_h5py",
@@ -357,6 +358,7 @@ from .numerics import (
     _freq_mask,
     _gen_events,
     _get_inst_data,
+    _has_imag,
     _hashable_ndarray,
     _julian_to_date,
     _mask_to_onsets_offsets,
@@ -175,6 +175,10 @@ _known_config_types = {
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
+    "MNE_IO_N_THREADS": (
+        "int, number of threads used to concurrently read and write the files of "
+        "split or concatenated data, e.g., raw and epochs (default 1)"
+    ),
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function "
         "decorated with @verbose. See "
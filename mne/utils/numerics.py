@@ -199,6 +199,12 @@ def _gen_events(n_epochs):
     return events
 
 
+def _has_imag(data):
+    """Check if array-like data have non-zero imaginary parts."""
+    # real-valued data need no (memory-hungry) element-wise check
+    return bool(np.iscomplexobj(data) and np.any(np.iscomplex(data)))
+
+
 def _reject_data_segments(data, reject, flat, decim, info, tstep):
     """Reject data segments using peak-to-peak amplitude."""
     from .._fiff.pick import channel_indices_by_type
@@ -941,6 +947,41 @@ class _PCA:
 
         return U, S, V
 
+    def _fit_cov(self, mean, cov, n_samples):
+        """Fit from the mean and (unbiased) covariance of the samples."""
+        n_features = len(mean)
+        n_components = self.n_components
+        if n_components is None:
+            n_components = min(n_samples, n_features)
+        _validate_type(n_components, "int-like", "n_components")
+        self.mean_ = mean
+        eigval, eigvec = np.linalg.eigh(cov)
+        order = np.argsort(eigval)[::-1]
+        explained_variance_ = np.maximum(eigval[order], 0)
+        # flip eigenvectors' sign to enforce deterministic output
+        _, components_ = svd_flip(
+            np.zeros((0, n_features)), eigvec[:, order].T, u_based_decision=False
+        )
+        explained_variance_ratio_ = explained_variance_ / explained_variance_.sum()
+        if n_components < min(n_features, n_samples):
+            self.noise_variance_ = explained_variance_[n_components:].mean()
+        else:
+            self.noise_variance_ = 0.0
+        self.n_samples_, self.n_features_ = n_samples, n_features
+        self.components_ = components_[:n_components]
+        self.n_components_ = n_components
+        self.explained_variance_ = explained_variance_[:n_components]
+        self.explained_variance_ratio_ = explained_variance_ratio_[:n_components]
+        self.singular_values_ = np.sqrt(self.explained_variance_ * (n_samples - 1))
+
+    def transform(self, X):
+        X = X - self.mean_
+        X = X @ self.components_.T
+        if self.whiten:
+            scale = np.sqrt(self.explained_variance_)
+            X /= np.where(scale > 0, scale, 1.0)
+        return X
+
 
 def _mask_to_onsets_offsets(mask):
     """Group boolean mask into contiguous onset:offset pairs."""